@@ -0,0 +1,239 @@
+"""
+Benchmarks of the finders and the dynamic table kernels, reporting time and peak memory as json, of the import
+time of the modules, and of the finders restricted to their top-m centers against all centers
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import random
+import platform
+import resource
+import subprocess
+import tracemalloc
+import numpy as np
+from itertools import product
+from helpers import set_backend, backend, dynamic_table_2D, dynamic_table_3D, dynamic_table_4D, dynamic_table_5D, \
+    dynamic_table_5D_2l_star
+from optimized_l_stars import find_optimal_l_star
+from paired_l_stars import find_optimal_star
+from randomized_l_stars import find_optimal_randomized_l_star
+from experiment_seqs.simulate_seqs import DNA_BYTES, simulate_family as simulate_codes
+
+FINDERS = {
+    "optimized": lambda seqs, k, l, epsilon, centers="all": find_optimal_l_star(seqs, k, l, centers=centers),
+    "paired": lambda seqs, k, l, epsilon, centers="all": find_optimal_star(seqs, k, l, centers=centers),
+    "randomized": lambda seqs, k, l, epsilon, centers="all": find_optimal_randomized_l_star(seqs, k, l, epsilon,
+                                                                                           centers=centers),
+}
+
+KERNELS = {
+    "dynamic_table_2D": (dynamic_table_2D, 2),
+    "dynamic_table_3D": (dynamic_table_3D, 3),
+    "dynamic_table_4D": (dynamic_table_4D, 4),
+    "dynamic_table_5D": (dynamic_table_5D, 5),
+    "dynamic_table_5D_2l_star": (dynamic_table_5D_2l_star, 5),
+}
+
+# modules whose import time is benchmarked, and the command lines whose startup time is
+IMPORTS = ("helpers", "fasta", "optimized_l_stars", "paired_l_stars", "randomized_l_stars", "cli")
+COMMANDS = {"cli --help": ["cli.py", "align", "--help"]}
+
+
+def simulate_family(k, length, divergence, seed=0):
+    """simulate k related sequences evolved from a root of the given length along a random tree, as strings"""
+    return [DNA_BYTES[codes].tobytes().decode() for codes in simulate_codes(k, length, divergence, seed)]
+
+
+def valid_case(algorithm, k, l):
+    """check that the l-stars of k sequences are well-formed for the algorithm"""
+    if algorithm in KERNELS:
+        return True
+    if l < 2 or k < l or (k - 1) % (l - 1):
+        return False
+    return algorithm != "paired" or l <= 3
+
+
+def benchmark_grid(algorithms=None, ks=(5, 7, 9), ls=(2, 3, 4), lengths=None, divergences=(0.1, 0.3), epsilon=0.1):
+    """
+    return the benchmark cases as a list of dicts, all combinations of the parameters that are valid for each
+    algorithm. kernels take as many sequences as their dimension, and without lengths given each algorithm
+    gets the lengths it runs at in reasonable time
+    """
+    cases = []
+    for algorithm in algorithms or list(FINDERS) + list(KERNELS):
+        if algorithm in KERNELS:
+            d = KERNELS[algorithm][1]
+            for length, divergence in product(lengths or ((10, 20, 40) if d <= 3 else (10, 20)), divergences):
+                cases.append(dict(algorithm=algorithm, k=d, l=None, length=length, divergence=divergence,
+                                  epsilon=None))
+            continue
+        for k, l, divergence in product(ks, ls, divergences):
+            if not valid_case(algorithm, k, l):
+                continue
+            for length in lengths or ((10,) if algorithm == "paired" and l == 3 else (10, 20)):
+                cases.append(dict(algorithm=algorithm, k=k, l=l, length=length, divergence=divergence,
+                                  epsilon=epsilon if algorithm == "randomized" else None))
+    return cases
+
+
+def case_function(case, seed=0, centers="all"):
+    """return a function without arguments running the case, a finder with the centers of helpers.select_centers"""
+    seqs = simulate_family(case["k"], case["length"], case["divergence"], seed)
+    if case["algorithm"] in KERNELS:
+        kernel, _ = KERNELS[case["algorithm"]]
+        return lambda: kernel(*seqs)
+    finder = FINDERS[case["algorithm"]]
+    return lambda: finder(seqs, case["k"], case["l"], case["epsilon"], centers)
+
+
+def peak_rss():
+    """return the peak resident set size of this process in bytes, over its whole life so far"""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def measure(func, warmup=1, repeats=5):
+    """
+    time func over repeats runs after warmup runs, then run it once more under tracemalloc for its peak python
+    heap allocation, which is not timed since tracing slows it down
+    """
+    for _ in range(warmup):
+        func()
+    times = []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start_time)
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    q1, median, q3 = np.percentile(times, [25, 50, 75])
+    return {"times": times, "median": median, "iqr": q3 - q1, "min": min(times),
+            "peak_tracemalloc_bytes": peak}
+
+
+def import_times(modules=IMPORTS, commands=COMMANDS, repeats=5):
+    """
+    return the median and minimum time of importing each module in a fresh interpreter, and of running each
+    command line to its end, including the interpreter startup. bytecode is compiled by a first untimed run
+    """
+    env = {name: value for name, value in os.environ.items() if name != "PYTHONDONTWRITEBYTECODE"}
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    runs = {module: ["-c", f"import time; t = time.perf_counter(); import {module}; "
+                           f"print(time.perf_counter() - t)"] for module in modules}
+    runs.update(commands)
+    results = {}
+    for name, args in runs.items():
+        times = []
+        for i in range(repeats + 1):
+            start_time = time.perf_counter()
+            out = subprocess.run([sys.executable, *args], env=env, cwd=cwd, check=True, capture_output=True,
+                                 text=True).stdout
+            if i:
+                times.append(float(out) if name in modules else time.perf_counter() - start_time)
+        results[name] = {"median": float(np.median(times)), "min": min(times)}
+    return results
+
+
+def center_selection(cases, ms=(1, 2, 3), seed=0):
+    """
+    run every finder case with all centers and with its top-m centers for every m < k, and return rows of the time
+    and score of each run against the run with all centers. the randomized finder is seeded the same for every run
+    """
+    rows = []
+    for case in cases:
+        if case["algorithm"] in KERNELS:
+            continue
+        runs = {}
+        for centers in ["all"] + [f"top-{m}" for m in ms if m < case["k"]]:
+            func = case_function(case, seed, centers)
+            random.seed(seed)
+            func()
+            random.seed(seed)
+            start_time = time.perf_counter()
+            _, score = func()
+            runs[centers] = (time.perf_counter() - start_time, float(score))
+        all_time, all_score = runs.pop("all")
+        for centers, (t, score) in runs.items():
+            rows.append(dict(case, seed=seed, centers=centers, time=t, all_time=all_time, speedup=all_time / t,
+                             score=score, all_score=all_score, score_delta=score - all_score))
+    return rows
+
+
+def environment():
+    """describe the environment the benchmarks run in"""
+    if backend["name"] == "auto":
+        set_backend("auto")
+    return {"python": platform.python_version(), "numpy": np.__version__, "backend": backend["name"],
+            "machine": platform.machine(), "system": platform.system(), "processor": platform.processor(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+
+def run_benchmarks(cases, warmup=1, repeats=5, seed=0, output="experiment_results/benchmarks.json", imports=IMPORTS,
+                   centers=None):
+    """
+    run all cases, the import benchmark of imports and, given a list of m, the center selection of center_selection,
+    print a line per case, and write the results as json
+    """
+    results = []
+    for case in cases:
+        result = dict(case, seed=seed, **measure(case_function(case, seed), warmup, repeats))
+        print(f"{case['algorithm']} k={case['k']} l={case['l']} length={case['length']} "
+              f"divergence={case['divergence']} median: {result['median']:.4f}s, iqr: {result['iqr']:.4f}s, "
+              f"peak: {result['peak_tracemalloc_bytes'] / 2 ** 20:.1f}MiB")
+        results.append(result)
+    # the peak resident set size is that of the process, i.e. of the largest case so far, so it is reported once
+    report = {"environment": environment(), "warmup": warmup, "repeats": repeats, "results": results,
+              "peak_rss_bytes": peak_rss()}
+    print(f"peak resident set size of the run: {report['peak_rss_bytes'] / 2 ** 20:.1f}MiB")
+    if imports:
+        report["imports"] = import_times(imports, repeats=repeats)
+        for name, result in report["imports"].items():
+            print(f"import {name} median: {result['median'] * 1000:.1f}ms, min: {result['min'] * 1000:.1f}ms")
+    if centers:
+        report["centers"] = center_selection(cases, centers, seed)
+        for row in report["centers"]:
+            print(f"{row['algorithm']} k={row['k']} l={row['l']} length={row['length']} "
+                  f"divergence={row['divergence']} {row['centers']} centers: {row['speedup']:.2f}x speedup, "
+                  f"score {row['score']:g} ({row['score_delta']:+g} against all centers)")
+    if output:
+        with open(output, "w") as f:
+            json.dump(report, f, indent=1)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--algorithm", nargs="+", choices=list(FINDERS) + list(KERNELS),
+                        help="benchmark only these algorithms or kernels")
+    parser.add_argument("--k", nargs="+", type=int, default=(5, 7, 9), help="numbers of sequences of the finders")
+    parser.add_argument("--l", nargs="+", type=int, default=(2, 3, 4), help="clique sizes of the finders")
+    parser.add_argument("--length", nargs="+", type=int, help="sequence lengths")
+    parser.add_argument("--divergence", nargs="+", type=float, default=(0.1, 0.3),
+                        help="divergences from the template")
+    parser.add_argument("--epsilon", type=float, default=0.1, help="epsilon of the randomized algorithm")
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--backend", choices=("auto", "python", "numba"), default=None)
+    parser.add_argument("--imports", nargs="*", default=IMPORTS,
+                        help="modules whose import time is benchmarked, none to skip the import benchmark")
+    parser.add_argument("--centers", nargs="+", type=int, metavar="M",
+                        help="also compare the finders with their top-m centers against all centers for these m")
+    parser.add_argument("--output", default="experiment_results/benchmarks.json")
+    args = parser.parse_args(argv)
+    if args.backend:
+        set_backend(args.backend)
+
+    cases = benchmark_grid(args.algorithm, args.k, args.l, args.length, args.divergence, args.epsilon)
+    run_benchmarks(cases, args.warmup, args.repeats, args.seed, args.output, args.imports, args.centers)
+
+
+if __name__ == "__main__":
+    main()
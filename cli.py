@@ -0,0 +1,307 @@
+"""
+Batch command-line aligner: aligns many families of sequences with one of the l-star algorithms on a pool of
+worker processes that stay warm between families, so kernels are compiled and scoring tables built only once
+per worker, and streams every alignment and its timings to an output directory as soon as it is done
+
+    python cli.py align families.fa --algorithm optimized -l 3 --output aligned
+
+numpy, numba and the algorithm modules are imported only once there is something to align, so that the command
+line starts without them
+"""
+
+import os
+import csv
+import sys
+import json
+import time
+import queue
+import random
+import argparse
+from multiprocessing import Pool
+
+ALGORITHMS = ("optimized", "paired", "randomized")
+
+TIMING_COLUMNS = ["family", "k", "l", "algorithm", "epsilon", "score", "search_time", "align_time", "score_time",
+                  "total_time", "error"]
+
+
+def family_name(filename):
+    """name of the family of a single-family fasta file, its file name without the extensions"""
+    name = os.path.basename(filename)
+    for ext in (".gz", ".fasta", ".fa", ".fna", ".faa"):
+        if name.endswith(ext):
+            name = name[:-len(ext)]
+    return name
+
+
+def iter_families(filenames, split="auto"):
+    """
+    yield (family, names, seqs) for every family in the fasta files, reading them record by record.
+    with split "file" every file is one family, with "prefix" the records are grouped into families by the part of
+    their names before FAMILY_SEPARATOR, and the records of a family must be contiguous. "auto" splits a file by
+    prefix if its first record name has the separator
+    """
+    from fasta import iter_fasta
+    from experiment_seqs.simulate_seqs import FAMILY_SEPARATOR
+    for filename in filenames:
+        family, names, seqs, seen = None, [], [], set()
+        by_prefix = None if split == "auto" else split == "prefix"
+        for name, seq in iter_fasta(filename):
+            if by_prefix is None:
+                by_prefix = FAMILY_SEPARATOR in name
+            current = name.split(FAMILY_SEPARATOR, 1)[0] if by_prefix else family_name(filename)
+            if current != family:
+                if names:
+                    yield family, names, seqs
+                if current in seen:
+                    raise ValueError(f"the records of family {current} in {filename} are not contiguous")
+                seen.add(current)
+                family, names, seqs = current, [], []
+            names.append(name)
+            seqs.append(seq)
+        if names:
+            yield family, names, seqs
+
+
+def check_residues(names, seqs, scheme):
+    """raise ValueError if a sequence has residues outside the alphabet of the scoring scheme"""
+    for name, seq in zip(names, seqs):
+        unknown = sorted(set(seq) - set(scheme.mapping))
+        if unknown:
+            raise ValueError(f"sequence {name} has residues {''.join(unknown)!r} outside the alphabet "
+                             f"{''.join(sorted(scheme.mapping))!r}")
+
+
+def check_parameters(algorithm, k, l):
+    """raise ValueError if the l-stars of k sequences are not well-formed for the algorithm"""
+    if l < 2 or k < l:
+        raise ValueError(f"l={l} needs 2 <= l <= k, the family has k={k} sequences")
+    if (k - 1) % (l - 1):
+        raise ValueError(f"k-1={k - 1} is not a multiple of l-1={l - 1}")
+    if algorithm == "paired" and l > 3:
+        raise ValueError("paired l-stars are only implemented for l <= 3")
+
+
+def align_family(family, names, seqs, algorithm, l, epsilon=0.1, seed=0, refine=None, centers="all", collapse=False):
+    """
+    align a family with the algorithm, return its alignment and a row of TIMING_COLUMNS. a family that cannot be
+    aligned, e.g. for too few sequences, residues outside the alphabet, a table over the memory budget or a failed
+    traceback, has no alignment and the error in its row.
+    with refine, an l-star found is improved by local search for at most refine seconds, part of the search time.
+    centers selects the centers tried, see helpers.select_centers. with collapse, identical sequences are searched
+    and aligned as one weighted vertex and get the same row, see duplicates.collapse_duplicates
+    """
+    import planner
+    from helpers import align_l_star, align_2l_star, sp_score, default_scheme
+    from optimized_l_stars import find_optimal_l_star
+    from paired_l_stars import find_optimal_star
+    from randomized_l_stars import find_optimal_randomized_l_star
+    from local_search import refine_l_star
+    from duplicates import collapse_duplicates, expand_alignment
+    k = len(seqs)
+    row = dict.fromkeys(TIMING_COLUMNS)
+    row.update(family=family, k=k, l=l, algorithm=algorithm, epsilon=epsilon if algorithm == "randomized" else None)
+    start_time = time.perf_counter()
+    try:
+        check_parameters(algorithm, k, l)
+        check_residues(names, seqs, default_scheme)
+        planner.plan_finder([len(s) for s in seqs], k, l, algorithm, 1)
+        alignments, weights, n = {}, None, k
+        if collapse:
+            if algorithm == "paired":
+                raise ValueError("duplicates are only collapsed for optimized and randomized l-stars")
+            if l != 2:
+                raise ValueError("duplicates are only collapsed for l = 2")
+            seqs, weights, index = collapse_duplicates(seqs)
+            n = len(seqs)
+        if algorithm == "optimized":
+            star, _ = find_optimal_l_star(seqs, n, l, centers=centers, weights=weights)
+        elif algorithm == "paired":
+            star, _ = find_optimal_star(seqs, k, l, alignments=alignments, centers=centers)
+        else:
+            # seeded by family, so that a family gets the same alignment however the batch is scheduled
+            random.seed(f"{seed}/{family}")
+            star, _ = find_optimal_randomized_l_star(seqs, n, l, epsilon, centers=centers, weights=weights)
+        if refine is not None and len(star[0]) == l:
+            star, _ = refine_l_star(seqs, star, n, l, refine, weights=weights)
+        search_time = time.perf_counter()
+        if len(star[0]) == l:
+            alignment = align_l_star(seqs, star, n, l)
+        else:
+            alignment = align_2l_star(seqs, star, k, l, alignments)
+        if collapse:
+            alignment = expand_alignment(alignment, index)
+        align_time = time.perf_counter()
+        row["score"] = float(sp_score(alignment))
+        end_time = time.perf_counter()
+    except Exception as e:
+        # one family failing, e.g. on a traceback, must not stop the batch
+        row.update(error=str(e) if isinstance(e, (ValueError, MemoryError)) else f"{type(e).__name__}: {e}",
+                   total_time=time.perf_counter() - start_time)
+        return None, row
+    row.update(search_time=search_time - start_time, align_time=align_time - search_time,
+               score_time=end_time - align_time, total_time=end_time - start_time)
+    return alignment, row
+
+
+def centers_option(value):
+    """parse the --centers option, all or top-m with m >= 1"""
+    if value != "all" and not (value.startswith("top-") and value[4:].isdigit() and int(value[4:]) >= 1):
+        raise argparse.ArgumentTypeError(f"expected all or top-m with m >= 1, not {value!r}")
+    return value
+
+
+def _init_worker(backend_name, budget):
+    import planner
+    from helpers import set_backend
+    # the workers align families at the same time, each gets its share of the memory budget
+    set_backend(backend_name)
+    planner.set_budget(budget)
+
+
+def _align_task(task):
+    family, names = task[:2]
+    return family, names, *align_family(*task)
+
+
+def safe_filename(family):
+    """a file name for a family, without path separators and other characters that are not portable"""
+    name = "".join(c if c.isalnum() or c in "-_." else "_" for c in family).lstrip(".")
+    return name or "family"
+
+
+class ResultWriter:
+    """writes the alignment of every family to <output>/<family>.fa and appends its timings to <output>/timings"""
+
+    def __init__(self, output, timings="csv"):
+        os.makedirs(output, exist_ok=True)
+        self.output, self.timings = output, timings
+        filename = os.path.join(output, f"timings.{timings}")
+        new = not os.path.exists(filename) or os.path.getsize(filename) == 0
+        self.file = open(filename, "a", newline="")
+        if timings == "csv":
+            self.writer = csv.DictWriter(self.file, fieldnames=TIMING_COLUMNS)
+            if new:
+                self.writer.writeheader()
+
+    def write(self, family, names, alignment, row):
+        if alignment is not None:
+            filename = os.path.join(self.output, safe_filename(family) + ".fa")
+            with open(filename + ".tmp", "w") as f:
+                for name, aligned in zip(names, alignment):
+                    f.write(f">{name}\n{aligned}\n")
+            os.replace(filename + ".tmp", filename)
+        if self.timings == "csv":
+            self.writer.writerow(row)
+        else:
+            self.file.write(json.dumps(row) + "\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def align_batch(filenames, algorithm, l, epsilon=0.1, seed=0, output="aligned", processes=None, split="auto",
+                timings="csv", budget=None, refine=None, centers="all", collapse=False):
+    """
+    align every family of the fasta files on a pool of processes workers, writing the results as they finish.
+    at most two families per worker are read ahead. return the number of families and of failed families
+    """
+    import planner
+    import optimized_l_stars, paired_l_stars, randomized_l_stars, local_search, duplicates
+    from helpers import set_backend, backend, compiled, _dynamic_table_2D, _dynamic_table_3D, _dynamic_table_4D
+    from shared import cleanup_stale
+    processes = processes or os.cpu_count() or 1
+    # shared memory left by earlier runs that were killed together with their resource tracker
+    cleanup_stale()
+    budget = planner.budget() if budget is None else planner.parse_size(budget)
+    if backend["name"] == "auto":
+        set_backend("auto")
+    # the algorithms are imported and numba with the kernels loaded before the workers are forked, so that every
+    # worker starts with them
+    for core in (_dynamic_table_2D, _dynamic_table_3D, _dynamic_table_4D):
+        compiled(core)
+    writer = ResultWriter(output, timings)
+    done = queue.SimpleQueue()
+    n_families = n_failed = in_flight = 0
+
+    def handle(result):
+        nonlocal n_failed
+        if isinstance(result, BaseException):
+            raise result
+        family, names, alignment, row = result
+        writer.write(family, names, alignment, row)
+        if row["error"]:
+            n_failed += 1
+            print(f"family {family} failed: {row['error']}", file=sys.stderr)
+        else:
+            print(f"family {family} using {algorithm} l-stars with l={l} time: {row['total_time']:.4f}, "
+                  f"score: {row['score']}")
+
+    options = (algorithm, l, epsilon, seed, refine, centers, collapse)
+    try:
+        if processes == 1:
+            _init_worker(backend["name"], budget)
+            for family, names, seqs in iter_families(filenames, split):
+                n_families += 1
+                handle(_align_task((family, names, seqs, *options)))
+            return n_families, n_failed
+        with Pool(processes, initializer=_init_worker, initargs=(backend["name"], budget // processes)) as pool:
+            for family, names, seqs in iter_families(filenames, split):
+                while in_flight >= 2 * processes:
+                    handle(done.get())
+                    in_flight -= 1
+                pool.apply_async(_align_task, ((family, names, seqs, *options),),
+                                 callback=done.put, error_callback=done.put)
+                n_families += 1
+                in_flight += 1
+            while in_flight:
+                handle(done.get())
+                in_flight -= 1
+    finally:
+        writer.close()
+    return n_families, n_failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="msa-lstars", description=__doc__.strip().split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    align = commands.add_parser("align", help="align many families of sequences")
+    align.add_argument("fasta", nargs="+", help="fasta files, possibly gzip compressed, of one or many families")
+    align.add_argument("--algorithm", choices=ALGORITHMS, default="optimized")
+    align.add_argument("-l", type=int, default=3, help="clique size of the l-stars, default 3")
+    align.add_argument("--epsilon", "--eps", type=float, default=0.1,
+                       help="epsilon of the randomized algorithm, default 0.1")
+    align.add_argument("--seed", type=int, default=0, help="seed of the randomized algorithm, default 0")
+    align.add_argument("--centers", type=centers_option, default="all",
+                       help="centers tried: all, or top-m for the m sequences closest to all others, default all")
+    align.add_argument("--collapse", action="store_true",
+                       help="search identical sequences as one vertex, weighted by their copies, for l = 2, not with paired")
+    align.add_argument("--refine", type=float, default=None, metavar="SECONDS",
+                       help="improve the l-stars found by local search for at most this many seconds per family")
+    align.add_argument("--output", "-o", default="aligned", help="output directory, default aligned")
+    align.add_argument("--processes", "-p", type=int, default=None, help="worker processes, default all cpus")
+    align.add_argument("--split", choices=("auto", "file", "prefix"), default="auto",
+                       help="one family per file, or grouped by the record name prefix before '/', by default "
+                            "detected from the first record of each file")
+    align.add_argument("--timings", choices=("csv", "jsonl"), default="csv", help="format of the timings file")
+    align.add_argument("--memory-budget", default=None, help="memory budget shared by the workers, e.g. 8G")
+    align.add_argument("--backend", choices=("auto", "python", "numba"), default=None)
+    args = parser.parse_args(argv)
+    if args.collapse and args.algorithm == "paired":
+        parser.error("--collapse is not supported by paired l-stars")
+    if args.collapse and args.l != 2:
+        parser.error("--collapse is only exact for l = 2")
+    if args.backend:
+        from helpers import set_backend
+        set_backend(args.backend)
+
+    n_families, n_failed = align_batch(args.fasta, args.algorithm, args.l, args.epsilon, args.seed, args.output,
+                                       args.processes, args.split, args.timings, args.memory_budget, args.refine,
+                                       args.centers, args.collapse)
+    print(f"{n_families - n_failed} of {n_families} families aligned, results in {args.output}")
+    return 1 if n_failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
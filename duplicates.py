@@ -0,0 +1,33 @@
+"""
+collapsing of identical sequences: a family is searched with one vertex per distinct sequence, weighted by the number
+of copies it stands for, and its alignment is expanded back to all sequences, the copies getting the same row.
+this is only exact for l = 2: for larger l all copies of a sequence would be forced into the same clique
+"""
+
+
+def collapse_duplicates(seqs):
+    """
+    return (unique, weights, index): the sequences of the vertices, the number of copies of every vertex and, for
+    every sequence, its vertex. a vertex stands for all copies of a sequence, except that the last copy of a family
+    of copies of a single sequence is a vertex of its own, an l-star needs at least two vertices
+    """
+    vertex = {}
+    unique, weights, index = [], [], []
+    for seq in seqs:
+        if seq not in vertex:
+            vertex[seq] = len(unique)
+            unique.append(seq)
+            weights.append(0)
+        weights[vertex[seq]] += 1
+        index.append(vertex[seq])
+    if len(unique) == 1 and len(seqs) > 1:
+        weights[0] -= 1
+        index[-1] = 1
+        unique.append(seqs[-1])
+        weights.append(1)
+    return unique, weights, index
+
+
+def expand_alignment(alignment, index):
+    """return the alignment of all sequences from that of the vertices of collapse_duplicates"""
+    return [alignment[v] for v in index]
@@ -4,11 +4,18 @@ Simulating fasta files with different number of sequences and length for tests
 
 import random
 import os
+import gzip
+import argparse
+import numpy as np
 from helpers import parse_fasta
 
 DNA = 'ACGT'
 LINE_WIDTH = 60
 
+# byte of every nucleotide code, and the separator of family and sequence names in multi-family fasta files
+DNA_BYTES = np.frombuffer(DNA.encode(), dtype=np.uint8)
+FAMILY_SEPARATOR = '/'
+
 
 def simulate_random_string(m):
     """Simulate a DNA sequence of length m randomly"""
@@ -49,7 +56,7 @@ def simulate_related_sequences(n, m):
         f.write(f">seq0\n{template_seq}\n\n")
         for i in range(1, n):
             f.write(f">seq{i}\n")
-            f.write(simulate_related_string(template_seq, 30))
+            f.write(simulate_related_string(template_seq, 0.3))
             f.write("\n\n")
 
 
@@ -62,6 +69,129 @@ def convert_alignment_to_sequences(file, n, m):
             f.write(f"{seq}\n")
 
 
+def random_tree(k, rng):
+    """
+    return the parent and branch length of the 2k-1 nodes of a random rooted binary tree over the leaves 0..k-1,
+    joining random pairs of subtrees at exponential waiting times (a coalescent), the root last.
+    all leaves are at distance 1 from the root
+    """
+    parent = np.full(2 * k - 1, -1)
+    height = np.zeros(2 * k - 1)
+    active = list(range(k))
+    for node in range(k, 2 * k - 1):
+        n = len(active)
+        height[node] = height[node - 1] + rng.exponential(2 / (n * (n - 1)))
+        for _ in range(2):
+            i = rng.integers(len(active))
+            active[i], active[-1] = active[-1], active[i]
+            parent[active.pop()] = node
+        active.append(node)
+    branch = np.zeros(2 * k - 1)
+    branch[:-1] = height[parent[:-1]] - height[:-1]
+    return parent, branch / height[-1] if k > 1 else branch
+
+
+def mutate(codes, substitutions, indels, mean_indel_length, rng):
+    """
+    return a copy of the nucleotide codes evolved along a branch: every site is substituted with probability
+    substitutions, or starts a deletion or is followed by an insertion with probability indels / 2 each,
+    of geometric length with mean mean_indel_length. the events of a site exclude each other, if substitutions and
+    indels are over 1 in all, both are scaled down to 1 in all, keeping their ratio
+    """
+    total = substitutions + indels
+    if total > 1:
+        substitutions, indels = substitutions / total, indels / total
+    n = len(codes)
+    # a single uniform draw per site picks its event
+    u = rng.random(n, dtype=np.float32)
+    substituted = np.flatnonzero(u < substitutions)
+    codes = codes.copy()
+    codes[substituted] = (codes[substituted] + rng.integers(1, 4, len(substituted), dtype=np.uint8)) % 4
+    # deleted runs, as the sites covered by at least one run
+    starts = np.flatnonzero((u >= substitutions) & (u < substitutions + indels / 2))
+    ends = np.minimum(starts + rng.geometric(1 / mean_indel_length, len(starts)), n)
+    covered = np.zeros(n + 1, dtype=np.int32)
+    np.add.at(covered, starts, 1)
+    np.add.at(covered, ends, -1)
+    kept = np.cumsum(covered[:-1]) == 0
+    # every site emits itself if it is kept, followed by its insertion of random nucleotides
+    counts = kept.astype(np.int64)
+    insertions = np.flatnonzero((u >= substitutions + indels / 2) & (u < substitutions + indels))
+    counts[insertions] += rng.geometric(1 / mean_indel_length, len(insertions))
+    offsets = np.cumsum(counts)
+    evolved = rng.integers(0, 4, offsets[-1] if n else 0, dtype=np.uint8)
+    evolved[(offsets - counts)[kept]] = codes[kept]
+    return evolved
+
+
+def simulate_family(k, length, divergence, seed=None, indel_ratio=0.1, mean_indel_length=2, rng=None):
+    """
+    simulate k related sequences as uint8 arrays of nucleotide codes: a random root sequence of the given length
+    evolved along a random tree to its k leaves. divergence is the expected number of substitutions per site from
+    the root to a leaf, and indel_ratio the number of indels per substitution
+    """
+    rng = rng or np.random.default_rng(seed)
+    parent, branch = random_tree(k, rng)
+    root = 2 * k - 2
+    seqs = {root: rng.integers(0, 4, length, dtype=np.uint8)}
+    children = np.bincount(parent[:-1], minlength=2 * k - 1)
+    # parents come after their children, so a reverse sweep visits every parent first
+    for node in range(root - 1, -1, -1):
+        p = parent[node]
+        substitutions = 1 - np.exp(-divergence * branch[node])
+        indels = 1 - np.exp(-divergence * indel_ratio * branch[node])
+        seqs[node] = mutate(seqs[p], substitutions, indels, mean_indel_length, rng)
+        children[p] -= 1
+        if children[p] == 0:
+            del seqs[p]
+    return [seqs[i] for i in range(k)]
+
+
+def fasta_record(name, codes):
+    """return the fasta record of a sequence of nucleotide codes as bytes, with lines of LINE_WIDTH"""
+    residues = DNA_BYTES[codes]
+    full = len(residues) // LINE_WIDTH * LINE_WIDTH
+    lines = np.hstack([residues[:full].reshape(-1, LINE_WIDTH),
+                       np.full((full // LINE_WIDTH, 1), ord('\n'), dtype=np.uint8)])
+    rest = residues[full:].tobytes() + b'\n' if full < len(residues) else b''
+    return b'>' + name.encode() + b'\n' + lines.tobytes() + rest
+
+
+def simulate_corpus(filename, families, k, length, divergence, seed=0, **model):
+    """
+    write families simulated families of k sequences each to a single (gzip compressed if filename ends with .gz)
+    fasta file, the sequences named family{i}/seq{j}. every family has its own random stream spawned from seed,
+    so a family does not depend on how many others are generated
+    """
+    streams = np.random.SeedSequence(seed).spawn(families)
+    # the fastest gzip level, the sequences are random enough that higher levels barely shrink them
+    with (gzip.open(filename, 'wb', compresslevel=1) if filename.endswith('.gz') else open(filename, 'wb')) as f:
+        for i, stream in enumerate(streams):
+            family = simulate_family(k, length, divergence, rng=np.random.default_rng(stream), **model)
+            for j, codes in enumerate(family):
+                f.write(fasta_record(f"family{i}{FAMILY_SEPARATOR}seq{j}", codes))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="simulate a multi-family fasta corpus of related sequences. "
+                                                 "without --output, write the random_{n}_10.fa files as before")
+    parser.add_argument('--output', help="fasta file to write, gzip compressed if it ends with .gz")
+    parser.add_argument('--families', type=int, default=1)
+    parser.add_argument('--k', type=int, default=10, help="sequences per family")
+    parser.add_argument('--length', type=int, default=1000, help="length of the root sequence")
+    parser.add_argument('--divergence', type=float, default=0.1,
+                        help="expected substitutions per site from the root to a leaf")
+    parser.add_argument('--indel-ratio', type=float, default=0.1, help="indels per substitution")
+    parser.add_argument('--mean-indel-length', type=float, default=2)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    if args.output is None:
+        for n in (3, 4, 5, 7, 9, 10, 11, 13):
+            simulate_random_sequences(n, 10)
+        return
+    simulate_corpus(args.output, args.families, args.k, args.length, args.divergence, args.seed,
+                    indel_ratio=args.indel_ratio, mean_indel_length=args.mean_indel_length)
+
+
 if __name__ == '__main__':
-    for n in (3, 4, 5, 7, 9, 10, 11, 13):
-        simulate_random_sequences(n, 10)
+    main()
@@ -2,24 +2,40 @@
 Experiments
 """
 
+import os
 import time
-from helpers import sp_score, parse_fasta, align_l_star, align_2l_star, exact_alignment
+import importlib.util
+import numpy as np
+import instrument
+import planner
+from math import comb
+from multiprocessing import Pool
+from helpers import sp_score, parse_fasta, align_l_star, align_2l_star, exact_alignment, backend, set_backend, \
+    dynamic_table_2D, dynamic_table_3D, dynamic_table_4D, dynamic_table_5D, dynamic_table_5D_2l_star
 from optimized_l_stars import find_optimal_l_star
 from paired_l_stars import find_optimal_star
-from randomized_l_stars import find_optimal_randomized_l_star
+from randomized_l_stars import find_optimal_randomized_l_star, find_optimal_randomized_l_star_sweep, number_of_trials
 import csv
 
 
 def evaluation(func):
-    """print the runtime and sp score of the given algorithm"""
+    """
+    print the runtime and sp score of the given algorithm.
+    if instrumentation is enabled, its spans and counters for the run are recorded as well, see write_instrumentation
+    """
 
     def wrapper_time_score(*args, **kwargs):
-        start_time = time.perf_counter()
-        alignment = func(*args, **kwargs)
-        end_time = time.perf_counter()
+        since = instrument.mark()
+        with instrument.span(func.__name__):
+            start_time = time.perf_counter()
+            alignment = func(*args, **kwargs)
+            end_time = time.perf_counter()
         run_time = end_time - start_time
         score = sp_score(alignment)
         print(f"file {kwargs['file']} using {func.__name__} with l={kwargs['l']} time: {run_time:.4f}, score: {score}")
+        if instrument.enabled():
+            label = {"algorithm": func.__name__, "file": kwargs["file"], "k": kwargs["k"], "l": kwargs["l"]}
+            instrument.record_run(label, since)
         return run_time, score
 
     return wrapper_time_score
@@ -28,27 +44,47 @@ def evaluation(func):
 @evaluation
 def optimized_l_stars(file, k, l):
     _, seqs = parse_fasta(file)
+    planner.plan_finder([len(s) for s in seqs], k, l, "optimized")
     opt_star, _ = find_optimal_l_star(seqs, k, l)
     return align_l_star(seqs, opt_star, k, l)
 
 
 @evaluation
-def paired_l_stars(file, k, l):
+def paired_l_stars(file, k, l, processes=None):
     _, seqs = parse_fasta(file)
-    opt_star, _ = find_optimal_star(seqs, k, l)
+    planner.plan_finder([len(s) for s in seqs], k, l, "paired", processes)
+    # alignments of the (2l-1)-cliques of the star found, reused for the final alignment
+    alignments = {}
+    opt_star, _ = find_optimal_star(seqs, k, l, processes, alignments)
     if len(opt_star[0]) == l:
         return align_l_star(seqs, opt_star, k, l)
     else:
-        return align_2l_star(seqs, opt_star, k, l)
+        return align_2l_star(seqs, opt_star, k, l, alignments)
 
 
 @evaluation
 def randomized_l_stars(file, k, l, eps):
     _, seqs = parse_fasta(file)
+    planner.plan_finder([len(s) for s in seqs], k, l, "randomized")
     opt_star, _ = find_optimal_randomized_l_star(seqs, k, l, eps)
     return align_l_star(seqs, opt_star, k, l)
 
 
+def randomized_l_stars_sweep(file, k, l, epsilons, seed=None):
+    """run the randomized algorithm once for all epsilons, return {eps: (runtime, score)}"""
+    _, seqs = parse_fasta(file)
+    planner.plan_finder([len(s) for s in seqs], k, l, "randomized")
+    results = {}
+    for eps, (opt_star, _, search_time) in find_optimal_randomized_l_star_sweep(seqs, k, l, epsilons, seed).items():
+        start_time = time.perf_counter()
+        alignment = align_l_star(seqs, opt_star, k, l)
+        run_time = search_time + time.perf_counter() - start_time
+        score = sp_score(alignment)
+        print(f"file {file} using randomized_l_stars with l={l} eps={eps} time: {run_time:.4f}, score: {score}")
+        results[eps] = (run_time, score)
+    return results
+
+
 def test_optimized_l_stars(round):
     """
     l = 2, k = 3, 5, 7, 9, 11, 13
@@ -102,6 +138,158 @@ def test_randomized_l_stars(round, eps=0.1):
                 writer.writerow([k, l, rt, sc, round, eps])
 
 
+def test_randomized_l_stars_sweep(round, epsilons=(0.1, 0.3, 0.6, 0.9), seed=None):
+    """
+    same grid and csv rows as test_randomized_l_stars for every eps in epsilons, from a single run per file
+    """
+    with open("experiment_results/randomized_l_stars.csv", "a") as wf:
+        writer = csv.writer(wf)
+        grid = [(k, l) for k in (3, 5, 7, 9, 11, 13) for l in (2, 3)] + [(k, 4) for k in (4, 7, 10, 13)]
+        rows = {eps: [] for eps in epsilons}
+        for k, l in grid:
+            file = f"experiment_seqs/round_{round}/random_{k}_10.fa"
+            for eps, (rt, sc) in randomized_l_stars_sweep(file, k, l, epsilons, seed).items():
+                rows[eps].append([k, l, rt, sc, round, eps])
+        for eps in epsilons:
+            writer.writerows(rows[eps])
+
+
+def backend_parity(round=1, k=5):
+    """
+    return the dynamic_table_* kernels, as (name, weight), whose tables differ between the python and numba backends,
+    or None if numba is not installed and there is nothing to compare. the selected backend is kept
+    """
+    if not importlib.util.find_spec("numba"):
+        return None
+    _, seqs = parse_fasta(f"experiment_seqs/round_{round}/random_{k}_10.fa")
+    kernels = {dynamic_table_2D: 2, dynamic_table_3D: 3, dynamic_table_4D: 4, dynamic_table_5D: 5,
+               dynamic_table_5D_2l_star: 5}
+    mismatches, selected = [], backend["name"]
+    try:
+        for kernel, d in kernels.items():
+            for weight in (1, k - 1.5):
+                set_backend("python")
+                expected = kernel(*seqs[:d], weight)
+                set_backend("numba")
+                if not np.array_equal(expected, kernel(*seqs[:d], weight)):
+                    mismatches.append((kernel.__name__, weight))
+    finally:
+        set_backend(selected)
+    return mismatches
+
+
+# csv file and columns of the results of each algorithm
+RESULTS = {
+    "optimized_l_stars": ("optimized_l_stars.csv", ["k", "l", "time", "score", "round"]),
+    "paired_l_stars": ("paired_l_stars.csv", ["k", "l", "time", "score", "round"]),
+    "randomized_l_stars": ("randomized_l_stars.csv", ["k", "l", "time", "score", "round", "eps"]),
+}
+
+
+def experiment_tasks(rounds, epsilons=(0.1, 0.3, 0.6, 0.9)):
+    """
+    expand the grids of test_optimized_l_stars, test_paired_l_stars and test_randomized_l_stars_sweep into
+    (algorithm, k, l, round, epsilons) tasks, the randomized algorithm running all epsilons in one task
+    """
+    tasks = []
+    for r in rounds:
+        grid = [(k, l) for k in (3, 5, 7, 9, 11, 13) for l in (2, 3)] + [(k, 4) for k in (4, 7, 10, 13)]
+        tasks.extend(("optimized_l_stars", k, l, r, None) for k, l in grid)
+        tasks.extend(("paired_l_stars", k, l, r, None)
+                     for k, l in [(k, 2) for k in (3, 5, 7, 9, 11, 13)] + [(k, 3) for k in (5, 9, 13)])
+        tasks.extend(("randomized_l_stars", k, l, r, tuple(epsilons)) for k, l in grid)
+    return tasks
+
+
+def task_cost(task, length=10):
+    """estimated cost of a task, the number of dynamic table cells of the cliques it scores"""
+    algorithm, k, l, _, epsilons = task
+    if algorithm == "optimized_l_stars":
+        return k * comb(k - 1, l - 1) * (length + 1) ** l
+    if algorithm == "paired_l_stars":
+        n = -(-(k - 1) // (l - 1))
+        return k * comb(n, 2) * (length + 1) ** (2 * l - 1)
+    return k * number_of_trials(k, min(epsilons)) * -(-(k - 1) // (l - 1)) * (length + 1) ** l
+
+
+def task_key(algorithm, k, l, r, eps=None):
+    return (algorithm, int(k), int(l), int(r)) + ((float(eps),) if algorithm == "randomized_l_stars" else ())
+
+
+def run_task(task):
+    """run a task, return it together with the csv rows of its results and the instrumentation runs it recorded"""
+    algorithm, k, l, r, epsilons = task
+    first = len(instrument.runs())
+    file = f"experiment_seqs/round_{r}/random_{k}_10.fa"
+    if algorithm == "optimized_l_stars":
+        rows = [[k, l, *optimized_l_stars(file=file, k=k, l=l), r]]
+    elif algorithm == "paired_l_stars":
+        rows = [[k, l, *paired_l_stars(file=file, k=k, l=l), r]]
+    else:
+        rows = [[k, l, rt, sc, r, eps] for eps, (rt, sc) in randomized_l_stars_sweep(file, k, l, epsilons, r).items()]
+    return task, rows, instrument.runs()[first:]
+
+
+def read_results(filename):
+    """return the header line and the rows of a results csv, or None and no rows if it does not exist"""
+    if not os.path.exists(filename):
+        return None, []
+    with open(filename, newline="") as f:
+        header = f.readline().rstrip("\r\n")
+        return header, [row for row in csv.reader(f) if row]
+
+
+def write_results(filename, header, rows):
+    """replace filename by a csv of header and rows atomically, so it is never left half written"""
+    tmp = f"{filename}.{os.getpid()}.tmp"
+    with open(tmp, "w", newline="") as f:
+        f.write(header + "\n")
+        csv.writer(f).writerows(rows)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, filename)
+
+
+def run_experiments(rounds=range(1, 11), epsilons=(0.1, 0.3, 0.6, 0.9), processes=None, results="experiment_results"):
+    """
+    run all experiment tasks on a process pool, the most expensive first, appending the rows of every finished
+    task to the results csv files. tasks whose rows are already in the files are skipped, so a rerun resumes
+    an interrupted study. instrumentation runs recorded by the workers are collected in this process
+    """
+    files = {}
+    done = set()
+    for algorithm, (name, columns) in RESULTS.items():
+        filename = os.path.join(results, name)
+        header, rows = read_results(filename)
+        files[algorithm] = [filename, header or ", ".join(columns), rows]
+        done.update(task_key(algorithm, *row[:2], *row[4:]) for row in rows)
+
+    pending = []
+    for task in experiment_tasks(rounds, epsilons):
+        algorithm, k, l, r, eps = task
+        if not all(task_key(algorithm, k, l, r, e) in done for e in eps or (None,)):
+            pending.append(task)
+    pending.sort(key=task_cost, reverse=True)
+    print(f"{len(pending)} tasks to run, {len(experiment_tasks(rounds, epsilons)) - len(pending)} already done")
+
+    with Pool(processes) as pool:
+        for (algorithm, *_), rows, runs in pool.imap_unordered(run_task, pending):
+            instrument.add_runs(runs)
+            filename, header, file_rows = files[algorithm]
+            for row in rows:
+                if task_key(algorithm, *row[:2], *row[4:]) not in done:
+                    done.add(task_key(algorithm, *row[:2], *row[4:]))
+                    file_rows.append(row)
+            write_results(filename, header, file_rows)
+
+
+def write_instrumentation(prefix="experiment_results/instrumentation"):
+    """write the instrumentation of the evaluated runs as prefix.csv and prefix.json, and the spans as prefix.trace.json"""
+    instrument.write_csv(f"{prefix}.csv")
+    instrument.write_json(f"{prefix}.json")
+    instrument.write_trace(f"{prefix}.trace.json")
+
+
 def exact_scores():
     """calculate an exact score for test cases when k= 3, 4, 5"""
     with open(f"experiment_results/exact_scores.csv", "w") as wf:
@@ -116,9 +304,7 @@ def exact_scores():
 
 
 if __name__ == "__main__":
-    # for r in (1, 2, 3, 4, 5, 6, 7, 8, 9, 10):
-    #     test_optimized_l_stars(r)
-    #     test_paired_l_stars(r)
-    #     for eps in (0.1, 0.3, 0.6, 0.9):
-    #         test_randomized_l_stars(r, eps)
+    # instrument.enable()
+    # run_experiments(range(1, 11), (0.1, 0.3, 0.6, 0.9))
+    # write_instrumentation()
     exact_scores()
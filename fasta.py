@@ -0,0 +1,166 @@
+"""
+streaming fasta reader, with gzip input and .fai index support. records are strings, or given a scoring scheme,
+the read-only arrays of score matrix indices of helpers.ScoringScheme.encode, the same arrays the kernels use
+"""
+import os
+import gzip
+import mmap
+
+
+def is_gzip(filename):
+    """check the magic number of a gzip compressed file"""
+    with open(filename, "rb") as f:
+        return f.read(2) == b"\x1f\x8b"
+
+
+def iter_fasta(filename, scheme=None):
+    """
+    yield (name, sequence) for every record of a (possibly gzip compressed) fasta file, without reading it at once.
+    given a scheme, sequences are encoded by scheme.encode, which raises KeyError for residues outside its alphabet
+    """
+    if is_gzip(filename):
+        yield from _iter_fasta_stream(filename, scheme)
+    else:
+        yield from _iter_fasta_mmap(filename, scheme)
+
+
+def _iter_fasta_stream(filename, scheme):
+    name, chunks = None, []
+    with gzip.open(filename, "rb") as f:
+        for line in f:
+            if line[:1] == b">":
+                if name is not None:
+                    yield name, _record(b"".join(chunks), scheme)
+                name, chunks = line[1:].rstrip(b"\r\n").decode(), []
+            elif name is not None:
+                chunks.append(line)
+    if name is not None:
+        yield name, _record(b"".join(chunks), scheme)
+
+
+def _iter_fasta_mmap(filename, scheme):
+    with open(filename, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            start = 0 if mm[:1] == b">" else mm.find(b"\n>") + 1
+            if start == 0 and mm[:1] != b">":
+                return
+            while True:
+                header_end = mm.find(b"\n", start)
+                if header_end == -1:
+                    header_end = size
+                name = mm[start + 1:header_end].rstrip(b"\r").decode()
+                next_record = mm.find(b"\n>", header_end)
+                end = size if next_record == -1 else next_record + 1
+                yield name, _record(mm[header_end + 1:end], scheme)
+                if next_record == -1:
+                    break
+                start = next_record + 1
+
+
+def _record(residues, scheme=None):
+    seq = residues.translate(None, b" \t\r\n").decode("ascii")
+    return seq if scheme is None else scheme.encode(seq)
+
+
+def read_fasta(filename, scheme=None):
+    """return the names and sequences of all records of a fasta file, encoded by scheme if given, see iter_fasta"""
+    names, seqs = [], []
+    for name, seq in iter_fasta(filename, scheme):
+        names.append(name)
+        seqs.append(seq)
+    return names, seqs
+
+
+def build_fai(filename):
+    """
+    return the .fai index entries (name, length, offset, line bases, line width) of an uncompressed fasta file.
+    all sequence lines of a record but the last must have the same length
+    """
+    if is_gzip(filename):
+        raise ValueError(f"{filename} is gzip compressed and cannot be indexed, decompress it first")
+    entries = []
+    with open(filename, "rb") as f:
+        offset = 0
+        record = None
+        for line in f:
+            if line[:1] == b">":
+                if record is not None:
+                    entries.append(_fai_entry(filename, *record))
+                words = line[1:].split()
+                record = [words[0].decode() if words else "", offset + len(line), []]
+            elif record is not None:
+                record[2].append(line)
+            offset += len(line)
+        if record is not None:
+            entries.append(_fai_entry(filename, *record))
+    return entries
+
+
+def _fai_entry(filename, name, offset, lines):
+    # blank lines after the sequence do not count
+    while lines and not lines[-1].strip():
+        lines.pop()
+    bases = [len(line.rstrip(b"\r\n")) for line in lines]
+    widths = [len(line) for line in lines]
+    if len(set(bases[:-1])) > 1 or len(set(widths[:-1])) > 1 or (bases and bases[-1] > bases[0]):
+        raise ValueError(f"record {name} of {filename} has lines of different lengths and cannot be indexed")
+    line_bases = bases[0] if bases else 0
+    line_width = len(lines[0]) if lines else 0
+    return name, sum(bases), offset, line_bases, line_width
+
+
+def write_fai(filename, entries):
+    with open(filename, "w") as f:
+        for entry in entries:
+            f.write("\t".join(str(x) for x in entry) + "\n")
+
+
+def read_fai(filename):
+    entries = []
+    with open(filename) as f:
+        for line in f:
+            name, length, offset, line_bases, line_width = line.rstrip("\n").split("\t")[:5]
+            entries.append((name, int(length), int(offset), int(line_bases), int(line_width)))
+    return entries
+
+
+class FastaIndex:
+    """random access to the records of an uncompressed fasta file, through its .fai index"""
+
+    def __init__(self, filename, build=True):
+        self.filename = filename
+        fai = filename + ".fai"
+        if os.path.exists(fai) and os.path.getmtime(fai) >= os.path.getmtime(filename):
+            entries = read_fai(fai)
+        elif build:
+            entries = build_fai(filename)
+            write_fai(fai, entries)
+        else:
+            raise FileNotFoundError(fai)
+        self.entries = {entry[0]: entry for entry in entries}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    @property
+    def names(self):
+        return list(self.entries)
+
+    def fetch(self, name, scheme=None):
+        """return the sequence of the record called name, encoded by scheme if given, see iter_fasta"""
+        _, length, offset, line_bases, line_width = self.entries[name]
+        if length == 0:
+            size = 0
+        else:
+            full_lines, rest = divmod(length, line_bases)
+            size = full_lines * line_width + rest
+        with open(self.filename, "rb") as f:
+            f.seek(offset)
+            residues = f.read(size)
+        return _record(residues, scheme)
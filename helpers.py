@@ -2,10 +2,40 @@
 helpers and configurations
 """
 
+import os
+import hashlib
+import importlib
+import importlib.util
 import numpy as np
+import instrument
+import planner
+from fasta import read_fasta
 from collections import deque
+from functools import lru_cache
 from itertools import combinations
 
+__all__ = ["gap", "score", "mapping", "ScoringScheme", "default_scheme", "backend", "set_backend", "compiled",
+           "run_kernel", "parse_fasta", "generate_all_l_stars", "dynamic_table_2D", "dynamic_table_3D",
+           "dynamic_table_4D", "dynamic_table_5D", "dynamic_table_5D_2l_star", "dynamic_score", "pairwise_alignment",
+           "three_exact_alignment", "four_exact_alignment", "five_exact_alignment", "five_exact_alignment_2l_star",
+           "exact_alignment", "table_score", "prefix_trie", "trie_distance_matrix", "pairwise_distance_matrix",
+           "select_centers", "sp_score_clique", "sp_score_clique_2l_star", "alignment_clique", "alignment_clique_2l",
+           "sp_score_and_alignment_clique_2l_star", "align_l_star", "align_2l_star", "sp_score"]
+
+# names defined in modules that are only imported when one of them is first used, see __getattr__
+_lazy = {name: "kernels_5d" for name in ("dynamic_table_5D", "_dynamic_table_5D", "dynamic_table_5D_2l_star",
+                                         "_dynamic_table_5D_2l_star", "five_exact_alignment",
+                                         "five_exact_alignment_2l_star")}
+
+
+def __getattr__(name):
+    """import the module of a lazily imported name on its first use"""
+    if name not in _lazy:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_lazy[name]), name)
+    globals()[name] = value
+    return value
+
 # define gap and score matrix
 gap = 5
 score = np.array([[0, 5, 2, 5],
@@ -19,20 +49,152 @@ mapping = {'A': 0, 'C': 1, 'G': 2, 'T': 3,
            'N': 0, 'R': 0, 'S': 1}
 
 
+class ScoringScheme:
+    """
+    alphabet (a mapping of characters to score matrix indices), substitution matrix and gap cost of the sp score.
+    the lookup tables used by the kernels are precompiled on construction. only the definition is pickled,
+    the tables are rebuilt when unpickled, so sending a scheme to a worker process is cheap
+    """
+
+    def __init__(self, mapping, score, gap):
+        self.mapping = dict(mapping)
+        self.score = np.array(score)
+        self.score.setflags(write=False)
+        self.gap = gap
+        self._compile()
+
+    def _compile(self):
+        # lookup table from byte values to score matrix indices, -1 for characters outside the alphabet
+        self.lookup = np.full(256, -1, dtype=np.intp)
+        for c, i in self.mapping.items():
+            self.lookup[ord(c)] = i
+        self.move_costs = {d: self._move_costs(d) for d in range(2, 6)}
+        # content hash, equal schemes share cached results
+        h = hashlib.sha256(repr((sorted(self.mapping.items()), self.score.dtype.str, self.score.shape,
+                                 self.gap)).encode())
+        h.update(np.ascontiguousarray(self.score).tobytes())
+        self.hash = h.hexdigest()
+        self.encode = lru_cache(maxsize=4096)(self._encode)
+        self.cost_matrix = lru_cache(maxsize=1024)(self._cost_matrix)
+
+    def _move_costs(self, d):
+        """
+        return the gap costs of the moves through the dynamic table of an l-star clique of d sequences with the
+        center first: row m is the move advancing the sequences in the bit mask m, column 0 the cost paid per unit
+        of the center weight and column 1 the cost paid once
+        """
+        move_costs = np.zeros((1 << d, 2))
+        for m in range(1, 1 << d):
+            for a, b in combinations(range(d), 2):
+                if (m >> a & 1) != (m >> b & 1):
+                    move_costs[m, 0 if a == 0 else 1] += self.gap
+        move_costs.setflags(write=False)
+        return move_costs
+
+    def _encode(self, seq):
+        """return seq as a read-only array of indices into the score matrix, computed once per sequence"""
+        encoded = self.lookup[np.frombuffer(seq.encode("latin-1", "replace"), dtype=np.uint8)]
+        unknown = np.flatnonzero(encoded < 0)
+        if len(unknown):
+            raise KeyError(seq[unknown[0]])
+        encoded.setflags(write=False)
+        return encoded
+
+    def _cost_matrix(self, seq0, seq1):
+        """return the read-only matrix of substitution costs between all characters of seq0 and seq1"""
+        m = self.score[self.encode(seq0)[:, None], self.encode(seq1)[None, :]]
+        m.setflags(write=False)
+        return m
+
+    def costs(self, seq0, seq1):
+        """return the substitution costs between seq0 and seq1 as nested lists, the fastest to index in python loops"""
+        return self.cost_matrix(seq0, seq1).tolist()
+
+    def __getstate__(self):
+        return self.mapping, self.score, self.gap
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def __eq__(self, other):
+        return isinstance(other, ScoringScheme) and self.hash == other.hash
+
+    def __hash__(self):
+        return hash(self.hash)
+
+    def __repr__(self):
+        return f"ScoringScheme(gap={self.gap}, alphabet={''.join(sorted(self.mapping))!r}, hash={self.hash[:12]})"
+
+
+# the scoring scheme of the module level gap, score and mapping, used wherever no scheme is given
+default_scheme = ScoringScheme(mapping, score, gap)
+
+
+# backend running the dynamic_table_* kernels, "auto" is resolved on first use, see set_backend. kernels holds the
+# core functions compiled for the backend so far
+backend = {"name": os.environ.get("MSA_BACKEND", "auto"), "kernels": {}}
+
+
+def set_backend(name="auto"):
+    """
+    select the backend of the dynamic_table_* kernels: "python", "numba" (jit compiled with numba) or "auto",
+    which uses numba when it is installed and falls back to python otherwise. return the selected backend.
+    numba itself is only imported when the first kernel is compiled
+    """
+    if name == "auto":
+        name = "numba" if importlib.util.find_spec("numba") else "python"
+    if name == "numba" and not importlib.util.find_spec("numba"):
+        raise ImportError("the numba backend needs numba to be installed")
+    if name not in ("numba", "python"):
+        raise ValueError(f"unknown backend {name}")
+    backend.update(name=name, kernels={})
+    return name
+
+
+def compiled(core):
+    """return the core function of a kernel for the selected backend, compiling it on its first use"""
+    kernel = backend["kernels"].get(core)
+    if kernel is None:
+        if backend["name"] == "numba":
+            import numba
+            kernel = numba.njit(cache=True)(core)
+        else:
+            kernel = core
+        backend["kernels"][core] = kernel
+    return kernel
+
+
+def run_kernel(core, seqs, weight, scheme=None, mode=None):
+    """
+    fill out the dynamic table of seqs with the core function of a kernel, on the selected backend, in memory or
+    out-of-core as given by mode, planned if it is None, see planner.plan_table
+    """
+    scheme = scheme or default_scheme
+    if backend["name"] == "auto":
+        set_backend("auto")
+    hits = scheme.cost_matrix.cache_info().hits if instrument.enabled() else 0
+    if backend["name"] == "numba":
+        pairs = [scheme.cost_matrix(a, b) for a, b in combinations(seqs, 2)]
+    else:
+        pairs = [scheme.costs(a, b) for a, b in combinations(seqs, 2)]
+    sizes = [len(s) + 1 for s in seqs]
+    # a table over the memory budget is kept in a memory-mapped scratch file, or fails before it is allocated
+    if mode is None:
+        mode = planner.FULL if planner.small_table(sizes) else planner.plan_table([n - 1 for n in sizes],
+                                                                                  out_of_core=True)[0]
+    t = planner.allocate(sizes, mode)
+    if instrument.enabled():
+        cells = int(np.prod(sizes))
+        instrument.count("dp_cells", cells)
+        instrument.count("table_bytes", cells * np.dtype(np.float64).itemsize)
+        instrument.count("cost_matrix_hits", scheme.cost_matrix.cache_info().hits - hits)
+    return compiled(core)(t, *sizes, *pairs, weight, scheme.gap)
+
+
+@instrument.spanned("parse_fasta")
 def parse_fasta(filename):
-    """helper functions for parsing fasta files"""
-    with open(filename, 'r') as f:
-        lines = f.readlines()
-    names, seqs = [], []
-    for i in range(len(lines)):
-        if lines[i][0] == '>':
-            names.append(lines[i][1:].strip('\n'))
-            seq = ""
-            while i < len(lines) - 1 and lines[i + 1][0] != '>':
-                seq += lines[i + 1].strip('\n')
-                i += 1
-            seqs.append(seq)
-    return names, seqs
+    """helper functions for parsing (possibly gzip compressed) fasta files, see fasta.read_fasta"""
+    return read_fasta(filename)
 
 
 def generate_all_l_stars(k, l):
@@ -60,10 +222,12 @@ def generate_all_l_stars(k, l):
     return l_stars
 
 
-def dynamic_table_2D(seq0, seq1, weight=1):
+def dynamic_table_2D(seq0, seq1, weight=1, scheme=None, mode=None):
     """calculate the dynamic table between 2 sequences"""
-    m, n = len(seq0) + 1, len(seq1) + 1
-    t = np.zeros([m, n])
+    return run_kernel(_dynamic_table_2D, (seq0, seq1), weight, scheme, mode)
+
+
+def _dynamic_table_2D(t, m, n, c01, weight, gap):
     for i in range(1, m):
         t[i, 0] = t[i - 1, 0] + gap
     for j in range(1, n):
@@ -72,15 +236,18 @@ def dynamic_table_2D(seq0, seq1, weight=1):
         for j in range(1, n):
             v1 = t[i - 1, j] + gap
             v2 = t[i, j - 1] + gap
-            v3 = t[i - 1, j - 1] + score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]]
+            v3 = t[i - 1, j - 1] + c01[i - 1][j - 1]
             t[i, j] = min(v1, v2, v3)
-    return t * weight
+    t *= weight
+    return t
 
 
-def dynamic_table_3D(seq0, seq1, seq2, weight=1):
+def dynamic_table_3D(seq0, seq1, seq2, weight=1, scheme=None, mode=None):
     """return the dynamic table of 3 sequences"""
-    n0, n1, n2 = len(seq0) + 1, len(seq1) + 1, len(seq2) + 1
-    t = np.zeros([n0, n1, n2])
+    return run_kernel(_dynamic_table_3D, (seq0, seq1, seq2), weight, scheme, mode)
+
+
+def _dynamic_table_3D(t, n0, n1, n2, c01, c02, c12, weight, gap):
     wg = weight * gap
     for i in range(1, n0):
         t[i, 0, 0] = t[i - 1, 0, 0] + 2 * wg
@@ -92,31 +259,29 @@ def dynamic_table_3D(seq0, seq1, seq2, weight=1):
         for j in range(1, n1):
             v1 = t[i - 1, j, 0] + 2 * wg
             v2 = t[i, j - 1, 0] + wg + gap
-            v3 = t[i - 1, j - 1, 0] + score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] * weight + wg + gap
+            v3 = t[i - 1, j - 1, 0] + c01[i - 1][j - 1] * weight + wg + gap
             t[i, j, 0] = min(v1, v2, v3)
     for i in range(1, n0):
         for k in range(1, n2):
             v1 = t[i - 1, 0, k] + 2 * wg
             v2 = t[i, 0, k - 1] + wg + gap
-            v3 = t[i - 1, 0, k - 1] + score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] * weight + wg + gap
+            v3 = t[i - 1, 0, k - 1] + c02[i - 1][k - 1] * weight + wg + gap
             t[i, 0, k] = min(v1, v2, v3)
     for j in range(1, n1):
         for k in range(1, n2):
             v1 = t[0, j - 1, k] + wg + gap
             v2 = t[0, j, k - 1] + wg + gap
-            v3 = t[0, j - 1, k - 1] + score[mapping[seq1[j - 1]], mapping[seq2[k - 1]]] + 2 * wg
+            v3 = t[0, j - 1, k - 1] + c12[j - 1][k - 1] + 2 * wg
             t[0, j, k] = min(v1, v2, v3)
     for i in range(1, n0):
         for j in range(1, n1):
             for k in range(1, n2):
-                v1 = t[i - 1, j - 1, k - 1] + score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] * weight \
-                     + score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] * weight \
-                     + score[mapping[seq1[j - 1]], mapping[seq2[k - 1]]]
-                v2 = t[i, j - 1, k - 1] + 2 * wg + score[mapping[seq1[j - 1]], mapping[seq2[k - 1]]]
-                v3 = t[i - 1, j, k - 1] + wg + gap + score[
-                    mapping[seq0[i - 1]], mapping[seq2[k - 1]]] * weight
-                v4 = t[i - 1, j - 1, k] + score[
-                    mapping[seq0[i - 1]], mapping[seq1[j - 1]]] * weight + wg + gap
+                v1 = t[i - 1, j - 1, k - 1] + c01[i - 1][j - 1] * weight \
+                     + c02[i - 1][k - 1] * weight \
+                     + c12[j - 1][k - 1]
+                v2 = t[i, j - 1, k - 1] + 2 * wg + c12[j - 1][k - 1]
+                v3 = t[i - 1, j, k - 1] + wg + gap + c02[i - 1][k - 1] * weight
+                v4 = t[i - 1, j - 1, k] + c01[i - 1][j - 1] * weight + wg + gap
                 v5 = t[i, j, k - 1] + wg + gap
                 v6 = t[i, j - 1, k] + wg + gap
                 v7 = t[i - 1, j, k] + 2 * wg
@@ -124,10 +289,12 @@ def dynamic_table_3D(seq0, seq1, seq2, weight=1):
     return t
 
 
-def dynamic_table_4D(seq0, seq1, seq2, seq3, weight=1):
+def dynamic_table_4D(seq0, seq1, seq2, seq3, weight=1, scheme=None, mode=None):
     """return the dynamic table of 4 sequences"""
-    n0, n1, n2, n3 = len(seq0) + 1, len(seq1) + 1, len(seq2) + 1, len(seq3) + 1
-    t = np.zeros([n0, n1, n2, n3])
+    return run_kernel(_dynamic_table_4D, (seq0, seq1, seq2, seq3), weight, scheme, mode)
+
+
+def _dynamic_table_4D(t, n0, n1, n2, n3, c01, c02, c03, c12, c13, c23, weight, gap):
     wg = weight * gap
     wg2, wg3 = wg * 2, wg * 3
     g2 = gap * 2
@@ -143,44 +310,44 @@ def dynamic_table_4D(seq0, seq1, seq2, seq3, weight=1):
         for j in range(1, n1):
             v1 = t[i - 1, j, 0, 0] + wg3
             v2 = t[i, j - 1, 0, 0] + wg + g2
-            v3 = t[i - 1, j - 1, 0, 0] + score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] * weight + wg2 + g2
+            v3 = t[i - 1, j - 1, 0, 0] + c01[i - 1][j - 1] * weight + wg2 + g2
             t[i, j, 0, 0] = min(v1, v2, v3)
     for i in range(1, n0):
         for k in range(1, n2):
             v1 = t[i - 1, 0, k, 0] + wg3
             v2 = t[i, 0, k - 1, 0] + wg + g2
-            v3 = t[i - 1, 0, k - 1, 0] + score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] * weight + wg2 + g2
+            v3 = t[i - 1, 0, k - 1, 0] + c02[i - 1][k - 1] * weight + wg2 + g2
             t[i, 0, k, 0] = min(v1, v2, v3)
     for i in range(1, n0):
         for l in range(1, n3):
             v1 = t[i - 1, 0, 0, l] + wg3
             v2 = t[i, 0, 0, l - 1] + wg + g2
-            v3 = t[i - 1, 0, 0, l - 1] + score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]] * weight + wg2 + g2
+            v3 = t[i - 1, 0, 0, l - 1] + c03[i - 1][l - 1] * weight + wg2 + g2
             t[i, 0, 0, l] = min(v1, v2, v3)
     for j in range(1, n1):
         for k in range(1, n2):
             v1 = t[0, j - 1, k, 0] + wg + g2
             v2 = t[0, j, k - 1, 0] + wg + g2
-            v3 = t[0, j - 1, k - 1, 0] + wg2 + score[mapping[seq1[j-1]], mapping[seq2[k-1]]] + g2
+            v3 = t[0, j - 1, k - 1, 0] + wg2 + c12[j-1][k-1] + g2
             t[0, j, k, 0] = min(v1, v2, v3)
     for j in range(1, n1):
         for l in range(1, n3):
             v1 = t[0, j - 1, 0, l] + wg + g2
             v2 = t[0, j, 0, l - 1] + wg + g2
-            v3 = t[0, j - 1, 0, l - 1] + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + wg2 + g2
+            v3 = t[0, j - 1, 0, l - 1] + c13[j - 1][l - 1] + wg2 + g2
             t[0, j, 0, l] = min(v1, v2, v3)
     for k in range(1, n2):
         for l in range(1, n3):
             v1 = t[0, 0, k - 1, l] + wg + g2
             v2 = t[0, 0, k, l - 1] + wg + g2
-            v3 = t[0, 0, k - 1, l - 1] + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]] + wg2 + g2
+            v3 = t[0, 0, k - 1, l - 1] + c23[k - 1][l - 1] + wg2 + g2
             t[0, 0, k, l] = min(v1, v2, v3)
     for i in range(1, n0):
         for j in range(1, n1):
             for k in range(1, n2):
-                sij = score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]]
-                sik = score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]]
-                sjk = score[mapping[seq1[j - 1]], mapping[seq2[k - 1]]]
+                sij = c01[i - 1][j - 1]
+                sik = c02[i - 1][k - 1]
+                sjk = c12[j - 1][k - 1]
                 v1 = t[i - 1, j - 1, k - 1, 0] + (sij + sik) * weight + sjk + wg + g2
                 v2 = t[i, j - 1, k - 1, 0] + wg2 + sjk + g2
                 v3 = t[i - 1, j, k - 1, 0] + wg2 + g2 + sik * weight
@@ -192,9 +359,9 @@ def dynamic_table_4D(seq0, seq1, seq2, seq3, weight=1):
     for i in range(1, n0):
         for j in range(1, n1):
             for l in range(1, n3):
-                sij = score[mapping[seq0[i - 1]], mapping[seq1[j-1]]]
-                sil = score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]]
-                sjl = score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]]
+                sij = c01[i - 1][j-1]
+                sil = c03[i - 1][l - 1]
+                sjl = c13[j - 1][l - 1]
                 v1 = t[i - 1, j - 1, 0, l - 1] + (sij + sil) * weight + sjl + wg + g2
                 v2 = t[i, j - 1, 0, l - 1] + wg2 + sjl + g2
                 v3 = t[i - 1, j, 0, l - 1] + wg2 + g2 + sil * weight
@@ -206,9 +373,9 @@ def dynamic_table_4D(seq0, seq1, seq2, seq3, weight=1):
     for i in range(1, n0):
         for k in range(1, n2):
             for l in range(1, n3):
-                sik = score[mapping[seq0[i - 1]], mapping[seq2[k-1]]]
-                sil = score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]]
-                skl = score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]]
+                sik = c02[i - 1][k-1]
+                sil = c03[i - 1][l - 1]
+                skl = c23[k - 1][l - 1]
                 v1 = t[i - 1, 0, k - 1, l - 1] + (sik + sil) * weight + skl + wg + g2
                 v2 = t[i, 0, k - 1, l - 1] + wg2 + skl + g2
                 v3 = t[i - 1, 0, k, l - 1] + wg2 + g2 + sil * weight
@@ -220,9 +387,9 @@ def dynamic_table_4D(seq0, seq1, seq2, seq3, weight=1):
     for j in range(1, n1):
         for k in range(1, n2):
             for l in range(1, n3):
-                sjk = score[mapping[seq1[j - 1]], mapping[seq2[k - 1]]]
-                sjl = score[mapping[seq1[j - 1]], mapping[seq3[l-1]]]
-                skl = score[mapping[seq2[k - 1]], mapping[seq3[l-1]]]
+                sjk = c12[j - 1][k - 1]
+                sjl = c13[j - 1][l-1]
+                skl = c23[k - 1][l-1]
                 v1 = t[0, j - 1, k - 1, l - 1] + sjk + sjl + skl + wg3
                 v2 = t[0, j, k - 1, l - 1] + wg2 + skl + g2
                 v3 = t[0, j - 1, k, l - 1] + wg2 + g2 + sjl
@@ -235,12 +402,12 @@ def dynamic_table_4D(seq0, seq1, seq2, seq3, weight=1):
         for j in range(1, n1):
             for k in range(1, n2):
                 for l in range(1, n3):
-                    sij = score[mapping[seq0[i - 1]], mapping[seq1[j-1]]]
-                    sik = score[mapping[seq0[i - 1]], mapping[seq2[k-1]]]
-                    sil = score[mapping[seq0[i - 1]], mapping[seq3[l-1]]]
-                    sjk = score[mapping[seq1[j - 1]], mapping[seq2[k - 1]]]
-                    sjl = score[mapping[seq1[j - 1]], mapping[seq3[l-1]]]
-                    skl = score[mapping[seq2[k - 1]], mapping[seq3[l-1]]]
+                    sij = c01[i - 1][j-1]
+                    sik = c02[i - 1][k-1]
+                    sil = c03[i - 1][l-1]
+                    sjk = c12[j - 1][k - 1]
+                    sjl = c13[j - 1][l-1]
+                    skl = c23[k - 1][l-1]
                     v1 = t[i, j, k, l - 1] + wg + g2
                     v2 = t[i, j, k - 1, l] + wg + g2
                     v3 = t[i, j, k - 1, l - 1] + wg2 + g2 + skl
@@ -260,804 +427,86 @@ def dynamic_table_4D(seq0, seq1, seq2, seq3, weight=1):
     return t
 
 
-def dynamic_table_5D(seq0, seq1, seq2, seq3, seq4, weight=1):
+def dynamic_score(seqs, weight=1, scheme=None):
     """
-    return the dynamic table for 5 sequences, based on the graph configuration of l-star, where seq0 is the center string
+    return the sp score of 2 to 5 sequences in the l-star configuration centered on seqs[0], the last cell of
+    their dynamic table, holding only two slabs of the table over seqs[1:] at a time. the moves of a slab from the
+    previous slab are vectorized, and the slab itself is filled the same way one sequence lower, down to a single
+    sequence, whose gaps are a running minimum. for 2 to 4 sequences the score is that of dynamic_table_2D..4D
     """
-    n0, n1, n2, n3, n4 = len(seq0) + 1, len(seq1) + 1, len(seq2) + 1, len(seq3) + 1, len(seq4) + 1
-    t = np.zeros([n0, n1, n2, n3, n4])
-    wg = weight * gap
-    wg2, wg3, wg4 = wg * 2, wg * 3, wg * 4
-    g2, g3, g4 = gap * 2, gap * 3, gap * 4
-    for i in range(1, n0):
-        t[i, 0, 0, 0, 0] = t[i - 1, 0, 0, 0, 0] + wg4
-    for j in range(1, n1):
-        t[0, j, 0, 0, 0] = t[0, j - 1, 0, 0, 0] + g3 + wg
-    for k in range(1, n2):
-        t[0, 0, k, 0, 0] = t[0, 0, k - 1, 0, 0] + g3 + wg
-    for l in range(1, n3):
-        t[0, 0, 0, l, 0] = t[0, 0, 0, l - 1, 0] + g3 + wg
-    for m in range(1, n4):
-        t[0, 0, 0, 0, m] = t[0, 0, 0, 0, m - 1] + g3 + wg
-    for i in range(1, n0):
-        for j in range(1, n1):
-            v1 = t[i - 1, j, 0, 0, 0] + wg4
-            v2 = t[i, j - 1, 0, 0, 0] + wg + g3
-            v3 = t[i - 1, j - 1, 0, 0, 0] + score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] * weight + wg3 + g3
-            t[i, j, 0, 0, 0] = min(v1, v2, v3)
-    for i in range(1, n0):
-        for k in range(1, n2):
-            v1 = t[i - 1, 0, k, 0, 0] + wg4
-            v2 = t[i, 0, k - 1, 0, 0] + wg + g3
-            v3 = t[i - 1, 0, k - 1, 0, 0] + score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] * weight + wg3 + g3
-            t[i, 0, k, 0, 0] = min(v1, v2, v3)
-    for i in range(1, n0):
-        for l in range(1, n3):
-            v1 = t[i - 1, 0, 0, l, 0] + wg4
-            v2 = t[i, 0, 0, l - 1, 0] + wg + g3
-            v3 = t[i - 1, 0, 0, l - 1, 0] + score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]] * weight + wg3 + g3
-            t[i, 0, 0, l, 0] = min(v1, v2, v3)
-    for i in range(1, n0):
-        for m in range(1, n4):
-            v1 = t[i - 1, 0, 0, 0, m] + wg4
-            v2 = t[i, 0, 0, 0, m - 1] + wg + g3
-            v3 = t[i - 1, 0, 0, 0, m - 1] + score[mapping[seq0[i - 1]], mapping[seq4[m - 1]]] * weight + wg3 + g3
-            t[i, 0, 0, 0, m] = min(v1, v2, v3)
-    for j in range(1, n1):
-        for k in range(1, n2):
-            v1 = t[0, j - 1, k, 0, 0] + wg + g3
-            v2 = t[0, j, k - 1, 0, 0] + wg + g3
-            v3 = t[0, j - 1, k - 1, 0, 0] + wg2 + g4 + score[mapping[seq1[j-1]], mapping[seq2[k-1]]]
-            t[0, j, k, 0, 0] = min(v1, v2, v3)
-    for j in range(1, n1):
-        for l in range(1, n3):
-            v1 = t[0, j - 1, 0, l, 0] + wg + g3
-            v2 = t[0, j, 0, l - 1, 0] + wg + g3
-            v3 = t[0, j - 1, 0, l - 1, 0] + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + wg2 + g4
-            t[0, j, 0, l, 0] = min(v1, v2, v3)
-    for j in range(1, n1):
-        for m in range(1, n4):
-            v1 = t[0, j - 1, 0, 0, m] + wg + g3
-            v2 = t[0, j, 0, 0, m - 1] + wg + g3
-            v3 = t[0, j - 1, 0, 0, m - 1] + score[mapping[seq1[j - 1]], mapping[seq4[m - 1]]] + wg2 + g4
-            t[0, j, 0, 0, m] = min(v1, v2, v3)
-    for k in range(1, n2):
-        for l in range(1, n3):
-            v1 = t[0, 0, k - 1, l, 0] + wg + g3
-            v2 = t[0, 0, k, l - 1, 0] + wg + g3
-            v3 = t[0, 0, k - 1, l - 1, 0] + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]] + wg2 + g4
-            t[0, 0, k, l, 0] = min(v1, v2, v3)
-    for k in range(1, n2):
-        for m in range(1, n4):
-            v1 = t[0, 0, k - 1, 0, m] + wg + g3
-            v2 = t[0, 0, k, 0, m - 1] + wg + g3
-            v3 = t[0, 0, k - 1, 0, m - 1] + score[mapping[seq2[k - 1]], mapping[seq4[m - 1]]] + wg2 + g4
-            t[0, 0, k, 0, m] = min(v1, v2, v3)
-    for l in range(1, n3):
-        for m in range(1, n4):
-            v1 = t[0, 0, 0, l - 1, m] + wg + g3
-            v2 = t[0, 0, 0, l, m - 1] + wg + g3
-            v3 = t[0, 0, 0, l - 1, m - 1] + wg2 + g4 + score[mapping[seq3[l-1]], mapping[seq4[m-1]]]
-            t[0, 0, 0, l, m] = min(v1, v2, v3)
-    for i in range(1, n0):
-        for j in range(1, n1):
-            for k in range(1, n2):
-                sij = score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]]
-                sik = score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]]
-                sjk = score[mapping[seq1[j - 1]], mapping[seq2[k - 1]]]
-                v1 = t[i - 1, j - 1, k - 1, 0, 0] + (sij + sik) * weight + sjk + wg2 + g4
-                v2 = t[i, j - 1, k - 1, 0, 0] + wg2 + sjk + g4
-                v3 = t[i - 1, j, k - 1, 0, 0] + wg3 + g3 + sik * weight
-                v4 = t[i - 1, j - 1, k, 0, 0] + sij * weight + wg3 + g3
-                v5 = t[i, j, k - 1, 0, 0] + wg + g3
-                v6 = t[i, j - 1, k, 0, 0] + wg + g3
-                v7 = t[i - 1, j, k, 0, 0] + wg4
-                t[i, j, k, 0, 0] = min(v1, v2, v3, v4, v5, v6, v7)
-    for i in range(1, n0):
-        for j in range(1, n1):
-            for l in range(1, n3):
-                sij = score[mapping[seq0[i - 1]], mapping[seq1[j-1]]]
-                sil = score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]]
-                sjl = score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]]
-                v1 = t[i - 1, j - 1, 0, l - 1, 0] + (sij + sil) * weight + sjl + wg2 + g4
-                v2 = t[i, j - 1, 0, l - 1, 0] + wg2 + sjl + g4
-                v3 = t[i - 1, j, 0, l - 1, 0] + wg3 + g3 + sil * weight
-                v4 = t[i - 1, j - 1, 0, l, 0] + sij * weight + wg3 + g3
-                v5 = t[i, j, 0, l - 1, 0] + wg + g3
-                v6 = t[i, j - 1, 0, l, 0] + wg + g3
-                v7 = t[i - 1, j, 0, l, 0] + wg4
-                t[i, j, 0, l, 0] = min(v1, v2, v3, v4, v5, v6, v7)
-    for i in range(1, n0):
-        for j in range(1, n1):
-            for m in range(1, n4):
-                sij = score[mapping[seq0[i - 1]], mapping[seq1[j-1]]]
-                sim = score[mapping[seq0[i - 1]], mapping[seq4[m-1]]]
-                sjm = score[mapping[seq1[j - 1]], mapping[seq4[m-1]]]
-                v1 = t[i - 1, j - 1, 0, 0, m - 1] + (sij + sim) * weight + sjm + wg2 + g4
-                v2 = t[i, j - 1, 0, 0, m - 1] + wg2 + sjm + g4
-                v3 = t[i - 1, j, 0, 0, m - 1] + wg3 + g3 + sim * weight
-                v4 = t[i - 1, j - 1, 0, 0, m] + sij * weight + wg3 + g3
-                v5 = t[i, j, 0, 0, m - 1] + wg + g3
-                v6 = t[i, j - 1, 0, 0, m] + wg + g3
-                v7 = t[i - 1, j, 0, 0, m] + wg4
-                t[i, j, 0, 0, m] = min(v1, v2, v3, v4, v5, v6, v7)
-    for i in range(1, n0):
-        for k in range(1, n2):
-            for l in range(1, n3):
-                sik = score[mapping[seq0[i - 1]], mapping[seq2[k-1]]]
-                sil = score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]]
-                skl = score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]]
-                v1 = t[i - 1, 0, k - 1, l - 1, 0] + (sik + sil) * weight + skl + wg2 + g4
-                v2 = t[i, 0, k - 1, l - 1, 0] + wg2 + skl + g4
-                v3 = t[i - 1, 0, k, l - 1, 0] + wg3 + g3 + sil * weight
-                v4 = t[i - 1, 0, k - 1, l, 0] + sik * weight + wg3 + g3
-                v5 = t[i, 0, k, l - 1, 0] + wg + g3
-                v6 = t[i, 0, k - 1, l, 0] + wg + g3
-                v7 = t[i - 1, 0, k, l, 0] + wg4
-                t[i, 0, k, l, 0] = min(v1, v2, v3, v4, v5, v6, v7)
-    for i in range(1, n0):
-        for k in range(1, n2):
-            for m in range(1, n4):
-                sik = score[mapping[seq0[i - 1]], mapping[seq2[k-1]]]
-                sim = score[mapping[seq0[i - 1]], mapping[seq4[m-1]]]
-                skm = score[mapping[seq2[k - 1]], mapping[seq4[m-1]]]
-                v1 = t[i - 1, 0, k - 1, 0, m - 1] + (sik + sim) * weight + skm + wg2 + g4
-                v2 = t[i, 0, k - 1, 0, m - 1] + wg2 + skm + g4
-                v3 = t[i - 1, 0, k, 0, m - 1] + wg3 + g3 + sim * weight
-                v4 = t[i - 1, 0, k - 1, 0, m] + sik * weight + wg3 + g3
-                v5 = t[i, 0, k, 0, m - 1] + wg + g3
-                v6 = t[i, 0, k - 1, 0, m] + wg + g3
-                v7 = t[i - 1, 0, k, 0, m] + wg4
-                t[i, 0, k, 0, m] = min(v1, v2, v3, v4, v5, v6, v7)
-    for i in range(1, n0):
-        for l in range(1, n3):
-            for m in range(1, n4):
-                sil = score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]]
-                sim = score[mapping[seq0[i - 1]], mapping[seq4[m-1]]]
-                slm = score[mapping[seq3[l - 1]], mapping[seq4[m-1]]]
-                v1 = t[i - 1, 0, 0, l - 1, m - 1] + (sil + sim) * weight + slm + wg2 + g4
-                v2 = t[i, 0, 0, l - 1, m - 1] + wg2 + slm + g4
-                v3 = t[i - 1, 0, 0, l, m - 1] + wg3 + g3 + sim * weight
-                v4 = t[i - 1, 0, 0, l - 1, m] + sil * weight + wg3 + g3
-                v5 = t[i, 0, 0, l, m - 1] + wg + g3
-                v6 = t[i, 0, 0, l - 1, m] + wg + g3
-                v7 = t[i - 1, 0, 0, l, m] + wg4
-                t[i, 0, 0, l, m] = min(v1, v2, v3, v4, v5, v6, v7)
-    for j in range(1, n1):
-        for k in range(1, n2):
-            for l in range(1, n3):
-                sjl = score[mapping[seq1[j - 1]], mapping[seq3[l-1]]]
-                sjk = score[mapping[seq1[j - 1]], mapping[seq2[k-1]]]
-                skl = score[mapping[seq2[k - 1]], mapping[seq3[l-1]]]
-                v1 = t[0, j - 1, k - 1, l - 1, 0] + sjk + sjl + skl + wg3 + g3
-                v2 = t[0, j, k - 1, l - 1, 0] + wg2 + skl + g4
-                v3 = t[0, j - 1, k, l - 1, 0] + wg2 + g4 + sjl
-                v4 = t[0, j - 1, k - 1, l, 0] + wg2 + sjk + g4
-                v5 = t[0, j, k, l - 1, 0] + wg + g3
-                v6 = t[0, j, k - 1, l, 0] + wg + g3
-                v7 = t[0, j - 1, k, l, 0] + wg + g3
-                t[0, j, k, l, 0] = min(v1, v2, v3, v4, v5, v6, v7)
-    for j in range(1, n1):
-        for k in range(1, n2):
-            for m in range(1, n4):
-                sjk = score[mapping[seq1[j - 1]], mapping[seq2[k-1]]]
-                sjm = score[mapping[seq1[j - 1]], mapping[seq4[m-1]]]
-                skm = score[mapping[seq2[k - 1]], mapping[seq4[m-1]]]
-                v1 = t[0, j - 1, k - 1, 0, m - 1] + sjk + sjm + skm + wg3 + g3
-                v2 = t[0, j, k - 1, 0, m - 1] + wg2 + skm + g4
-                v3 = t[0, j - 1, k, 0, m - 1] + wg2 + g4 + sjm
-                v4 = t[0, j - 1, k - 1, 0, m] + wg2 + sjk + g4
-                v5 = t[0, j, k, 0, m - 1] + wg + g3
-                v6 = t[0, j, k - 1, 0, m] + wg + g3
-                v7 = t[0, j - 1, k, 0, m] + wg + g3
-                t[0, j, k, 0, m] = min(v1, v2, v3, v4, v5, v6, v7)
-    for j in range(1, n1):
-        for l in range(1, n3):
-            for m in range(1, n4):
-                sjl = score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]]
-                sjm = score[mapping[seq1[j - 1]], mapping[seq4[m - 1]]]
-                slm = score[mapping[seq3[l - 1]], mapping[seq4[m - 1]]]
-                v1 = t[0, j - 1, 0, l - 1, m - 1] + sjl + sjm + slm + wg3 + g3
-                v2 = t[0, j, 0, l - 1, m - 1] + wg2 + g4
-                v3 = t[0, j - 1, 0, l, m - 1] + wg2 + g4 + sjm
-                v4 = t[0, j - 1, 0, l - 1, m] + wg2 + sjl + g4
-                v5 = t[0, j, 0, l, m - 1] + wg + g3
-                v6 = t[0, j, 0, l - 1, m] + wg + g3
-                v7 = t[0, j - 1, 0, l, m] + wg + g3
-                t[0, j, 0, l, m] = min(v1, v2, v3, v4, v5, v6, v7)
-    for k in range(1, n2):
-        for l in range(1, n3):
-            for m in range(1, n4):
-                skl = score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]]
-                skm = score[mapping[seq2[k - 1]], mapping[seq4[m - 1]]]
-                slm = score[mapping[seq3[l - 1]], mapping[seq4[m - 1]]]
-                v1 = t[0, 0, k - 1, l - 1, m - 1] + skl + skm + slm + wg3 + g3
-                v2 = t[0, 0, k, l - 1, m - 1] + wg2 + g4 + slm
-                v3 = t[0, 0, k - 1, l, m - 1] + wg2 + g4 + skm
-                v4 = t[0, 0, k - 1, l - 1, m] + wg2 + skl + g4
-                v5 = t[0, 0, k, l, m - 1] + wg + g3
-                v6 = t[0, 0, k, l - 1, m] + wg + g3
-                v7 = t[0, 0, k - 1, l, m] + wg + g3
-                t[0, 0, k, l, m] = min(v1, v2, v3, v4, v5, v6, v7)
-    for i in range(1, n0):
-        for j in range(1, n1):
-            for k in range(1, n2):
-                for l in range(1, n3):
-                    sij = score[mapping[seq0[i - 1]], mapping[seq1[j-1]]]
-                    sik = score[mapping[seq0[i - 1]], mapping[seq2[k-1]]]
-                    sil = score[mapping[seq0[i - 1]], mapping[seq3[l-1]]]
-                    sjk = score[mapping[seq1[j - 1]], mapping[seq2[k - 1]]]
-                    sjl = score[mapping[seq1[j - 1]], mapping[seq3[l-1]]]
-                    skl = score[mapping[seq2[k - 1]], mapping[seq3[l-1]]]
-                    v1 = t[i, j, k, l - 1, 0] + wg + g3
-                    v2 = t[i, j, k - 1, l, 0] + wg + g3
-                    v3 = t[i, j, k - 1, l - 1, 0] + wg2 + g4 + skl
-                    v4 = t[i, j - 1, k, l, 0] + wg + g3
-                    v5 = t[i, j - 1, k, l - 1, 0] + wg2 + sjl + g4
-                    v6 = t[i, j - 1, k - 1, l, 0] + wg2 + g4 + sjk
-                    v7 = t[i, j - 1, k - 1, l - 1, 0] + wg3 + sjk + sjl + g3 + skl
-                    v8 = t[i - 1, j, k, l, 0] + wg4
-                    v9 = t[i - 1, j, k, l - 1, 0] + wg3 + weight * sil + g3
-                    v10 = t[i - 1, j, k - 1, l, 0] + wg3 + weight * sik + g3
-                    v11 = t[i - 1, j, k - 1, l - 1, 0] + wg2 + weight * (sik + sil) + g4 + skl
-                    v12 = t[i - 1, j - 1, k, l, 0] + weight * sij + wg3 + g3
-                    v13 = t[i - 1, j - 1, k, l - 1, 0] + weight * (sij + sil) + wg2 + g4 + sjl
-                    v14 = t[i - 1, j - 1, k - 1, l, 0] + weight * (sij + sik) + wg2 + g4 + sjk
-                    v15 = t[i - 1, j - 1, k - 1, l - 1, 0] + weight * (sij + sik + sil) + wg + sjk +  sjl + skl + g3
-                    t[i, j, k, l, 0] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15)
-    for i in range(1, n0):
-        for j in range(1, n1):
-            for k in range(1, n2):
-                for m in range(1, n4):
-                    sij = score[mapping[seq0[i - 1]], mapping[seq1[j-1]]]
-                    sik = score[mapping[seq0[i - 1]], mapping[seq2[k-1]]]
-                    sim = score[mapping[seq0[i - 1]], mapping[seq4[m-1]]]
-                    sjk = score[mapping[seq1[j - 1]], mapping[seq2[k - 1]]]
-                    sjm = score[mapping[seq1[j - 1]], mapping[seq4[m-1]]]
-                    skm = score[mapping[seq2[k - 1]], mapping[seq4[m-1]]]
-                    v1 = t[i, j, k, 0, m - 1] + wg + g3
-                    v2 = t[i, j, k - 1, 0, m] + wg + g3
-                    v3 = t[i, j, k - 1, 0, m - 1] + wg2 + g4 + skm
-                    v4 = t[i, j - 1, k, 0, m] + wg + g3
-                    v5 = t[i, j - 1, k, 0, m - 1] + wg2 + sjm + g4
-                    v6 = t[i, j - 1, k - 1, 0, m] + wg2 + g4 + sjk
-                    v7 = t[i, j - 1, k - 1, 0, m - 1] + wg3 + sjk + sjm + g3 + skm
-                    v8 = t[i - 1, j, k, 0, m] + wg4
-                    v9 = t[i - 1, j, k, 0, m - 1] + wg3 + weight * sim + g3
-                    v10 = t[i - 1, j, k - 1, 0, m] + wg3 + weight * sik + g3
-                    v11 = t[i - 1, j, k - 1, 0, m - 1] + wg2 + weight * (sik + sim) + g4 + skm
-                    v12 = t[i - 1, j - 1, k, 0, m] + weight * sij + wg3 + g3
-                    v13 = t[i - 1, j - 1, k, 0, m - 1] + weight * (sij + sim) + wg2 + sjm + g4
-                    v14 = t[i - 1, j - 1, k - 1, 0, m] + weight * (sij + sik) + wg2 + g4 + sjk
-                    v15 = t[i - 1, j - 1, k - 1, 0, m - 1] + weight * (sij + sik + sim) + wg + sjk + sjm + skm + g3
-                    t[i, j, k, 0, m] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15)
-    for i in range(1, n0):
-        for j in range(1, n1):
-            for l in range(1, n3):
-                for m in range(1, n4):
-                    sij = score[mapping[seq0[i - 1]], mapping[seq1[j-1]]]
-                    sil = score[mapping[seq0[i - 1]], mapping[seq3[l-1]]]
-                    sim = score[mapping[seq0[i - 1]], mapping[seq4[m-1]]]
-                    sjl = score[mapping[seq1[j - 1]], mapping[seq3[l-1]]]
-                    sjm = score[mapping[seq1[j - 1]], mapping[seq4[m-1]]]
-                    slm = score[mapping[seq3[l - 1]], mapping[seq4[m - 1]]]
-                    v1 = t[i, j, 0, l, m - 1] + wg + g3
-                    v2 = t[i, j, 0, l - 1, m] + wg + g3
-                    v3 = t[i, j, 0, l - 1, m - 1] + wg2 + g4 + slm
-                    v4 = t[i, j - 1, 0, l, m] + wg + g3
-                    v5 = t[i, j - 1, 0, l, m - 1] + wg2 + sjm + g4
-                    v6 = t[i, j - 1, 0, l - 1, m] + wg2 + g4 + sjl
-                    v7 = t[i, j - 1, 0, l - 1, m - 1] + wg3 + sjl + g3 + sjm + slm
-                    v8 = t[i - 1, j, 0, l, m] + wg4
-                    v9 = t[i - 1, j, 0, l, m - 1] + wg3 + weight * sim + g3
-                    v10 = t[i - 1, j, 0, l - 1, m] + wg3 + weight * sil + g3
-                    v11 = t[i - 1, j, 0, l - 1, m - 1] + wg2 + weight * (sil + sim) + g4 + slm
-                    v12 = t[i - 1, j - 1, 0, l, m] + weight * sij + wg3 + g3
-                    v13 = t[i - 1, j - 1, 0, l, m - 1] + weight * (sij + sim) + wg2 + sjm + g4
-                    v14 = t[i - 1, j - 1, 0, l - 1, m] + weight * (sij + sil) + wg2 + g4 + sjl
-                    v15 = t[i - 1, j - 1, 0, l - 1, m - 1] + weight * (sij + sil + sim) + wg + sjl + sjm + slm + g3
-                    t[i, j, 0, l, m] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15)
-    for i in range(1, n0):
-        for k in range(1, n2):
-            for l in range(1, n3):
-                for m in range(1, n4):
-                    sik = score[mapping[seq0[i - 1]], mapping[seq2[k-1]]]
-                    sil = score[mapping[seq0[i - 1]], mapping[seq3[l-1]]]
-                    sim = score[mapping[seq0[i - 1]], mapping[seq4[m-1]]]
-                    skl = score[mapping[seq2[k - 1]], mapping[seq3[l-1]]]
-                    skm = score[mapping[seq2[k - 1]], mapping[seq4[m-1]]]
-                    slm = score[mapping[seq3[l - 1]], mapping[seq4[m - 1]]]
-                    v1 = t[i, 0, k, l, m - 1] + wg + g3
-                    v2 = t[i, 0, k, l - 1, m] + wg + g3
-                    v3 = t[i, 0, k, l - 1, m - 1] + wg2 + g4 + slm
-                    v4 = t[i, 0, k - 1, l, m] + wg + g3
-                    v5 = t[i, 0, k - 1, l, m - 1] + wg2 + skm + g4
-                    v6 = t[i, 0, k - 1, l - 1, m] + wg2 + g4 + skl
-                    v7 = t[i, 0, k - 1, l - 1, m - 1] + wg3 + skl + g3 + skm + slm
-                    v8 = t[i - 1, 0, k, l, m] + wg4
-                    v9 = t[i - 1, 0, k, l, m - 1] + wg3 + weight * sim + g3
-                    v10 = t[i - 1, 0, k, l - 1, m] + wg3 + weight * sil + g3
-                    v11 = t[i - 1, 0, k, l - 1, m - 1] + wg2 + weight * (sil + sim) + g4 + slm
-                    v12 = t[i - 1, 0, k - 1, l, m] + weight * sik + wg3 + g3
-                    v13 = t[i - 1, 0, k - 1, l, m - 1] + weight * (sik + sim) + wg2 + skm + g4
-                    v14 = t[i - 1, 0, k - 1, l - 1, m] + weight * (sik + sil) + wg2 + g4 + skl
-                    v15 = t[i - 1, 0, k - 1, l - 1, m - 1] + weight * (sik + sil + sim) + wg + skl + skm + slm + g3
-                    t[i, 0, k, l, m] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15)
-    for j in range(1, n1):
-        for k in range(1, n2):
-            for l in range(1, n3):
-                for m in range(1, n4):
-                    sjk = score[mapping[seq1[j - 1]], mapping[seq2[k - 1]]]
-                    sjl = score[mapping[seq1[j - 1]], mapping[seq3[l-1]]]
-                    sjm = score[mapping[seq1[j - 1]], mapping[seq4[m-1]]]
-                    skl = score[mapping[seq2[k - 1]], mapping[seq3[l-1]]]
-                    skm = score[mapping[seq2[k - 1]], mapping[seq4[m-1]]]
-                    slm = score[mapping[seq3[l - 1]], mapping[seq4[m - 1]]]
-                    v1 = t[0, j, k, l, m - 1] + wg + g3
-                    v2 = t[0, j, k, l - 1, m] + wg + g3
-                    v3 = t[0, j, k, l - 1, m - 1] + wg2 + g4 + slm
-                    v4 = t[0, j, k - 1, l, m] + wg + g3
-                    v5 = t[0, j, k - 1, l, m - 1] + wg2 + skm + g4
-                    v6 = t[0, j, k - 1, l - 1, m] + wg2 + g4 + skl
-                    v7 = t[0, j, k - 1, l - 1, m - 1] + wg3 + skl + slm + g3 + skm
-                    v8 = t[0, j - 1, k, l, m] + wg + g3
-                    v9 = t[0, j - 1, k, l, m - 1] + wg2 + sjm + g4
-                    v10 = t[0, j - 1, k, l - 1, m] + wg2 + sjl + g4
-                    v11 = t[0, j - 1, k, l - 1, m - 1] + wg3 + sjl + sjm + slm + g3
-                    v12 = t[0, j - 1, k - 1, l, m] + wg2 + g4 + sjk
-                    v13 = t[0, j - 1, k - 1, l, m - 1] + wg3 + sjk + sjm + skm + g3
-                    v14 = t[0, j - 1, k - 1, l - 1, m] + sjk + sjl + wg3 + g3 + skl
-                    v15 = t[0, j - 1, k - 1, l - 1, m - 1] + wg4 + sjk + sjl + sjm + skl + skm + slm
-                    t[0, j, k, l, m] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15)
-    for i in range(1, n0):
-        for j in range(1, n1):
-            for k in range(1, n2):
-                for l in range(1, n3):
-                    for m in range(1, n4):
-                        sij = score[mapping[seq0[i-1]], mapping[seq1[j-1]]]
-                        sik = score[mapping[seq0[i-1]], mapping[seq2[k-1]]]
-                        sil = score[mapping[seq0[i-1]], mapping[seq3[l-1]]]
-                        sim = score[mapping[seq0[i-1]], mapping[seq4[m-1]]]
-                        sjk = score[mapping[seq1[j-1]], mapping[seq2[k-1]]]
-                        sjl = score[mapping[seq1[j-1]], mapping[seq3[l-1]]]
-                        sjm = score[mapping[seq1[j-1]], mapping[seq4[m-1]]]
-                        skl = score[mapping[seq2[k-1]], mapping[seq3[l-1]]]
-                        skm = score[mapping[seq2[k-1]], mapping[seq4[m-1]]]
-                        slm = score[mapping[seq3[l-1]], mapping[seq4[m-1]]]
-                        v1 = t[i, j, k, l, m - 1] + wg + g3
-                        v2 = t[i, j, k, l - 1, m] + wg + g3
-                        v3 = t[i, j, k, l - 1, m - 1] + wg2 + g4 + slm
-                        v4 = t[i, j, k - 1, l, m] + wg + g3
-                        v5 = t[i, j, k - 1, l, m - 1] + wg2 + g4 + skm
-                        v6 = t[i, j, k - 1, l - 1, m] + wg2 + g4 + skl
-                        v7 = t[i, j, k - 1, l - 1, m - 1] + wg3 + g3 + skl + skm + slm
-                        v8 = t[i, j - 1, k, l, m] + wg + g3
-                        v9 = t[i, j - 1, k, l, m - 1] + wg2 + g4 + sjm
-                        v10 = t[i, j - 1, k, l - 1, m] + wg2 + sjl + g4
-                        v11 = t[i, j - 1, k, l - 1, m - 1] + wg3 + sjl + sjm + slm + g3
-                        v12 = t[i, j - 1, k - 1, l, m] + wg2 + sjk + g4
-                        v13 = t[i, j - 1, k - 1, l, m - 1] + wg3 + g3 + sjk + sjm + skm
-                        v14 = t[i, j - 1, k - 1, l - 1, m] + wg3 + sjk + sjl + g3 + skl
-                        v15 = t[i, j - 1, k - 1, l - 1, m - 1] + wg4 + sjk + sjl + sjm + skl + skm + slm
-                        v16 = t[i - 1, j, k, l, m] + wg4
-                        v17 = t[i - 1, j, k, l, m - 1] + wg3 + sim * weight + g3
-                        v18 = t[i - 1, j, k, l - 1, m] + wg3 + weight * sil + g3
-                        v19 = t[i - 1, j, k, l - 1, m - 1] + wg2 + weight * (sil + sim) + slm + g4
-                        v20 = t[i - 1, j, k - 1, l, m] + wg3 + weight * sik + g3
-                        v21 = t[i - 1, j, k - 1, l, m - 1] + wg2 + weight * (sik + sim) + g4 + skm
-                        v22 = t[i - 1, j, k - 1, l - 1, m] + wg2 + weight * (sik + sil) + g4 + skl
-                        v23 = t[i - 1, j, k - 1, l - 1, m - 1] + wg + weight * (sik + sil + sim) + g3 + skl + skm + slm
-                        v24 = t[i - 1, j - 1, k, l, m] + weight * sij + wg3 + g3
-                        v25 = t[i - 1, j - 1, k, l, m - 1] + weight * (sij + sim) + wg2 + g4 + sjm
-                        v26 = t[i - 1, j - 1, k, l - 1, m] + weight * (sij + sil) + wg2 + sjl + g4
-                        v27 = t[i - 1, j - 1, k, l - 1, m - 1] + weight * (sij + sil + sim) + wg + sjl + sjm + slm + g3
-                        v28 = t[i - 1, j - 1, k - 1, l, m] + weight * (sij + sik) + wg2 + g4 + sjk
-                        v29 = t[i - 1, j - 1, k - 1, l, m - 1] + weight * (sij + sik + sim) + wg + g3 + sjk + sjm + skm
-                        v30 = t[i - 1, j - 1, k - 1, l - 1, m] + weight * (sij + sik + sil) + wg + sjk + sjl + g3 + skl
-                        v31 = t[i - 1, j - 1, k - 1, l - 1, m - 1] + weight * (sij + sik + sil + sim) + sjk + sjl + sjm + skl + skm + slm
-                        t[i, j, k, l, m] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15, v16, v17, v18, v19, v20, v21, v22, v23, v24, v25, v26, v27, v28, v29, v30, v31)
-    return t
+    scheme = scheme or default_scheme
+    d = len(seqs)
+    sizes = [len(s) + 1 for s in seqs]
+    gap_costs = weight * scheme.move_costs[d][:, 0] + scheme.move_costs[d][:, 1]
+    pair_costs = {(a, b): scheme.cost_matrix(seqs[a], seqs[b]) * (weight if a == 0 else 1)
+                  for a, b in combinations(range(d), 2)}
 
+    # the moves whose first advancing sequence is lo, as (mask, the other advancing sequences, cost of the move
+    # that does not depend on the position in sequence lo), the cost broadcasting over the slab over lo+1..d-1
+    moves = []
+    for lo in range(d):
+        moves.append([])
+        for rest in range(1 << (d - lo - 1)):
+            mask = (1 << lo) | (rest << (lo + 1))
+            others = [a for a in range(lo + 1, d) if mask >> a & 1]
+            cost = gap_costs[mask]
+            for a, b in combinations(others, 2):
+                shape = [1] * (d - lo - 1)
+                shape[a - lo - 1], shape[b - lo - 1] = sizes[a] - 1, sizes[b] - 1
+                cost = cost + pair_costs[(a, b)].reshape(shape)
+            moves[lo].append((mask, others, cost))
 
-def dynamic_table_5D_2l_star(seq0, seq1, seq2, seq3, seq4, weight=1):
-    """
-    return the dynamic table for 5 sequences, based on the graph configuration of (2l-1)-star.
-    seq0 is the center string, (seq1, seq2) and (seq3, seq4) were in the same l-clique.
-    """
-    n0, n1, n2, n3, n4 = len(seq0) + 1, len(seq1) + 1, len(seq2) + 1, len(seq3) + 1, len(seq4) + 1
-    t = np.zeros([n0, n1, n2, n3, n4])
-    wg = weight * gap
-    wg2, wg3, wg4 = wg * 2, wg * 3, wg * 4
-    g2, g4 = gap * 2, gap * 4
-    for i in range(1, n0):
-        t[i, 0, 0, 0, 0] = t[i - 1, 0, 0, 0, 0] + wg4
-    for j in range(1, n1):
-        t[0, j, 0, 0, 0] = t[0, j - 1, 0, 0, 0] + g2 + wg
-    for k in range(1, n2):
-        t[0, 0, k, 0, 0] = t[0, 0, k - 1, 0, 0] + g2 + wg
-    for l in range(1, n3):
-        t[0, 0, 0, l, 0] = t[0, 0, 0, l - 1, 0] + g2 + wg
-    for m in range(1, n4):
-        t[0, 0, 0, 0, m] = t[0, 0, 0, 0, m - 1] + g2 + wg
-    for i in range(1, n0):
-        for j in range(1, n1):
-            v1 = t[i - 1, j, 0, 0, 0] + wg4
-            v2 = t[i, j - 1, 0, 0, 0] + wg + g2
-            v3 = t[i - 1, j - 1, 0, 0, 0] + score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] * weight + wg2 + g2
-            t[i, j, 0, 0, 0] = min(v1, v2, v3)
-    for i in range(1, n0):
-        for k in range(1, n2):
-            v1 = t[i - 1, 0, k, 0, 0] + wg4
-            v2 = t[i, 0, k - 1, 0, 0] + wg + g2
-            v3 = t[i - 1, 0, k - 1, 0, 0] + score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] * weight + wg3 + g2
-            t[i, 0, k, 0, 0] = min(v1, v2, v3)
-    for i in range(1, n0):
-        for l in range(1, n3):
-            v1 = t[i - 1, 0, 0, l, 0] + wg4
-            v2 = t[i, 0, 0, l - 1, 0] + wg + g2
-            v3 = t[i - 1, 0, 0, l - 1, 0] + score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]] * weight + wg3 + g2
-            t[i, 0, 0, l, 0] = min(v1, v2, v3)
-    for i in range(1, n0):
-        for m in range(1, n4):
-            v1 = t[i - 1, 0, 0, 0, m] + wg4
-            v2 = t[i, 0, 0, 0, m - 1] + wg + g2
-            v3 = t[i - 1, 0, 0, 0, m - 1] + score[mapping[seq0[i - 1]], mapping[seq4[m - 1]]] * weight + wg3 + g2
-            t[i, 0, 0, 0, m] = min(v1, v2, v3)
-    for j in range(1, n1):
-        for k in range(1, n2):
-            v1 = t[0, j - 1, k, 0, 0] + wg + g2
-            v2 = t[0, j, k - 1, 0, 0] + wg + g2
-            v3 = t[0, j - 1, k - 1, 0, 0] + wg2 + g4
-            t[0, j, k, 0, 0] = min(v1, v2, v3)
-    for j in range(1, n1):
-        for l in range(1, n3):
-            v1 = t[0, j - 1, 0, l, 0] + wg + g2
-            v2 = t[0, j, 0, l - 1, 0] + wg + g2
-            v3 = t[0, j - 1, 0, l - 1, 0] + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + wg2 + g2
-            t[0, j, 0, l, 0] = min(v1, v2, v3)
-    for j in range(1, n1):
-        for m in range(1, n4):
-            v1 = t[0, j - 1, 0, 0, m] + wg + g2
-            v2 = t[0, j, 0, 0, m - 1] + wg + g2
-            v3 = t[0, j - 1, 0, 0, m - 1] + score[mapping[seq1[j - 1]], mapping[seq4[m - 1]]] + wg2 + g2
-            t[0, j, 0, 0, m] = min(v1, v2, v3)
-    for k in range(1, n2):
-        for l in range(1, n3):
-            v1 = t[0, 0, k - 1, l, 0] + wg + g2
-            v2 = t[0, 0, k, l - 1, 0] + wg + g2
-            v3 = t[0, 0, k - 1, l - 1, 0] + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]] + wg2 + g2
-            t[0, 0, k, l, 0] = min(v1, v2, v3)
-    for k in range(1, n2):
-        for m in range(1, n4):
-            v1 = t[0, 0, k - 1, 0, m] + wg + g2
-            v2 = t[0, 0, k, 0, m - 1] + wg + g2
-            v3 = t[0, 0, k - 1, 0, m - 1] + score[mapping[seq2[k - 1]], mapping[seq4[m - 1]]] + wg2 + g2
-            t[0, 0, k, 0, m] = min(v1, v2, v3)
-    for l in range(1, n3):
-        for m in range(1, n4):
-            v1 = t[0, 0, 0, l - 1, m] + wg + g2
-            v2 = t[0, 0, 0, l, m - 1] + wg + g2
-            v3 = t[0, 0, 0, l - 1, m - 1] + wg2 + g4
-            t[0, 0, 0, l, m] = min(v1, v2, v3)
-    for i in range(1, n0):
-        for j in range(1, n1):
-            for k in range(1, n2):
-                sij = score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]]
-                sik = score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]]
-                sjk = score[mapping[seq1[j - 1]], mapping[seq2[k - 1]]]
-                v1 = t[i - 1, j - 1, k - 1, 0, 0] + (sij + sik) * weight + sjk + wg2 + g4
-                v2 = t[i, j - 1, k - 1, 0, 0] + wg2 + sjk + g4
-                v3 = t[i - 1, j, k - 1, 0, 0] + wg3 + g2 + sik * weight
-                v4 = t[i - 1, j - 1, k, 0, 0] + sij * weight + wg3 + g2
-                v5 = t[i, j, k - 1, 0, 0] + wg + g2
-                v6 = t[i, j - 1, k, 0, 0] + wg + g2
-                v7 = t[i - 1, j, k, 0, 0] + wg4
-                t[i, j, k, 0, 0] = min(v1, v2, v3, v4, v5, v6, v7)
-    for i in range(1, n0):
-        for j in range(1, n1):
-            for l in range(1, n3):
-                sij = score[mapping[seq0[i - 1]], mapping[seq1[j-1]]]
-                sil = score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]]
-                sjl = score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]]
-                v1 = t[i - 1, j - 1, 0, l - 1, 0] + (sij + sil) * weight + sjl + wg2 + g2
-                v2 = t[i, j - 1, 0, l - 1, 0] + wg2 + sjl + g2
-                v3 = t[i - 1, j, 0, l - 1, 0] + wg3 + g2 + sil * weight
-                v4 = t[i - 1, j - 1, 0, l, 0] + sij * weight + wg3 + g2
-                v5 = t[i, j, 0, l - 1, 0] + wg + g2
-                v6 = t[i, j - 1, 0, l, 0] + wg + g2
-                v7 = t[i - 1, j, 0, l, 0] + wg4
-                t[i, j, 0, l, 0] = min(v1, v2, v3, v4, v5, v6, v7)
-    for i in range(1, n0):
-        for j in range(1, n1):
-            for m in range(1, n4):
-                sij = score[mapping[seq0[i - 1]], mapping[seq1[j-1]]]
-                sim = score[mapping[seq0[i - 1]], mapping[seq4[m-1]]]
-                sjm = score[mapping[seq1[j - 1]], mapping[seq4[m-1]]]
-                v1 = t[i - 1, j - 1, 0, 0, m - 1] + (sij + sim) * weight + sjm + wg2 + g2
-                v2 = t[i, j - 1, 0, 0, m - 1] + wg2 + sjm + g2
-                v3 = t[i - 1, j, 0, 0, m - 1] + wg3 + g2 + sim * weight
-                v4 = t[i - 1, j - 1, 0, 0, m] + sij * weight + wg3 + g2
-                v5 = t[i, j, 0, 0, m - 1] + wg + g2
-                v6 = t[i, j - 1, 0, 0, m] + wg + g2
-                v7 = t[i - 1, j, 0, 0, m] + wg4
-                t[i, j, 0, 0, m] = min(v1, v2, v3, v4, v5, v6, v7)
-    for i in range(1, n0):
-        for k in range(1, n2):
-            for l in range(1, n3):
-                sik = score[mapping[seq0[i - 1]], mapping[seq2[k-1]]]
-                sil = score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]]
-                skl = score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]]
-                v1 = t[i - 1, 0, k - 1, l - 1, 0] + (sik + sil) * weight + skl + wg2 + g2
-                v2 = t[i, 0, k - 1, l - 1, 0] + wg2 + skl + g2
-                v3 = t[i - 1, 0, k, l - 1, 0] + wg3 + g2 + sil * weight
-                v4 = t[i - 1, 0, k - 1, l, 0] + sik * weight + wg3 + g2
-                v5 = t[i, 0, k, l - 1, 0] + wg + g2
-                v6 = t[i, 0, k - 1, l, 0] + wg + g2
-                v7 = t[i - 1, 0, k, l, 0] + wg4
-                t[i, 0, k, l, 0] = min(v1, v2, v3, v4, v5, v6, v7)
-    for i in range(1, n0):
-        for k in range(1, n2):
-            for m in range(1, n4):
-                sik = score[mapping[seq0[i - 1]], mapping[seq2[k-1]]]
-                sim = score[mapping[seq0[i - 1]], mapping[seq4[m-1]]]
-                skm = score[mapping[seq2[k - 1]], mapping[seq4[m-1]]]
-                v1 = t[i - 1, 0, k - 1, 0, m - 1] + (sik + sim) * weight + skm + wg2 + g2
-                v2 = t[i, 0, k - 1, 0, m - 1] + wg2 + skm + g2
-                v3 = t[i - 1, 0, k, 0, m - 1] + wg3 + g2 + sim * weight
-                v4 = t[i - 1, 0, k - 1, 0, m] + sik * weight + wg3 + g2
-                v5 = t[i, 0, k, 0, m - 1] + wg + g2
-                v6 = t[i, 0, k - 1, 0, m] + wg + g2
-                v7 = t[i - 1, 0, k, 0, m] + wg4
-                t[i, 0, k, 0, m] = min(v1, v2, v3, v4, v5, v6, v7)
-    for i in range(1, n0):
-        for l in range(1, n3):
-            for m in range(1, n4):
-                sil = score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]]
-                sim = score[mapping[seq0[i - 1]], mapping[seq4[m-1]]]
-                slm = score[mapping[seq3[l - 1]], mapping[seq4[m-1]]]
-                v1 = t[i - 1, 0, 0, l - 1, m - 1] + (sil + sim) * weight + slm + wg2 + g4
-                v2 = t[i, 0, 0, l - 1, m - 1] + wg2 + slm + g4
-                v3 = t[i - 1, 0, 0, l, m - 1] + wg3 + g2 + sim * weight
-                v4 = t[i - 1, 0, 0, l - 1, m] + sil * weight + wg3 + g2
-                v5 = t[i, 0, 0, l, m - 1] + wg + g2
-                v6 = t[i, 0, 0, l - 1, m] + wg + g2
-                v7 = t[i - 1, 0, 0, l, m] + wg4
-                t[i, 0, 0, l, m] = min(v1, v2, v3, v4, v5, v6, v7)
-    for j in range(1, n1):
-        for k in range(1, n2):
-            for l in range(1, n3):
-                sjl = score[mapping[seq1[j - 1]], mapping[seq3[l-1]]]
-                skl = score[mapping[seq2[k - 1]], mapping[seq3[l-1]]]
-                v1 = t[0, j - 1, k - 1, l - 1, 0] + sjl + skl + wg3 + g2
-                v2 = t[0, j, k - 1, l - 1, 0] + wg2 + skl + g2
-                v3 = t[0, j - 1, k, l - 1, 0] + wg2 + g2 + sjl
-                v4 = t[0, j - 1, k - 1, l, 0] + wg2 + g4
-                v5 = t[0, j, k, l - 1, 0] + wg + g2
-                v6 = t[0, j, k - 1, l, 0] + wg + g2
-                v7 = t[0, j - 1, k, l, 0] + wg + g2
-                t[0, j, k, l, 0] = min(v1, v2, v3, v4, v5, v6, v7)
-    for j in range(1, n1):
-        for k in range(1, n2):
-            for m in range(1, n4):
-                sjm = score[mapping[seq1[j - 1]], mapping[seq4[m-1]]]
-                skm = score[mapping[seq2[k - 1]], mapping[seq4[m-1]]]
-                v1 = t[0, j - 1, k - 1, 0, m - 1] + sjm + skm + wg3 + g2
-                v2 = t[0, j, k - 1, 0, m - 1] + wg2 + skm + g2
-                v3 = t[0, j - 1, k, 0, m - 1] + wg2 + g2 + sjm
-                v4 = t[0, j - 1, k - 1, 0, m] + wg2 + g4
-                v5 = t[0, j, k, 0, m - 1] + wg + g2
-                v6 = t[0, j, k - 1, 0, m] + wg + g2
-                v7 = t[0, j - 1, k, 0, m] + wg + g2
-                t[0, j, k, 0, m] = min(v1, v2, v3, v4, v5, v6, v7)
-    for j in range(1, n1):
-        for l in range(1, n3):
-            for m in range(1, n4):
-                sjl = score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]]
-                sjm = score[mapping[seq1[j - 1]], mapping[seq4[m-1]]]
-                v1 = t[0, j - 1, 0, l - 1, m - 1] + sjl + sjm + wg3 + g2
-                v2 = t[0, j, 0, l - 1, m - 1] + wg2 + g4
-                v3 = t[0, j - 1, 0, l, m - 1] + wg2 + g2 + sjm
-                v4 = t[0, j - 1, 0, l - 1, m] + wg2 + sjl + g2
-                v5 = t[0, j, 0, l, m - 1] + wg + g2
-                v6 = t[0, j, 0, l - 1, m] + wg + g2
-                v7 = t[0, j - 1, 0, l, m] + wg + g2
-                t[0, j, 0, l, m] = min(v1, v2, v3, v4, v5, v6, v7)
-    for k in range(1, n2):
-        for l in range(1, n3):
-            for m in range(1, n4):
-                skl = score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]]
-                skm = score[mapping[seq2[k - 1]], mapping[seq4[m-1]]]
-                v1 = t[0, 0, k - 1, l - 1, m - 1] + skl + skm + wg3 + g2
-                v2 = t[0, 0, k, l - 1, m - 1] + wg2 + g4
-                v3 = t[0, 0, k - 1, l, m - 1] + wg2 + g2 + skm
-                v4 = t[0, 0, k - 1, l - 1, m] + wg2 + skl + g2
-                v5 = t[0, 0, k, l, m - 1] + wg + g2
-                v6 = t[0, 0, k, l - 1, m] + wg + g2
-                v7 = t[0, 0, k - 1, l, m] + wg + g2
-                t[0, 0, k, l, m] = min(v1, v2, v3, v4, v5, v6, v7)
-    for i in range(1, n0):
-        for j in range(1, n1):
-            for k in range(1, n2):
-                for l in range(1, n3):
-                    sij = score[mapping[seq0[i - 1]], mapping[seq1[j-1]]]
-                    sik = score[mapping[seq0[i - 1]], mapping[seq2[k-1]]]
-                    sil = score[mapping[seq0[i - 1]], mapping[seq3[l-1]]]
-                    sjl = score[mapping[seq1[j - 1]], mapping[seq3[l-1]]]
-                    skl = score[mapping[seq2[k - 1]], mapping[seq3[l-1]]]
-                    v1 = t[i, j, k, l - 1, 0] + wg + g2
-                    v2 = t[i, j, k - 1, l, 0] + wg + g2
-                    v3 = t[i, j, k - 1, l - 1, 0] + wg2 + g2 + skl
-                    v4 = t[i, j - 1, k, l, 0] + wg + g2
-                    v5 = t[i, j - 1, k, l - 1, 0] + wg2 + sjl + g2
-                    v6 = t[i, j - 1, k - 1, l, 0] + wg2 + g4
-                    v7 = t[i, j - 1, k - 1, l - 1, 0] + wg3 + sjl + g2 + skl
-                    v8 = t[i - 1, j, k, l, 0] + wg4
-                    v9 = t[i - 1, j, k, l - 1, 0] + wg3 + weight * sil + g2
-                    v10 = t[i - 1, j, k - 1, l, 0] + wg3 + weight * sik + g2
-                    v11 = t[i - 1, j, k - 1, l - 1, 0] + wg2 + weight * (sik + sil) + g2 + skl
-                    v12 = t[i - 1, j - 1, k, l, 0] + weight * sij + wg3 + g2
-                    v13 = t[i - 1, j - 1, k, l - 1, 0] + weight * (sij + sil) + wg2 + g2 + sjl
-                    v14 = t[i - 1, j - 1, k - 1, l, 0] + weight * (sij + sik) + wg2 + g4
-                    v15 = t[i - 1, j - 1, k - 1, l - 1, 0] + weight * (sij + sik + sil) + wg + sjl + skl + g2
-                    t[i, j, k, l, 0] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15)
-    for i in range(1, n0):
-        for j in range(1, n1):
-            for k in range(1, n2):
-                for m in range(1, n4):
-                    sij = score[mapping[seq0[i - 1]], mapping[seq1[j-1]]]
-                    sik = score[mapping[seq0[i - 1]], mapping[seq2[k-1]]]
-                    sim = score[mapping[seq0[i - 1]], mapping[seq4[m-1]]]
-                    sjm = score[mapping[seq1[j - 1]], mapping[seq4[m-1]]]
-                    skm = score[mapping[seq2[k - 1]], mapping[seq4[m-1]]]
-                    v1 = t[i, j, k, 0, m - 1] + wg + g2
-                    v2 = t[i, j, k - 1, 0, m] + wg + g2
-                    v3 = t[i, j, k - 1, 0, m - 1] + wg2 + g2 + skm
-                    v4 = t[i, j - 1, k, 0, m] + wg + g2
-                    v5 = t[i, j - 1, k, 0, m - 1] + wg2 + sjm + g2
-                    v6 = t[i, j - 1, k - 1, 0, m] + wg2 + g4
-                    v7 = t[i, j - 1, k - 1, 0, m - 1] + wg3 + sjm + g2 + skm
-                    v8 = t[i - 1, j, k, 0, m] + wg4
-                    v9 = t[i - 1, j, k, 0, m - 1] + wg3 + weight * sim + g2
-                    v10 = t[i - 1, j, k - 1, 0, m] + wg3 + weight * sik + g2
-                    v11 = t[i - 1, j, k - 1, 0, m - 1] + wg2 + weight * (sik + sim) + g2 + skm
-                    v12 = t[i - 1, j - 1, k, 0, m] + weight * sij + wg3 + g2
-                    v13 = t[i - 1, j - 1, k, 0, m - 1] + weight * (sij + sim) + wg2 + sjm + g2
-                    v14 = t[i - 1, j - 1, k - 1, 0, m] + weight * (sij + sik) + wg2 + g4
-                    v15 = t[i - 1, j - 1, k - 1, 0, m - 1] + weight * (sij + sik + sim) + wg + sjm + skm + g2
-                    t[i, j, k, 0, m] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15)
-    for i in range(1, n0):
-        for j in range(1, n1):
-            for l in range(1, n3):
-                for m in range(1, n4):
-                    sij = score[mapping[seq0[i - 1]], mapping[seq1[j-1]]]
-                    sil = score[mapping[seq0[i - 1]], mapping[seq3[l-1]]]
-                    sim = score[mapping[seq0[i - 1]], mapping[seq4[m-1]]]
-                    sjl = score[mapping[seq1[j - 1]], mapping[seq3[l-1]]]
-                    sjm = score[mapping[seq1[j - 1]], mapping[seq4[m-1]]]
-                    v1 = t[i, j, 0, l, m - 1] + wg + g2
-                    v2 = t[i, j, 0, l - 1, m] + wg + g2
-                    v3 = t[i, j, 0, l - 1, m - 1] + wg2 + g4
-                    v4 = t[i, j - 1, 0, l, m] + wg + g2
-                    v5 = t[i, j - 1, 0, l, m - 1] + wg2 + sjm + g2
-                    v6 = t[i, j - 1, 0, l - 1, m] + wg2 + g2 + sjl
-                    v7 = t[i, j - 1, 0, l - 1, m - 1] + wg3 + sjl + g2 + sjm
-                    v8 = t[i - 1, j, 0, l, m] + wg4
-                    v9 = t[i - 1, j, 0, l, m - 1] + wg3 + weight * sim + g2
-                    v10 = t[i - 1, j, 0, l - 1, m] + wg3 + weight * sil + g2
-                    v11 = t[i - 1, j, 0, l - 1, m - 1] + wg2 + weight * (sil + sim) + g4
-                    v12 = t[i - 1, j - 1, 0, l, m] + weight * sij + wg3 + g2
-                    v13 = t[i - 1, j - 1, 0, l, m - 1] + weight * (sij + sim) + wg2 + sjm + g2
-                    v14 = t[i - 1, j - 1, 0, l - 1, m] + weight * (sij + sil) + wg2 + g2 + sjl
-                    v15 = t[i - 1, j - 1, 0, l - 1, m - 1] + weight * (sij + sil + sim) + wg + sjl + sjm + g2
-                    t[i, j, 0, l, m] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15)
-    for i in range(1, n0):
-        for k in range(1, n2):
-            for l in range(1, n3):
-                for m in range(1, n4):
-                    sik = score[mapping[seq0[i - 1]], mapping[seq2[k-1]]]
-                    sil = score[mapping[seq0[i - 1]], mapping[seq3[l-1]]]
-                    sim = score[mapping[seq0[i - 1]], mapping[seq4[m-1]]]
-                    skl = score[mapping[seq2[k - 1]], mapping[seq3[l-1]]]
-                    skm = score[mapping[seq2[k - 1]], mapping[seq4[m-1]]]
-                    v1 = t[i, 0, k, l, m - 1] + wg + g2
-                    v2 = t[i, 0, k, l - 1, m] + wg + g2
-                    v3 = t[i, 0, k, l - 1, m - 1] + wg2 + g4
-                    v4 = t[i, 0, k - 1, l, m] + wg + g2
-                    v5 = t[i, 0, k - 1, l, m - 1] + wg2 + skm + g2
-                    v6 = t[i, 0, k - 1, l - 1, m] + wg2 + g2 + skl
-                    v7 = t[i, 0, k - 1, l - 1, m - 1] + wg3 + skl + g2 + skm
-                    v8 = t[i - 1, 0, k, l, m] + wg4
-                    v9 = t[i - 1, 0, k, l, m - 1] + wg3 + weight * sim + g2
-                    v10 = t[i - 1, 0, k, l - 1, m] + wg3 + weight * sil + g2
-                    v11 = t[i - 1, 0, k, l - 1, m - 1] + wg2 + weight * (sil + sim) + g4
-                    v12 = t[i - 1, 0, k - 1, l, m] + weight * sik + wg3 + g2
-                    v13 = t[i - 1, 0, k - 1, l, m - 1] + weight * (sik + sim) + wg2 + skm + g2
-                    v14 = t[i - 1, 0, k - 1, l - 1, m] + weight * (sik + sil) + wg2 + g2 + skl
-                    v15 = t[i - 1, 0, k - 1, l - 1, m - 1] + weight * (sik + sil + sim) + wg + skl + skm + g2
-                    t[i, 0, k, l, m] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15)
-    for j in range(1, n1):
-        for k in range(1, n2):
-            for l in range(1, n3):
-                for m in range(1, n4):
-                    sjl = score[mapping[seq1[j - 1]], mapping[seq3[l-1]]]
-                    sjm = score[mapping[seq1[j - 1]], mapping[seq4[m-1]]]
-                    skl = score[mapping[seq2[k - 1]], mapping[seq3[l-1]]]
-                    skm = score[mapping[seq2[k - 1]], mapping[seq4[m-1]]]
-                    v1 = t[0, j, k, l, m - 1] + wg + g2
-                    v2 = t[0, j, k, l - 1, m] + wg + g2
-                    v3 = t[0, j, k, l - 1, m - 1] + wg2 + g4
-                    v4 = t[0, j, k - 1, l, m] + wg + g2
-                    v5 = t[0, j, k - 1, l, m - 1] + wg2 + skm + g2
-                    v6 = t[0, j, k - 1, l - 1, m] + wg2 + g2 + skl
-                    v7 = t[0, j, k - 1, l - 1, m - 1] + wg3 + skl + g2 + skm
-                    v8 = t[0, j - 1, k, l, m] + wg + g2
-                    v9 = t[0, j - 1, k, l, m - 1] + wg2 + sjm + g2
-                    v10 = t[0, j - 1, k, l - 1, m] + wg2 + sjl + g2
-                    v11 = t[0, j - 1, k, l - 1, m - 1] + wg3 + sjl + sjm + g2
-                    v12 = t[0, j - 1, k - 1, l, m] + wg2 + g4
-                    v13 = t[0, j - 1, k - 1, l, m - 1] + wg3 + sjm + skm + g2
-                    v14 = t[0, j - 1, k - 1, l - 1, m] + sjl + wg3 + g2 + skl
-                    v15 = t[0, j - 1, k - 1, l - 1, m - 1] + wg4 + sjl + sjm + skl + skm
-                    t[0, j, k, l, m] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15)
-    for i in range(1, n0):
-        for j in range(1, n1):
-            for k in range(1, n2):
-                for l in range(1, n3):
-                    for m in range(1, n4):
-                        sij = score[mapping[seq0[i-1]], mapping[seq1[j-1]]]
-                        sik = score[mapping[seq0[i-1]], mapping[seq2[k-1]]]
-                        sil = score[mapping[seq0[i-1]], mapping[seq3[l-1]]]
-                        sim = score[mapping[seq0[i-1]], mapping[seq4[m-1]]]
-                        sjl = score[mapping[seq1[j-1]], mapping[seq3[l-1]]]
-                        sjm = score[mapping[seq1[j-1]], mapping[seq4[m-1]]]
-                        skl = score[mapping[seq2[k-1]], mapping[seq3[l-1]]]
-                        skm = score[mapping[seq2[k-1]], mapping[seq4[m-1]]]
-                        v1 = t[i, j, k, l, m - 1] + wg + g2
-                        v2 = t[i, j, k, l - 1, m] + wg + g2
-                        v3 = t[i, j, k, l - 1, m - 1] + wg2 + g4
-                        v4 = t[i, j, k - 1, l, m] + wg + g2
-                        v5 = t[i, j, k - 1, l, m - 1] + wg2 + g2 + skm
-                        v6 = t[i, j, k - 1, l - 1, m] + wg2 + g2 + skl
-                        v7 = t[i, j, k - 1, l - 1, m - 1] + wg3 + g2 + skl + skm
-                        v8 = t[i, j - 1, k, l, m] + wg + g2
-                        v9 = t[i, j - 1, k, l, m - 1] + wg2 + g2 + sjm
-                        v10 = t[i, j - 1, k, l - 1, m] + wg2 + sjl + g2
-                        v11 = t[i, j - 1, k, l - 1, m - 1] + wg3 + sjl + sjm + g2
-                        v12 = t[i, j - 1, k - 1, l, m] + wg2 + g4
-                        v13 = t[i, j - 1, k - 1, l, m - 1] + wg3 + g2 + sjm + skm
-                        v14 = t[i, j - 1, k - 1, l - 1, m] + wg3 + sjl + g2 + skl
-                        v15 = t[i, j - 1, k - 1, l - 1, m - 1] + wg4 + sjl + sjm + skl + skm
-                        v16 = t[i - 1, j, k, l, m] + wg4
-                        v17 = t[i - 1, j, k, l, m - 1] + wg3 + sim * weight + g2
-                        v18 = t[i - 1, j, k, l - 1, m] + wg3 + weight * sil + g2
-                        v19 = t[i - 1, j, k, l - 1, m - 1] + wg2 + weight * (sil + sim) + g4
-                        v20 = t[i - 1, j, k - 1, l, m] + wg3 + weight * sik + g2
-                        v21 = t[i - 1, j, k - 1, l, m - 1] + wg2 + weight * (sik + sim) + g2 + skm
-                        v22 = t[i - 1, j, k - 1, l - 1, m] + wg2 + weight * (sik + sil) + g2 + skl
-                        v23 = t[i - 1, j, k - 1, l - 1, m - 1] + wg + weight * (sik + sil + sim) + g2 + skl + skm
-                        v24 = t[i - 1, j - 1, k, l, m] + weight * sij + wg3 + g2
-                        v25 = t[i - 1, j - 1, k, l, m - 1] + weight * (sij + sim) + wg2 + g2 + sjm
-                        v26 = t[i - 1, j - 1, k, l - 1, m] + weight * (sij + sil) + wg2 + sjl + g2
-                        v27 = t[i - 1, j - 1, k, l - 1, m - 1] + weight * (sij + sil + sim) + wg + sjl + sjm + g2
-                        v28 = t[i - 1, j - 1, k - 1, l, m] + weight * (sij + sik) + wg2 + g4
-                        v29 = t[i - 1, j - 1, k - 1, l, m - 1] + weight * (sij + sik + sim) + wg + g2 + sjm + skm
-                        v30 = t[i - 1, j - 1, k - 1, l - 1, m] + weight * (sij + sik + sil) + wg + sjl + g2 + skl
-                        v31 = t[i - 1, j - 1, k - 1, l - 1, m - 1] + weight * (sij + sik + sil + sim) + sjl + sjm + skl + skm
-                        t[i, j, k, l, m] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15, v16, v17, v18, v19, v20, v21, v22, v23, v24, v25, v26, v27, v28, v29, v30, v31)
-    return t
+    def relax(e, prev, lo, x):
+        """lower e, the values of slab x over lo+1..d-1, by the moves from slab x-1 advancing sequence lo"""
+        for mask, others, cost in moves[lo]:
+            target = tuple(slice(1, None) if a in others else slice(None) for a in range(lo + 1, d))
+            source = tuple(slice(None, -1) if a in others else slice(None) for a in range(lo + 1, d))
+            for b in others:
+                shape = [1] * (d - lo - 1)
+                shape[b - lo - 1] = sizes[b] - 1
+                cost = cost + pair_costs[(lo, b)][x - 1].reshape(shape)
+            np.minimum(e[target], prev[source] + cost, out=e[target])
 
+    def fill(ext, lo):
+        """return the table over lo..d-1, given ext, the best values of its cells reached by moves of lower sequences"""
+        if lo == d - 1:
+            steps = gap_costs[1 << lo] * np.arange(sizes[lo])
+            return np.minimum.accumulate(ext - steps) + steps
+        t = np.empty_like(ext)
+        for x in range(sizes[lo]):
+            e = ext[x].copy()
+            if x > 0:
+                relax(e, t[x - 1], lo, x)
+            t[x] = fill(e, lo + 1)
+        return t
 
-def pairwise_alignment(seq0, seq1, weight=1):
+    prev = None
+    for x in range(sizes[0]):
+        e = np.full(sizes[1:], np.inf)
+        if x == 0:
+            e[(0,) * (d - 1)] = 0
+        else:
+            relax(e, prev, 0, x)
+        prev = fill(e, 1)
+    return prev[(-1,) * (d - 1)]
+
+
+def pairwise_alignment(seq0, seq1, weight=1, t=None, scheme=None):
     """return the optimal alignment between 2 sequences"""
-    # fill out the dynamic table t
-    t = dynamic_table_2D(seq0, seq1, weight)
+    scheme = scheme or default_scheme
+    gap = scheme.gap
+    # substitution costs between the pairs of sequences
+    c01 = scheme.costs(seq0, seq1)
+    # fill out the dynamic table t, unless it is given
+    if t is None:
+        t = dynamic_table_2D(seq0, seq1, weight, scheme)
     weighted_gap = weight * gap
     # compute an alignment
     i, j = len(seq0), len(seq1)
     a1, a2 = deque(), deque()
     while i > 0 and j > 0:
         v = t[i, j]
-        if v == t[i - 1, j - 1] + weight * score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]]:
+        if v == t[i - 1, j - 1] + weight * c01[i - 1][j - 1]:
             a1.appendleft(seq0[i - 1])
             a2.appendleft(seq1[j - 1])
             i -= 1
@@ -1074,7 +523,7 @@ def pairwise_alignment(seq0, seq1, weight=1):
             raise Exception("Backtracking Failed")
     while i > 0 or j > 0:
         v = t[i, j]
-        if i > 0 and j > 0 and v == t[i - 1, j - 1] + weight * score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]]:
+        if i > 0 and j > 0 and v == t[i - 1, j - 1] + weight * c01[i - 1][j - 1]:
             a1.appendleft(seq0[i - 1])
             a2.appendleft(seq1[j - 1])
             i -= 1
@@ -1092,19 +541,24 @@ def pairwise_alignment(seq0, seq1, weight=1):
     return a1, a2
 
 
-def three_exact_alignment(seq0, seq1, seq2, weight=1):
+def three_exact_alignment(seq0, seq1, seq2, weight=1, t=None, scheme=None):
     """return the optimal alignment between 3 sequences"""
-    # fill out the dynamic table t
-    t = dynamic_table_3D(seq0, seq1, seq2, weight)
+    scheme = scheme or default_scheme
+    gap = scheme.gap
+    # substitution costs between the pairs of sequences
+    c01, c02, c12 = scheme.costs(seq0, seq1), scheme.costs(seq0, seq2), scheme.costs(seq1, seq2)
+    # fill out the dynamic table t, unless it is given
+    if t is None:
+        t = dynamic_table_3D(seq0, seq1, seq2, weight, scheme)
     weighted_gap = weight * gap
     # compute an alignment
     i, j, k = len(seq0), len(seq1), len(seq2)
     a1, a2, a3 = deque(), deque(), deque()
     while i > 0 and j > 0 and k > 0:
         v = t[i, j, k]
-        sij = score[mapping[seq0[i-1]], mapping[seq1[j-1]]]
-        sik = score[mapping[seq0[i-1]], mapping[seq2[k-1]]]
-        sjk = score[mapping[seq1[j-1]], mapping[seq2[k-1]]]
+        sij = c01[i-1][j-1]
+        sik = c02[i-1][k-1]
+        sjk = c12[j-1][k-1]
         if v == t[i - 1, j - 1, k - 1] + sij * weight + sik * weight + sjk:
             a1.appendleft(seq0[i - 1])
             a2.appendleft(seq1[j - 1])
@@ -1144,9 +598,9 @@ def three_exact_alignment(seq0, seq1, seq2, weight=1):
             raise Exception("Backtracking Failed")
     while i > 0 or j > 0 or k > 0:
         v = t[i, j, k]
-        sij = score[mapping[seq0[i-1]], mapping[seq1[j-1]]]
-        sik = score[mapping[seq0[i-1]], mapping[seq2[k-1]]]
-        sjk = score[mapping[seq1[j-1]], mapping[seq2[k-1]]]
+        sij = c01[i-1][j-1]
+        sik = c02[i-1][k-1]
+        sjk = c12[j-1][k-1]
         if i > 0 and j > 0 and k > 0 and v == t[i - 1, j - 1, k - 1] + sij * weight + sik * weight + sjk:
             a1.appendleft(seq0[i - 1])
             a2.appendleft(seq1[j - 1])
@@ -1187,10 +641,16 @@ def three_exact_alignment(seq0, seq1, seq2, weight=1):
     return a1, a2, a3
 
 
-def four_exact_alignment(seq0, seq1, seq2, seq3, weight=1):
+def four_exact_alignment(seq0, seq1, seq2, seq3, weight=1, t=None, scheme=None):
     """return the optimal alignment between 4 sequences"""
-    # fill out the dynamic table t
-    t = dynamic_table_4D(seq0, seq1, seq2, seq3, weight)
+    scheme = scheme or default_scheme
+    gap = scheme.gap
+    # substitution costs between the pairs of sequences
+    c01, c02, c03 = scheme.costs(seq0, seq1), scheme.costs(seq0, seq2), scheme.costs(seq0, seq3)
+    c12, c13, c23 = scheme.costs(seq1, seq2), scheme.costs(seq1, seq3), scheme.costs(seq2, seq3)
+    # fill out the dynamic table t, unless it is given
+    if t is None:
+        t = dynamic_table_4D(seq0, seq1, seq2, seq3, weight, scheme)
     wg, wg2, wg3, g2 = weight * gap, weight * gap * 2, weight * gap * 3, gap * 2
     # compute an alignment
     i, j, k, l = len(seq0), len(seq1), len(seq2), len(seq3)
@@ -1207,7 +667,7 @@ def four_exact_alignment(seq0, seq1, seq2, seq3, weight=1):
             a1.appendleft('-')
             a2.appendleft(seq2[k-1]); k -= 1
             a3.appendleft('-')
-        elif v == t[i, j, k - 1, l - 1] + wg2 + g2 + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]]:
+        elif v == t[i, j, k - 1, l - 1] + wg2 + g2 + c23[k - 1][l - 1]:
             a0.appendleft('-')
             a1.appendleft('-')
             a2.appendleft(seq2[k-1]); k -= 1
@@ -1217,17 +677,17 @@ def four_exact_alignment(seq0, seq1, seq2, seq3, weight=1):
             a1.appendleft(seq1[j-1]); j -= 1
             a2.appendleft('-')
             a3.appendleft('-')
-        elif v == t[i, j - 1, k, l - 1] + wg2 + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + g2:
+        elif v == t[i, j - 1, k, l - 1] + wg2 + c13[j - 1][l - 1] + g2:
             a0.appendleft('-')
             a1.appendleft(seq1[j-1]); j -= 1
             a2.appendleft('-')
             a3.appendleft(seq3[l-1]); l -= 1
-        elif v == t[i, j - 1, k - 1, l] + wg2 + score[mapping[seq1[j - 1]], mapping[seq2[k - 1]]] + g2:
+        elif v == t[i, j - 1, k - 1, l] + wg2 + c12[j - 1][k - 1] + g2:
             a0.appendleft('-')
             a1.appendleft(seq1[j-1]); j -= 1
             a2.appendleft(seq2[k-1]); k -= 1
             a3.appendleft('-')
-        elif v == t[i, j - 1, k - 1, l - 1] + wg3 + score[mapping[seq1[j - 1]], mapping[seq2[k - 1]]] + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]]:
+        elif v == t[i, j - 1, k - 1, l - 1] + wg3 + c12[j - 1][k - 1] + c13[j - 1][l - 1] + c23[k - 1][l - 1]:
             a0.appendleft('-')
             a1.appendleft(seq1[j-1]); j -= 1
             a2.appendleft(seq2[k-1]); k -= 1
@@ -1237,37 +697,37 @@ def four_exact_alignment(seq0, seq1, seq2, seq3, weight=1):
             a1.appendleft('-')
             a2.appendleft('-')
             a3.appendleft('-')
-        elif v == t[i - 1, j, k, l - 1] + wg2 + weight * score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]] + g2:
+        elif v == t[i - 1, j, k, l - 1] + wg2 + weight * c03[i - 1][l - 1] + g2:
             a0.appendleft(seq0[i-1]); i -= 1
             a1.appendleft('-')
             a2.appendleft('-')
             a3.appendleft(seq3[l-1]); l -= 1
-        elif v == t[i - 1, j, k - 1, l] + wg2 + weight * score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] + g2:
+        elif v == t[i - 1, j, k - 1, l] + wg2 + weight * c02[i - 1][k - 1] + g2:
             a0.appendleft(seq0[i-1]); i -= 1
             a1.appendleft('-')
             a2.appendleft(seq2[k-1]); k -= 1
             a3.appendleft('-')
-        elif v == t[i - 1, j, k - 1, l - 1] + wg + weight * (score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] + score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]]) + g2 + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]]:
+        elif v == t[i - 1, j, k - 1, l - 1] + wg + weight * (c02[i - 1][k - 1] + c03[i - 1][l - 1]) + g2 + c23[k - 1][l - 1]:
             a0.appendleft(seq0[i-1]); i -= 1
             a1.appendleft('-')
             a2.appendleft(seq2[k-1]); k -= 1
             a3.appendleft(seq3[l-1]); l -= 1
-        elif v == t[i - 1, j - 1, k, l] + weight * score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + wg2 + g2:
+        elif v == t[i - 1, j - 1, k, l] + weight * c01[i - 1][j - 1] + wg2 + g2:
             a0.appendleft(seq0[i-1]); i -= 1
             a1.appendleft(seq1[j-1]); j -= 1
             a2.appendleft('-')
             a3.appendleft('-')
-        elif v == t[i - 1, j - 1, k, l - 1] + weight * (score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]]) + wg + g2 + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]]:
+        elif v == t[i - 1, j - 1, k, l - 1] + weight * (c01[i - 1][j - 1] + c03[i - 1][l - 1]) + wg + g2 + c13[j - 1][l - 1]:
             a0.appendleft(seq0[i-1]); i -= 1
             a1.appendleft(seq1[j-1]); j -= 1
             a2.appendleft('-')
             a3.appendleft(seq3[l-1]); l -= 1
-        elif v == t[i - 1, j - 1, k - 1, l] + weight * (score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]]) + wg + score[mapping[seq1[j - 1]], mapping[seq2[k - 1]]] + g2:
+        elif v == t[i - 1, j - 1, k - 1, l] + weight * (c01[i - 1][j - 1] + c02[i - 1][k - 1]) + wg + c12[j - 1][k - 1] + g2:
             a0.appendleft(seq0[i-1]); i -= 1
             a1.appendleft(seq1[j-1]); j -= 1
             a2.appendleft(seq2[k-1]); k -= 1
             a3.appendleft('-')
-        elif v == t[i - 1, j - 1, k - 1, l - 1] + weight * (score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] + score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]]) + score[mapping[seq1[j - 1]], mapping[seq2[k - 1]]] + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]]:
+        elif v == t[i - 1, j - 1, k - 1, l - 1] + weight * (c01[i - 1][j - 1] + c02[i - 1][k - 1] + c03[i - 1][l - 1]) + c12[j - 1][k - 1] + c13[j - 1][l - 1] + c23[k - 1][l - 1]:
             a0.appendleft(seq0[i-1]); i -= 1
             a1.appendleft(seq1[j-1]); j -= 1
             a2.appendleft(seq2[k-1]); k -= 1
@@ -1284,7 +744,7 @@ def four_exact_alignment(seq0, seq1, seq2, seq3, weight=1):
             a1.appendleft('-')
             a2.appendleft(seq2[k-1]); k -= 1
             a3.appendleft('-')
-        elif k > 0 and l > 0 and v == t[i, j, k - 1, l - 1] + wg2 + g2 + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]]:
+        elif k > 0 and l > 0 and v == t[i, j, k - 1, l - 1] + wg2 + g2 + c23[k - 1][l - 1]:
             a0.appendleft('-')
             a1.appendleft('-')
             a2.appendleft(seq2[k-1]); k -= 1
@@ -1294,17 +754,17 @@ def four_exact_alignment(seq0, seq1, seq2, seq3, weight=1):
             a1.appendleft(seq1[j-1]); j -= 1
             a2.appendleft('-')
             a3.appendleft('-')
-        elif j > 0 and l > 0 and v == t[i, j - 1, k, l - 1] + wg2 + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + g2:
+        elif j > 0 and l > 0 and v == t[i, j - 1, k, l - 1] + wg2 + c13[j - 1][l - 1] + g2:
             a0.appendleft('-')
             a1.appendleft(seq1[j-1]); j -= 1
             a2.appendleft('-')
             a3.appendleft(seq3[l-1]); l -= 1
-        elif j > 0 and k > 0 and v == t[i, j - 1, k - 1, l] + wg2 + score[mapping[seq1[j - 1]], mapping[seq2[k - 1]]] + g2:
+        elif j > 0 and k > 0 and v == t[i, j - 1, k - 1, l] + wg2 + c12[j - 1][k - 1] + g2:
             a0.appendleft('-')
             a1.appendleft(seq1[j-1]); j -= 1
             a2.appendleft(seq2[k-1]); k -= 1
             a3.appendleft('-')
-        elif j > 0 and k > 0 and l > 0 and v == t[i, j - 1, k - 1, l - 1] + wg3 + score[mapping[seq1[j - 1]], mapping[seq2[k - 1]]] + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]]:
+        elif j > 0 and k > 0 and l > 0 and v == t[i, j - 1, k - 1, l - 1] + wg3 + c12[j - 1][k - 1] + c13[j - 1][l - 1] + c23[k - 1][l - 1]:
             a0.appendleft('-')
             a1.appendleft(seq1[j-1]); j -= 1
             a2.appendleft(seq2[k-1]); k -= 1
@@ -1314,37 +774,37 @@ def four_exact_alignment(seq0, seq1, seq2, seq3, weight=1):
             a1.appendleft('-')
             a2.appendleft('-')
             a3.appendleft('-')
-        elif i > 0 and l > 0 and v == t[i - 1, j, k, l - 1] + wg2 + weight * score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]] + g2:
+        elif i > 0 and l > 0 and v == t[i - 1, j, k, l - 1] + wg2 + weight * c03[i - 1][l - 1] + g2:
             a0.appendleft(seq0[i-1]); i -= 1
             a1.appendleft('-')
             a2.appendleft('-')
             a3.appendleft(seq3[l-1]); l -= 1
-        elif i > 0 and k > 0 and v == t[i - 1, j, k - 1, l] + wg2 + weight * score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] + g2:
+        elif i > 0 and k > 0 and v == t[i - 1, j, k - 1, l] + wg2 + weight * c02[i - 1][k - 1] + g2:
             a0.appendleft(seq0[i-1]); i -= 1
             a1.appendleft('-')
             a2.appendleft(seq2[k-1]); k -= 1
             a3.appendleft('-')
-        elif i > 0 and k > 0 and l > 0 and v == t[i - 1, j, k - 1, l - 1] + wg + weight * (score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] + score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]]) + g2 + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]]:
+        elif i > 0 and k > 0 and l > 0 and v == t[i - 1, j, k - 1, l - 1] + wg + weight * (c02[i - 1][k - 1] + c03[i - 1][l - 1]) + g2 + c23[k - 1][l - 1]:
             a0.appendleft(seq0[i-1]); i -= 1
             a1.appendleft('-')
             a2.appendleft(seq2[k-1]); k -= 1
             a3.appendleft(seq3[l-1]); l -= 1
-        elif i > 0 and j > 0 and v == t[i - 1, j - 1, k, l] + weight * score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + wg2 + g2:
+        elif i > 0 and j > 0 and v == t[i - 1, j - 1, k, l] + weight * c01[i - 1][j - 1] + wg2 + g2:
             a0.appendleft(seq0[i-1]); i -= 1
             a1.appendleft(seq1[j-1]); j -= 1
             a2.appendleft('-')
             a3.appendleft('-')
-        elif i > 0 and j > 0 and l > 0 and v == t[i - 1, j - 1, k, l - 1] + weight * (score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]]) + wg + g2 + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]]:
+        elif i > 0 and j > 0 and l > 0 and v == t[i - 1, j - 1, k, l - 1] + weight * (c01[i - 1][j - 1] + c03[i - 1][l - 1]) + wg + g2 + c13[j - 1][l - 1]:
             a0.appendleft(seq0[i-1]); i -= 1
             a1.appendleft(seq1[j-1]); j -= 1
             a2.appendleft('-')
             a3.appendleft(seq3[l-1]); l -= 1
-        elif i > 0 and j > 0 and k > 0 and v == t[i - 1, j - 1, k - 1, l] + weight * (score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]]) + wg + score[mapping[seq1[j - 1]], mapping[seq2[k - 1]]] + g2:
+        elif i > 0 and j > 0 and k > 0 and v == t[i - 1, j - 1, k - 1, l] + weight * (c01[i - 1][j - 1] + c02[i - 1][k - 1]) + wg + c12[j - 1][k - 1] + g2:
             a0.appendleft(seq0[i-1]); i -= 1
             a1.appendleft(seq1[j-1]); j -= 1
             a2.appendleft(seq2[k-1]); k -= 1
             a3.appendleft('-')
-        elif i > 0 and j > 0 and k > 0 and l > 0 and v == t[i - 1, j - 1, k - 1, l - 1] + weight * (score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] + score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]]) + score[mapping[seq1[j - 1]], mapping[seq2[k - 1]]] + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]]:
+        elif i > 0 and j > 0 and k > 0 and l > 0 and v == t[i - 1, j - 1, k - 1, l - 1] + weight * (c01[i - 1][j - 1] + c02[i - 1][k - 1] + c03[i - 1][l - 1]) + c12[j - 1][k - 1] + c13[j - 1][l - 1] + c23[k - 1][l - 1]:
             a0.appendleft(seq0[i-1]); i -= 1
             a1.appendleft(seq1[j-1]); j -= 1
             a2.appendleft(seq2[k-1]); k -= 1
@@ -1352,1166 +812,221 @@ def four_exact_alignment(seq0, seq1, seq2, seq3, weight=1):
     return a0, a1, a2, a3
 
 
-def five_exact_alignment(seq0, seq1, seq2, seq3, seq4, weight=1):
-    """return the optimal alignment for 5 sequences, based on the graph configuration of l-star"""
-    # fill out the dynamic table
-    t = dynamic_table_5D(seq0, seq1, seq2, seq3, seq4, weight)
-    wg = weight * gap
-    wg2, wg3, wg4 = wg * 2, wg * 3, wg * 4
-    g2, g3, g4 = gap * 2, gap * 3, gap * 4
-    # compute an alignment
-    a0, a1, a2, a3, a4 = deque(), deque(), deque(), deque(), deque()
-    i, j, k, l, m = len(seq0), len(seq1), len(seq2), len(seq3), len(seq4)
-    while i > 0 and j > 0 and k > 0 and l > 0 and m > 0:
-        v = t[i, j, k, l, m]
-        if v == t[i, j, k, l, m - 1] + wg + g3:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft(seq4[m-1])
-            m -= 1
-        elif v == t[i, j, k, l - 1, m] + wg + g3:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft(seq3[l-1])
-            a4.appendleft('-')
-            l -= 1
-        elif v == t[i, j, k, l - 1, m - 1] + wg2 + g4 + score[mapping[seq3[l-1]], mapping[seq4[m-1]]]:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            l -= 1
-            m -= 1
-        elif v == t[i, j, k - 1, l, m] + wg + g3:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft(seq2[k-1])
-            a3.appendleft('-')
-            a4.appendleft('-')
-            k -= 1
-        elif v == t[i, j, k - 1, l, m - 1] + wg2 + g4 + score[mapping[seq2[k-1]], mapping[seq4[m-1]]]:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft(seq2[k-1])
-            a3.appendleft('-')
-            a4.appendleft(seq4[m-1])
-            k -= 1
-            m -= 1
-        elif v == t[i, j, k - 1, l - 1, m] + wg2 + g4 + score[mapping[seq2[k-1]], mapping[seq3[l-1]]]:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            k -= 1
-            l -= 1
-        elif v == t[i, j, k - 1, l - 1, m - 1] + wg3 + g3 + score[mapping[seq2[k-1]], mapping[seq3[l-1]]] + score[mapping[seq2[k-1]], mapping[seq4[m-1]]] + score[mapping[seq3[l-1]], mapping[seq4[m-1]]]:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            k -= 1
-            l -= 1
-            m -= 1
-        elif v == t[i, j - 1, k, l, m] + wg + g3:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft('-')
-            j -= 1
-        elif v == t[i, j - 1, k, l, m - 1] + wg2 + g4 + score[mapping[seq1[j-1]], mapping[seq4[m-1]]]:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            j -= 1
-            m -= 1
-        elif v == t[i, j - 1, k, l - 1, m] + wg2 + score[mapping[seq1[j-1]], mapping[seq3[l-1]]] + g4:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            j -= 1
-            l -= 1
-        elif v == t[i, j - 1, k, l - 1, m - 1] + wg3 + score[mapping[seq1[j-1]], mapping[seq3[l-1]]] + score[mapping[seq1[j-1]], mapping[seq4[m-1]]] + score[mapping[seq3[l-1]], mapping[seq4[m-1]]] + g3:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            j -= 1
-            l -= 1
-            m -= 1
-        elif v == t[i, j - 1, k - 1, l, m] + wg2 + score[mapping[seq1[j-1]], mapping[seq2[k-1]]] + g4:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft('-')
-            j -= 1
-            k -= 1
-        elif v == t[i, j - 1, k - 1, l, m - 1] + wg3 + g3 + score[mapping[seq1[j-1]], mapping[seq2[k-1]]] + score[mapping[seq1[j-1]], mapping[seq4[m-1]]] + score[mapping[seq2[k-1]], mapping[seq4[m-1]]]:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            j -= 1
-            k -= 1
-            m -= 1
-        elif v == t[i, j - 1, k - 1, l - 1, m] + wg3 + score[mapping[seq1[j-1]], mapping[seq2[k-1]]] + score[mapping[seq1[j-1]], mapping[seq3[l-1]]] + g3 + score[mapping[seq2[k-1]], mapping[seq3[l-1]]]:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            j -= 1
-            k -= 1
-            l -= 1
-        elif v == t[i, j - 1, k - 1, l - 1, m - 1] + wg4 + score[mapping[seq1[j-1]], mapping[seq2[k-1]]] + score[mapping[seq1[j-1]], mapping[seq3[l-1]]] + score[mapping[seq1[j-1]], mapping[seq4[m-1]]] + score[mapping[seq2[k-1]], mapping[seq3[l-1]]] + score[mapping[seq2[k-1]], mapping[seq4[m-1]]] + score[mapping[seq3[l-1]], mapping[seq4[m-1]]]:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            j -= 1
-            k -= 1
-            l -= 1
-            m -= 1
-        elif v == t[i - 1, j, k, l, m] + wg4:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft('-')
-            i -= 1
-        elif v == t[i - 1, j, k, l, m - 1] + wg3 + score[mapping[seq0[i-1]], mapping[seq4[m-1]]] * weight + g3:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            m -= 1
-        elif v == t[i - 1, j, k, l - 1, m] + wg3 + weight * score[mapping[seq0[i-1]], mapping[seq3[l-1]]] + g3:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            i -= 1
-            l -= 1
-        elif v == t[i - 1, j, k, l - 1, m - 1] + wg2 + weight * (score[mapping[seq0[i-1]], mapping[seq3[l-1]]] + score[mapping[seq0[i-1]], mapping[seq4[m-1]]]) + score[mapping[seq3[l-1]], mapping[seq4[m-1]]] + g4:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            l -= 1
-            m -= 1
-        elif v == t[i - 1, j, k - 1, l, m] + wg3 + weight * score[mapping[seq0[i-1]], mapping[seq2[k-1]]] + g3:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft('-')
-            i -= 1
-            k -= 1
-        elif v == t[i - 1, j, k - 1, l, m - 1] + wg2 + weight * (score[mapping[seq0[i-1]], mapping[seq2[k-1]]] + score[mapping[seq0[i-1]], mapping[seq4[m-1]]]) + g4 + score[mapping[seq2[k-1]], mapping[seq4[m-1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            k -= 1
-            m -= 1
-        elif v == t[i - 1, j, k - 1, l - 1, m] + wg2 + weight * (score[mapping[seq0[i-1]], mapping[seq2[k-1]]] + score[mapping[seq0[i-1]], mapping[seq3[l-1]]]) + g4 + score[mapping[seq2[k-1]], mapping[seq3[l-1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            i -= 1
-            k -= 1
-            l -= 1
-        elif v == t[i - 1, j, k - 1, l - 1, m - 1] + wg + weight * (score[mapping[seq0[i-1]], mapping[seq2[k-1]]] + score[mapping[seq0[i-1]], mapping[seq3[l-1]]] + score[mapping[seq0[i-1]], mapping[seq4[m-1]]]) + g3 + score[mapping[seq2[k-1]], mapping[seq3[l-1]]] + score[mapping[seq2[k-1]], mapping[seq4[m-1]]] + score[mapping[seq3[l-1]], mapping[seq4[m-1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            k -= 1
-            l -= 1
-            m -= 1
-        elif v == t[i - 1, j - 1, k, l, m] + weight * score[mapping[seq0[i-1]], mapping[seq1[j-1]]] + wg3 + g3:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft('-')
-            i -= 1
-            j -= 1
-        elif v == t[i - 1, j - 1, k, l, m - 1] + weight * (score[mapping[seq0[i-1]], mapping[seq1[j-1]]] + score[mapping[seq0[i-1]], mapping[seq4[m-1]]]) + wg2 + g4 + score[mapping[seq1[j-1]], mapping[seq4[m-1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            j -= 1
-            m -= 1
-        elif v == t[i - 1, j - 1, k, l - 1, m] + weight * (score[mapping[seq0[i-1]], mapping[seq1[j-1]]] + score[mapping[seq0[i-1]], mapping[seq3[l-1]]]) + wg2 + score[mapping[seq1[j-1]], mapping[seq3[l-1]]] + g4:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            i -= 1
-            j -= 1
-            l -= 1
-        elif v == t[i - 1, j - 1, k, l - 1, m - 1] + weight * (score[mapping[seq0[i-1]], mapping[seq1[j-1]]] + score[mapping[seq0[i-1]], mapping[seq3[l-1]]] + score[mapping[seq0[i-1]], mapping[seq4[m-1]]]) + wg + score[mapping[seq1[j-1]], mapping[seq3[l-1]]] + score[mapping[seq1[j-1]], mapping[seq4[m-1]]] + score[mapping[seq3[l-1]], mapping[seq4[m-1]]] + g3:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            j -= 1
-            l -= 1
-            m -= 1
-        elif v == t[i - 1, j - 1, k - 1, l, m] + weight * (score[mapping[seq0[i-1]], mapping[seq1[j-1]]] + score[mapping[seq0[i-1]], mapping[seq2[k-1]]]) + wg2 + g4 + score[mapping[seq1[j-1]], mapping[seq2[k-1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft('-')
-            i -= 1
-            j -= 1
-            k -= 1
-        elif v == t[i - 1, j - 1, k - 1, l, m - 1] + weight * (score[mapping[seq0[i-1]], mapping[seq1[j-1]]] + score[mapping[seq0[i-1]], mapping[seq2[k-1]]] + score[mapping[seq0[i-1]], mapping[seq4[m-1]]]) + wg + g3 + score[mapping[seq1[j-1]], mapping[seq2[k-1]]] + score[mapping[seq1[j-1]], mapping[seq4[m-1]]] + score[mapping[seq2[k-1]], mapping[seq4[m-1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            j -= 1
-            k -= 1
-            m -= 1
-        elif v == t[i - 1, j - 1, k - 1, l - 1, m] + weight * (score[mapping[seq0[i-1]], mapping[seq1[j-1]]] + score[mapping[seq0[i-1]], mapping[seq2[k-1]]] + score[mapping[seq0[i-1]], mapping[seq3[l-1]]]) + wg + score[mapping[seq1[j-1]], mapping[seq2[k-1]]] + score[mapping[seq1[j-1]], mapping[seq3[l-1]]] + g3 + score[mapping[seq2[k-1]], mapping[seq3[l-1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            i -= 1
-            j -= 1
-            k -= 1
-            l -= 1
-        elif v == t[i - 1, j - 1, k - 1, l - 1, m - 1] + weight * (score[mapping[seq0[i-1]], mapping[seq1[j-1]]] + score[mapping[seq0[i-1]], mapping[seq2[k-1]]] + score[mapping[seq0[i-1]], mapping[seq3[l-1]]] + score[mapping[seq0[i-1]], mapping[seq4[m-1]]]) + score[mapping[seq1[j-1]], mapping[seq2[k-1]]] + score[mapping[seq1[j-1]], mapping[seq3[l-1]]] + score[mapping[seq1[j-1]], mapping[seq4[m-1]]] + score[mapping[seq2[k-1]], mapping[seq3[l-1]]] + score[mapping[seq2[k-1]], mapping[seq4[m-1]]] + score[mapping[seq3[l-1]], mapping[seq4[m-1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            j -= 1
-            k -= 1
-            l -= 1
-            m -= 1
-        else:
-            print(f"v={v}")
-            print(f"i={i}, j={j}, k={k}, l={l}, m={m}")
-            raise Exception("Backtracking Failed")
-    while i > 0 or j > 0 or k > 0 or l > 0 or m > 0:
-        v = t[i, j, k, l, m]
-        if m > 0 and v == t[i, j, k, l, m - 1] + wg + g3:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft(seq4[m-1])
-            m -= 1
-        elif l > 0 and v == t[i, j, k, l - 1, m] + wg + g3:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft(seq3[l-1])
-            a4.appendleft('-')
-            l -= 1
-        elif l > 0 and m > 0 and v == t[i, j, k, l - 1, m - 1] + wg2 + g4 + score[mapping[seq3[l-m]], mapping[seq4[m-1]]]:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            l -= 1
-            m -= 1
-        elif k > 0 and v == t[i, j, k - 1, l, m] + wg + g3:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft(seq2[k-1])
-            a3.appendleft('-')
-            a4.appendleft('-')
-            k -= 1
-        elif k > 0 and m > 0 and v == t[i, j, k - 1, l, m - 1] + wg2 + g4 + score[mapping[seq2[k-1]], mapping[seq4[m-1]]]:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft(seq2[k-1])
-            a3.appendleft('-')
-            a4.appendleft(seq4[m-1])
-            k -= 1
-            m -= 1
-        elif k > 0 and l > 0 and v == t[i, j, k - 1, l - 1, m] + wg2 + g4 + score[mapping[seq2[k-1]], mapping[seq3[l-1]]]:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            k -= 1
-            l -= 1
-        elif k > 0 and l > 0 and m > 0 and v == t[i, j, k - 1, l - 1, m - 1] + wg3 + g3 + score[mapping[seq2[k-1]], mapping[seq3[l-1]]] + score[mapping[seq2[k-1]], mapping[seq4[m-1]]] + score[mapping[seq3[l-m]], mapping[seq4[m-1]]]:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            k -= 1
-            l -= 1
-            m -= 1
-        elif j > 0 and v == t[i, j - 1, k, l, m] + wg + g3:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft('-')
-            j -= 1
-        elif j > 0 and m > 0 and v == t[i, j - 1, k, l, m - 1] + wg2 + g4 + score[mapping[seq1[j-1]], mapping[seq4[m-1]]]:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            j -= 1
-            m -= 1
-        elif j > 0 and l > 0 and v == t[i, j - 1, k, l - 1, m] + wg2 + score[mapping[seq1[j-1]], mapping[seq3[l-1]]] + g4:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            j -= 1
-            l -= 1
-        elif j > 0 and l > 0 and m > 0 and v == t[i, j - 1, k, l - 1, m - 1] + wg3 + score[mapping[seq1[j-1]], mapping[seq3[l-1]]] + score[mapping[seq1[j-1]], mapping[seq4[m-1]]] + score[mapping[seq3[l-m]], mapping[seq4[m-1]]] + g3:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            j -= 1
-            l -= 1
-            m -= 1
-        elif j > 0 and k > 0 and v == t[i, j - 1, k - 1, l, m] + wg2 + score[mapping[seq1[j-1]], mapping[seq2[k-1]]] + g4:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft('-')
-            j -= 1
-            k -= 1
-        elif j > 0 and k > 0 and m > 0 and v == t[i, j - 1, k - 1, l, m - 1] + wg3 + g3 + score[mapping[seq1[j-1]], mapping[seq2[k-1]]] + score[mapping[seq1[j-1]], mapping[seq4[m-1]]] + score[mapping[seq2[k-1]], mapping[seq4[m-1]]]:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            j -= 1
-            k -= 1
-            m -= 1
-        elif j > 0 and k > 0 and l > 0 and v == t[i, j - 1, k - 1, l - 1, m] + wg3 + score[mapping[seq1[j-1]], mapping[seq2[k-1]]] + score[mapping[seq1[j-1]], mapping[seq3[l-1]]] + g3 + score[mapping[seq2[k-1]], mapping[seq3[l-1]]]:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            j -= 1
-            k -= 1
-            l -= 1
-        elif j > 0 and k > 0 and l > 0 and m > 0 and v == t[i, j - 1, k - 1, l - 1, m - 1] + wg4 + score[mapping[seq1[j-1]], mapping[seq2[k-1]]] + score[mapping[seq1[j-1]], mapping[seq3[l-1]]] + score[mapping[seq1[j-1]], mapping[seq4[m-1]]] + score[mapping[seq2[k-1]], mapping[seq3[l-1]]] + score[mapping[seq2[k-1]], mapping[seq4[m-1]]] + score[mapping[seq3[l-m]], mapping[seq4[m-1]]]:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            j -= 1
-            k -= 1
-            l -= 1
-            m -= 1
-        elif i > 0 and v == t[i - 1, j, k, l, m] + wg4:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft('-')
-            i -= 1
-        elif i > 0 and m > 0 and v == t[i - 1, j, k, l, m - 1] + wg3 + score[mapping[seq0[i-1]], mapping[seq4[m-1]]] * weight + g3:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            m -= 1
-        elif i > 0 and l > 0 and v == t[i - 1, j, k, l - 1, m] + wg3 + weight * score[mapping[seq0[i-1]], mapping[seq3[l-1]]] + g3:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            i -= 1
-            l -= 1
-        elif i > 0 and l > 0 and m > 0 and v == t[i - 1, j, k, l - 1, m - 1] + wg2 + weight * (score[mapping[seq0[i-1]], mapping[seq3[l-1]]] + score[mapping[seq0[i-1]], mapping[seq4[m-1]]]) + score[mapping[seq3[l-m]], mapping[seq4[m-1]]] + g4:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            l -= 1
-            m -= 1
-        elif i > 0 and k > 0 and v == t[i - 1, j, k - 1, l, m] + wg3 + weight * score[mapping[seq0[i-1]], mapping[seq2[k-1]]] + g3:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft('-')
-            i -= 1
-            k -= 1
-        elif i > 0 and k > 0 and m > 0 and v == t[i - 1, j, k - 1, l, m - 1] + wg2 + weight * (score[mapping[seq0[i-1]], mapping[seq2[k-1]]] + score[mapping[seq0[i-1]], mapping[seq4[m-1]]]) + g4 + score[mapping[seq2[k-1]], mapping[seq4[m-1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            k -= 1
-            m -= 1
-        elif i > 0 and k > 0 and l > 0 and v == t[i - 1, j, k - 1, l - 1, m] + wg2 + weight * (score[mapping[seq0[i-1]], mapping[seq2[k-1]]] + score[mapping[seq0[i-1]], mapping[seq3[l-1]]]) + g4 + score[mapping[seq2[k-1]], mapping[seq3[l-1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            i -= 1
-            k -= 1
-            l -= 1
-        elif i > 0 and k > 0 and l > 0 and m > 0 and v == t[i - 1, j, k - 1, l - 1, m - 1] + wg + weight * (score[mapping[seq0[i-1]], mapping[seq2[k-1]]] + score[mapping[seq0[i-1]], mapping[seq3[l-1]]] + score[mapping[seq0[i-1]], mapping[seq4[m-1]]]) + g3 + score[mapping[seq2[k-1]], mapping[seq3[l-1]]] + score[mapping[seq2[k-1]], mapping[seq4[m-1]]] + score[mapping[seq3[l-m]], mapping[seq4[m-1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            k -= 1
-            l -= 1
-            m -= 1
-        elif i > 0 and j > 0 and v == t[i - 1, j - 1, k, l, m] + weight * score[mapping[seq0[i-1]], mapping[seq1[j-1]]] + wg3 + g3:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft('-')
-            i -= 1
-            j -= 1
-        elif i > 0 and j > 0 and m > 0 and v == t[i - 1, j - 1, k, l, m - 1] + weight * (score[mapping[seq0[i-1]], mapping[seq1[j-1]]] + score[mapping[seq0[i-1]], mapping[seq4[m-1]]]) + wg2 + g4 + score[mapping[seq1[j-1]], mapping[seq4[m-1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            j -= 1
-            m -= 1
-        elif i > 0 and j > 0 and l > 0 and v == t[i - 1, j - 1, k, l - 1, m] + weight * (score[mapping[seq0[i-1]], mapping[seq1[j-1]]] + score[mapping[seq0[i-1]], mapping[seq3[l-1]]]) + wg2 + score[mapping[seq1[j-1]], mapping[seq3[l-1]]] + g4:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            i -= 1
-            j -= 1
-            l -= 1
-        elif i > 0 and j > 0 and l > 0 and m > 0 and v == t[i - 1, j - 1, k, l - 1, m - 1] + weight * (score[mapping[seq0[i-1]], mapping[seq1[j-1]]] + score[mapping[seq0[i-1]], mapping[seq3[l-1]]] + score[mapping[seq0[i-1]], mapping[seq4[m-1]]]) + wg + score[mapping[seq1[j-1]], mapping[seq3[l-1]]] + score[mapping[seq1[j-1]], mapping[seq4[m-1]]] + score[mapping[seq3[l-m]], mapping[seq4[m-1]]] + g3:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            j -= 1
-            l -= 1
-            m -= 1
-        elif i > 0 and j > 0 and k > 0 and v == t[i - 1, j - 1, k - 1, l, m] + weight * (score[mapping[seq0[i-1]], mapping[seq1[j-1]]] + score[mapping[seq0[i-1]], mapping[seq2[k-1]]]) + wg2 + g4 + score[mapping[seq1[j-1]], mapping[seq2[k-1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft('-')
-            i -= 1
-            j -= 1
-            k -= 1
-        elif i > 0 and j > 0 and k > 0 and m > 0 and v == t[i - 1, j - 1, k - 1, l, m - 1] + weight * (score[mapping[seq0[i-1]], mapping[seq1[j-1]]] + score[mapping[seq0[i-1]], mapping[seq2[k-1]]] + score[mapping[seq0[i-1]], mapping[seq4[m-1]]]) + wg + g3 + score[mapping[seq1[j-1]], mapping[seq2[k-1]]] + score[mapping[seq1[j-1]], mapping[seq4[m-1]]] + score[mapping[seq2[k-1]], mapping[seq4[m-1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            j -= 1
-            k -= 1
-            m -= 1
-        elif i > 0 and j > 0 and k > 0 and l > 0 and v == t[i - 1, j - 1, k - 1, l - 1, m] + weight * (score[mapping[seq0[i-1]], mapping[seq1[j-1]]] + score[mapping[seq0[i-1]], mapping[seq2[k-1]]] + score[mapping[seq0[i-1]], mapping[seq3[l-1]]]) + wg + score[mapping[seq1[j-1]], mapping[seq2[k-1]]] + score[mapping[seq1[j-1]], mapping[seq3[l-1]]] + g3 + score[mapping[seq2[k-1]], mapping[seq3[l-1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            i -= 1
-            j -= 1
-            k -= 1
-            l -= 1
-        elif v == t[i - 1, j - 1, k - 1, l - 1, m - 1] + weight * (score[mapping[seq0[i-1]], mapping[seq1[j-1]]] + score[mapping[seq0[i-1]], mapping[seq2[k-1]]] + score[mapping[seq0[i-1]], mapping[seq3[l-1]]] + score[mapping[seq0[i-1]], mapping[seq4[m-1]]]) + score[mapping[seq1[j-1]], mapping[seq2[k-1]]] + score[mapping[seq1[j-1]], mapping[seq3[l-1]]] + score[mapping[seq1[j-1]], mapping[seq4[m-1]]] + score[mapping[seq2[k-1]], mapping[seq3[l-1]]] + score[mapping[seq2[k-1]], mapping[seq4[m-1]]] + score[mapping[seq3[l-m]], mapping[seq4[m-1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            j -= 1
-            k -= 1
-            l -= 1
-            m -= 1
-        else:
-            print(f"i={i}, j={j}, k={k}, l={l}, m={m}")
-            raise Exception("Backtracking Failed")
-    return a0, a1, a2, a3, a4
-
-
-def five_exact_alignment_2l_star(seq0, seq1, seq2, seq3, seq4, weight):
-    """return the optimal alignment for 5 sequences, based on the graph configuration of (2l-1)-star"""
-    # fill out the dynamic table
-    t = dynamic_table_5D_2l_star(seq0, seq1, seq2, seq3, seq4, weight)
-    wg = weight * gap
-    wg2, wg3, wg4 = wg * 2, wg * 3, wg * 4
-    g2, g4 = gap * 2, gap * 4
-    # compute an alignment
-    a0, a1, a2, a3, a4 = deque(), deque(), deque(), deque(), deque()
-    i, j, k, l, m = len(seq0), len(seq1), len(seq2), len(seq3), len(seq4)
-    while i > 0 and j > 0 and k > 0 and l > 0 and m > 0:
-        v = t[i, j, k, l, m]
-        if v == t[i, j, k, l, m - 1] + wg + g2:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft(seq4[m-1])
-            m -= 1
-        elif v == t[i, j, k, l - 1, m] + wg + g2:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft(seq3[l-1])
-            a4.appendleft('-')
-            l -= 1
-        elif v == t[i, j, k, l - 1, m - 1] + wg2 + g4:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            l -= 1
-            m -= 1
-        elif v == t[i, j, k - 1, l, m] + wg + g2:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft(seq2[k-1])
-            a3.appendleft('-')
-            a4.appendleft('-')
-            k -= 1
-        elif v == t[i, j, k - 1, l, m - 1] + wg2 + g2 + score[mapping[seq2[k - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft(seq2[k-1])
-            a3.appendleft('-')
-            a4.appendleft(seq4[m-1])
-            k -= 1
-            m -= 1
-        elif v == t[i, j, k - 1, l - 1, m] + wg2 + g2 + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]]:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            k -= 1
-            l -= 1
-        elif v == t[i, j, k - 1, l - 1, m - 1] + wg3 + g2 + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]] + score[mapping[seq2[k - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            k -= 1
-            l -= 1
-            m -= 1
-        elif v == t[i, j - 1, k, l, m] + wg + g2:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft('-')
-            j -= 1
-        elif v == t[i, j - 1, k, l, m - 1] + wg2 + g2 + score[mapping[seq1[j - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            j -= 1
-            m -= 1
-        elif v == t[i, j - 1, k, l - 1, m] + wg2 + g2 + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]]:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            j -= 1
-            l -= 1
-        elif v == t[i, j - 1, k, l - 1, m - 1] + wg3 + g2 + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + score[mapping[seq1[j - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            j -= 1
-            l -= 1
-            m -= 1
-        elif v == t[i, j - 1, k - 1, l, m] + wg2 + g4:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft('-')
-            j -= 1
-            k -= 1
-        elif v == t[i, j - 1, k - 1, l, m - 1] + wg3 + g2 + score[mapping[seq1[j - 1]], mapping[seq4[m - 1]]] + score[mapping[seq2[k - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            j -= 1
-            k -= 1
-            m -= 1
-        elif v == t[i, j - 1, k - 1, l - 1, m] + wg3 + g2 + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]]:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            j -= 1
-            k -= 1
-            l -= 1
-        elif v == t[i, j - 1, k - 1, l - 1, m - 1] + wg4 + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + score[mapping[seq1[j - 1]], mapping[seq4[m - 1]]] + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]] + score[mapping[seq2[k - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            j -= 1
-            k -= 1
-            l -= 1
-            m -= 1
-        elif v == t[i - 1, j, k, l, m] + wg4:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft('-')
-            i -= 1
-        elif v == t[i - 1, j, k, l, m - 1] + wg3 + score[mapping[seq0[i - 1]], mapping[seq4[m - 1]]] * weight + g2:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            m -= 1
-        elif v == t[i - 1, j, k, l - 1, m] + wg3 + weight * score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]] + g2:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            i -= 1
-            l -= 1
-        elif v == t[i - 1, j, k, l - 1, m - 1] + wg2 + weight * (score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]] + score[mapping[seq0[i - 1]], mapping[seq4[m - 1]]]) + g4:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            l -= 1
-            m -= 1
-        elif v == t[i - 1, j, k - 1, l, m] + wg3 + weight * score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] + g2:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft('-')
-            i -= 1
-            k -= 1
-        elif v == t[i - 1, j, k - 1, l, m - 1] + wg2 + weight * (score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] + score[mapping[seq0[i - 1]], mapping[seq4[m - 1]]]) + g2 + score[mapping[seq2[k - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            k -= 1
-            m -= 1
-        elif v == t[i - 1, j, k - 1, l - 1, m] + wg2 + weight * (score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] + score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]]) + g2 + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            i -= 1
-            k -= 1
-            l -= 1
-        elif v == t[i - 1, j, k - 1, l - 1, m - 1] + wg + weight * (score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] + score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]] + score[mapping[seq0[i - 1]], mapping[seq4[m - 1]]]) + g2 + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]] + score[mapping[seq2[k - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            k -= 1
-            l -= 1
-            m -= 1
-        elif v == t[i - 1, j - 1, k, l, m] + weight * score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + wg3 + g2:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft('-')
-            i -= 1
-            j -= 1
-        elif v == t[i - 1, j - 1, k, l, m - 1] + weight * (score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + score[mapping[seq0[i - 1]], mapping[seq4[m - 1]]]) + wg2 + g2 + score[mapping[seq1[j - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            j -= 1
-            m -= 1
-        elif v == t[i - 1, j - 1, k, l - 1, m] + weight * (score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]]) + wg2 + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + g2:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            i -= 1
-            j -= 1
-            l -= 1
-        elif v == t[i - 1, j - 1, k, l - 1, m - 1] + weight * (score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]] + score[mapping[seq0[i - 1]], mapping[seq4[m - 1]]]) + wg + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + score[mapping[seq1[j - 1]], mapping[seq4[m - 1]]] + g2:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            j -= 1
-            l -= 1
-            m -= 1
-        elif v == t[i - 1, j - 1, k - 1, l, m] + weight * (score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]]) + wg2 + g4:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft('-')
-            i -= 1
-            j -= 1
-            k -= 1
-        elif v == t[i - 1, j - 1, k - 1, l, m - 1] + weight * (score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] + score[mapping[seq0[i - 1]], mapping[seq4[m - 1]]]) + wg + g2 + score[mapping[seq1[j - 1]], mapping[seq4[m - 1]]] + score[mapping[seq2[k - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            j -= 1
-            k -= 1
-            m -= 1
-        elif v == t[i - 1, j - 1, k - 1, l - 1, m] + weight * (score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] + score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]]) + wg + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + g2 + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            i -= 1
-            j -= 1
-            k -= 1
-            l -= 1
-        elif v == t[i - 1, j - 1, k - 1, l - 1, m - 1] + weight * (score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] + score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]] + score[mapping[seq0[i - 1]], mapping[seq4[m - 1]]]) + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + score[mapping[seq1[j - 1]], mapping[seq4[m - 1]]] + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]] + score[mapping[seq2[k - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            j -= 1
-            k -= 1
-            l -= 1
-            m -= 1
-        else:
-            print(f"i={i}, j={j}, k={k}, l={l}, m={m}")
-            raise Exception("Backtracking Fail")
-    while i > 0 or j > 0 or k > 0 or l > 0 or m > 0:
-        v = t[i, j, k, l, m]
-        if m > 0 and v == t[i, j, k, l, m - 1] + wg + g2:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft(seq4[m-1])
-            m -= 1
-        elif l > 0 and v == t[i, j, k, l - 1, m] + wg + g2:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft(seq3[l-1])
-            a4.appendleft('-')
-            l -= 1
-        elif l > 0 and m > 0 and v == t[i, j, k, l - 1, m - 1] + wg2 + g4:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            l -= 1
-            m -= 1
-        elif k > 0 and v == t[i, j, k - 1, l, m] + wg + g2:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft(seq2[k-1])
-            a3.appendleft('-')
-            a4.appendleft('-')
-            k -= 1
-        elif k > 0 and m > 0 and v == t[i, j, k - 1, l, m - 1] + wg2 + g2 + score[mapping[seq2[k - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft(seq2[k-1])
-            a3.appendleft('-')
-            a4.appendleft(seq4[m-1])
-            k -= 1
-            m -= 1
-        elif k > 0 and l > 0 and v == t[i, j, k - 1, l - 1, m] + wg2 + g2 + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]]:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            k -= 1
-            l -= 1
-        elif k > 0 and l > 0 and m > 0 and v == t[i, j, k - 1, l - 1, m - 1] + wg3 + g2 + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]] + score[mapping[seq2[k - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft('-')
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            k -= 1
-            l -= 1
-            m -= 1
-        elif j > 0 and v == t[i, j - 1, k, l, m] + wg + g2:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft('-')
-            j -= 1
-        elif j > 0 and m > 0 and v == t[i, j - 1, k, l, m - 1] + wg2 + g2 + score[mapping[seq1[j - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            j -= 1
-            m -= 1
-        elif j > 0 and l > 0 and v == t[i, j - 1, k, l - 1, m] + wg2 + g2 + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]]:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            j -= 1
-            l -= 1
-        elif j > 0 and l > 0 and m > 0 and v == t[i, j - 1, k, l - 1, m - 1] + wg3 + g2 + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + score[mapping[seq1[j - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            j -= 1
-            l -= 1
-            m -= 1
-        elif j > 0 and k > 0 and v == t[i, j - 1, k - 1, l, m] + wg2 + g4:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft('-')
-            j -= 1
-            k -= 1
-        elif j > 0 and k > 0 and m > 0 and v == t[i, j - 1, k - 1, l, m - 1] + wg3 + g2 + score[mapping[seq1[j - 1]], mapping[seq4[m - 1]]] + score[mapping[seq2[k - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            j -= 1
-            k -= 1
-            m -= 1
-        elif j > 0 and k > 0 and l > 0 and v == t[i, j - 1, k - 1, l - 1, m] + wg3 + g2 + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]]:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            j -= 1
-            k -= 1
-            l -= 1
-        elif j > 0 and k > 0 and l > 0 and m > 0 and v == t[i, j - 1, k - 1, l - 1, m - 1] + wg4 + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + score[mapping[seq1[j - 1]], mapping[seq4[m - 1]]] + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]] + score[mapping[seq2[k - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft('-')
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            j -= 1
-            k -= 1
-            l -= 1
-            m -= 1
-        elif i > 0 and v == t[i - 1, j, k, l, m] + wg4:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft('-')
-            i -= 1
-        elif i > 0 and m > 0 and v == t[i - 1, j, k, l, m - 1] + wg3 + score[mapping[seq0[i - 1]], mapping[seq4[m - 1]]] * weight + g2:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            m -= 1
-        elif i > 0 and l > 0 and v == t[i - 1, j, k, l - 1, m] + wg3 + weight * score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]] + g2:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            i -= 1
-            l -= 1
-        elif i > 0 and l > 0 and m > 0 and v == t[i - 1, j, k, l - 1, m - 1] + wg2 + weight * (score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]] + score[mapping[seq0[i - 1]], mapping[seq4[m - 1]]]) + g4:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            l -= 1
-            m -= 1
-        elif i > 0 and k > 0 and v == t[i - 1, j, k - 1, l, m] + wg3 + weight * score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] + g2:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft('-')
-            i -= 1
-            k -= 1
-        elif i > 0 and k > 0 and m > 0 and v == t[i - 1, j, k - 1, l, m - 1] + wg2 + weight * (score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] + score[mapping[seq0[i - 1]], mapping[seq4[m - 1]]]) + g2 + score[mapping[seq2[k - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            k -= 1
-            m -= 1
-        elif i > 0 and k > 0 and l > 0 and v == t[i - 1, j, k - 1, l - 1, m] + wg2 + weight * (score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] + score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]]) + g2 + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            i -= 1
-            k -= 1
-            l -= 1
-        elif i > 0 and k > 0 and l > 0 and m > 0 and v == t[i - 1, j, k - 1, l - 1, m - 1] + wg + weight * (score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] + score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]] + score[mapping[seq0[i - 1]], mapping[seq4[m - 1]]]) + g2 + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]] + score[mapping[seq2[k - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft('-')
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            k -= 1
-            l -= 1
-            m -= 1
-        elif i > 0 and j > 0 and v == t[i - 1, j - 1, k, l, m] + weight * score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + wg3 + g2:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft('-')
-            i -= 1
-            j -= 1
-        elif i > 0 and j > 0 and m > 0 and v == t[i - 1, j - 1, k, l, m - 1] + weight * (score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + score[mapping[seq0[i - 1]], mapping[seq4[m - 1]]]) + wg2 + g2 + score[mapping[seq1[j - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            j -= 1
-            m -= 1
-        elif i > 0 and j > 0 and l > 0 and v == t[i - 1, j - 1, k, l - 1, m] + weight * (score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]]) + wg2 + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + g2:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            i -= 1
-            j -= 1
-            l -= 1
-        elif i > 0 and j > 0 and l > 0 and m > 0 and v == t[i - 1, j - 1, k, l - 1, m - 1] + weight * (score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]] + score[mapping[seq0[i - 1]], mapping[seq4[m - 1]]]) + wg + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + score[mapping[seq1[j - 1]], mapping[seq4[m - 1]]] + g2:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft('-')
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            j -= 1
-            l -= 1
-            m -= 1
-        elif i > 0 and j > 0 and k > 0 and v == t[i - 1, j - 1, k - 1, l, m] + weight * (score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]]) + wg2 + g4:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft('-')
-            i -= 1
-            j -= 1
-            k -= 1
-        elif i > 0 and j > 0 and k > 0 and m > 0 and v == t[i - 1, j - 1, k - 1, l, m - 1] + weight * (score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] + score[mapping[seq0[i - 1]], mapping[seq4[m - 1]]]) + wg + g2 + score[mapping[seq1[j - 1]], mapping[seq4[m - 1]]] + score[mapping[seq2[k - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft('-')
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            j -= 1
-            k -= 1
-            m -= 1
-        elif i > 0 and j > 0 and k > 0 and l > 0 and v == t[i - 1, j - 1, k - 1, l - 1, m] + weight * (score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] + score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]]) + wg + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + g2 + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft('-')
-            i -= 1
-            j -= 1
-            k -= 1
-            l -= 1
-        elif v == t[i - 1, j - 1, k - 1, l - 1, m - 1] + weight * (score[mapping[seq0[i - 1]], mapping[seq1[j - 1]]] + score[mapping[seq0[i - 1]], mapping[seq2[k - 1]]] + score[mapping[seq0[i - 1]], mapping[seq3[l - 1]]] + score[mapping[seq0[i - 1]], mapping[seq4[m - 1]]]) + score[mapping[seq1[j - 1]], mapping[seq3[l - 1]]] + score[mapping[seq1[j - 1]], mapping[seq4[m - 1]]] + score[mapping[seq2[k - 1]], mapping[seq3[l - 1]]] + score[mapping[seq2[k - 1]], mapping[seq4[m - 1]]]:
-            a0.appendleft(seq0[i - 1])
-            a1.appendleft(seq1[j - 1])
-            a2.appendleft(seq2[k - 1])
-            a3.appendleft(seq3[l - 1])
-            a4.appendleft(seq4[m - 1])
-            i -= 1
-            j -= 1
-            k -= 1
-            l -= 1
-            m -= 1
-        else:
-            print(f"i={i}, j={j}, k={k}, l={l}, m={m}")
-            raise Exception("Backtracking Fail")
-    return a0, a1, a2, a3, a4
-
-
-def exact_alignment(seqs):
+def exact_alignment(seqs, scheme=None):
     """return an exact alignment of seqs"""
     if len(seqs) == 2:
-        return pairwise_alignment(*seqs)
+        return pairwise_alignment(*seqs, scheme=scheme)
     elif len(seqs) == 3:
-        return three_exact_alignment(*seqs)
+        return three_exact_alignment(*seqs, scheme=scheme)
     elif len(seqs) == 4:
-        return four_exact_alignment(*seqs)
+        return four_exact_alignment(*seqs, scheme=scheme)
     elif len(seqs) == 5:
-        return five_exact_alignment(*seqs)
+        from kernels_5d import five_exact_alignment
+        return five_exact_alignment(*seqs, scheme=scheme)
+
+
+def table_score(core, seqs, weight, scheme=None, rolling=True, mode=None):
+    """
+    return the last cell of the dynamic table of seqs filled out by the core function of a kernel, see run_kernel,
+    or, if that table is over the memory budget and rolling is true, the same score from dynamic_score.
+    mode is that of planner.plan_table, planned here if it is None
+    """
+    # planned once here, the kernel gets the mode
+    if mode is None and planner.small_table([len(s) + 1 for s in seqs]):
+        mode = planner.FULL
+    if mode is None:
+        mode, _ = planner.plan_table([len(s) for s in seqs], rolling, out_of_core=True)
+    if mode == planner.ROLLING:
+        return dynamic_score(seqs, weight, scheme)
+    return run_kernel(core, seqs, weight, scheme, mode)[(-1,) * len(seqs)]
+
+
+def _next_rows(t, costs, gap, gaps):
+    """
+    return the next rows of pairwise dynamic tables from their rows t, given the substitution costs of the
+    character of the next row against the other sequences. the gaps within a row are a running minimum
+    """
+    moves = np.empty_like(t)
+    moves[:, 0] = t[:, 0] + gap
+    moves[:, 1:] = np.minimum(t[:, 1:] + gap, t[:, :-1] + costs)
+    return np.minimum.accumulate(moves - gaps, axis=1) + gaps
+
+
+def prefix_trie(codes):
+    """
+    return the trie of encoded sequences, as nested [children, ends] lists: children maps a character to the node
+    of the prefix extended by it, ends are the sequences that are the prefix. and return the number of nodes
+    """
+    root, nodes = [{}, []], 1
+    for i, seq in enumerate(codes):
+        node = root
+        for x in seq.tolist():
+            if x not in node[0]:
+                node[0][x] = [{}, []]
+                nodes += 1
+            node = node[0][x]
+        node[1].append(i)
+    return root, nodes
+
 
+def trie_distance_matrix(seqs, partners=None, scheme=None):
+    """
+    return the matrix of the optimal pairwise alignment scores of seqs against partners, seqs by default. the
+    tables of a sequence against all partners are filled out at once, a row per character, and the sequences are
+    walked as a trie, so that the rows of a prefix shared by several sequences are computed once. the cost is the
+    number of nodes of the trie rather than the total length of seqs
+    """
+    scheme = scheme or default_scheme
+    partners = seqs if partners is None else partners
+    lengths = np.array([len(s) for s in partners], dtype=np.intp)
+    width = int(lengths.max(initial=0)) + 1
+    codes = np.zeros((len(partners), width), dtype=np.intp)
+    for j, s in enumerate(partners):
+        codes[j, :len(s)] = scheme.encode(s)
+    gaps = scheme.gap * np.arange(width, dtype=np.float64)
+    # substitution costs of every character of the alphabet against every partner
+    profiles = scheme.score[:, codes[:, :-1]]
+    columns = np.arange(len(partners))
+    distances = np.zeros((len(seqs), len(partners)))
+    root, _ = prefix_trie([scheme.encode(s) for s in seqs])
+    # the nodes left to visit with the rows of their parent, which are only kept while a child needs them
+    stack = [(root, None, None)]
+    while stack:
+        node, parent_rows, x = stack.pop()
+        if parent_rows is None:
+            rows = np.tile(gaps, (len(partners), 1))
+        else:
+            rows = _next_rows(parent_rows, profiles[x], scheme.gap, gaps)
+        instrument.count("trie_rows")
+        for i in node[1]:
+            distances[i] = rows[columns, lengths]
+        stack.extend((child, rows, x) for x, child in node[0].items())
+    return distances
+
+
+def pairwise_distance_matrix(seqs, scheme=None, trie=None):
+    """
+    return the matrix of the optimal pairwise alignment scores of seqs. the dynamic tables of all pairs are filled
+    out at once, row by row, or with trie by trie_distance_matrix. by default the trie is used if it has fewer rows
+    to fill out, e.g. for variants of a sequence that share long prefixes
+    """
+    scheme = scheme or default_scheme
+    k = len(seqs)
+    a, b = np.triu_indices(k, 1)
+    lengths = np.array([len(s) for s in seqs], dtype=np.intp)
+    width = int(lengths.max(initial=0)) + 1
+    if trie is None:
+        # rows of all sequences against all others for the trie, against the later ones for the pairs
+        _, nodes = prefix_trie([scheme.encode(s) for s in seqs])
+        trie = nodes * k < width * len(a)
+    if trie:
+        distances = np.triu(trie_distance_matrix(seqs, scheme=scheme), 1)
+        return distances + distances.T
+    # sequences padded to the same length, the cells beyond the end of a sequence do not reach its last cell
+    codes = np.zeros((k, width), dtype=np.intp)
+    for i, s in enumerate(seqs):
+        codes[i, :len(s)] = scheme.encode(s)
+    gaps = scheme.gap * np.arange(width, dtype=np.float64)
+    # substitution costs of every character of the alphabet against the second sequence of every pair
+    profiles = scheme.score[:, codes[b, :-1]]
+    pairs = np.arange(len(a))
+    t = np.tile(gaps, (len(a), 1))
+    distances = np.zeros((k, k))
+    for i in range(width):
+        if i:
+            t = _next_rows(t, profiles[codes[a, i - 1], pairs], scheme.gap, gaps)
+        last = np.flatnonzero(lengths[a] == i)
+        distances[a[last], b[last]] = t[last, lengths[b[last]]]
+    return distances + distances.T
 
-def sp_score_clique(seqs, clique, k, l):
-    """return the sp score of a clique"""
+
+def select_centers(seqs, centers="all", scheme=None, distances=None, weights=None):
+    """
+    return the centers a finder tries, in order: all of them for "all", or for "top-m" the m sequences with the
+    lowest sums of optimal pairwise scores, which are the best centers of the center star heuristic. distances is
+    the matrix of pairwise_distance_matrix, computed if needed and not given, weights the copies of the sequences
+    """
+    if centers == "all":
+        return list(range(len(seqs)))
+    if not isinstance(centers, str) or not centers.startswith("top-") or not centers[4:].isdigit() \
+            or int(centers[4:]) < 1:
+        raise ValueError(f"centers must be 'all' or 'top-m' with m >= 1, not {centers!r}")
+    if distances is None:
+        with instrument.span("pairwise_distances"):
+            distances = pairwise_distance_matrix(seqs, scheme)
+    sums = distances.sum(axis=1) if weights is None else distances @ np.asarray(weights)
+    return sorted(np.argsort(sums, kind="stable")[:int(centers[4:])].tolist())
+
+
+def sp_score_clique(seqs, clique, k, l, scheme=None, weights=None, mode=None):
+    """
+    return the sp score of a clique. given weights, the number of copies every sequence stands for (see
+    duplicates.collapse_duplicates), which is only exact for l = 2, the pair of the center and the leaf is weighted
+    by all copies but the center times the copies of the leaf: only one copy of the center is the center, its other
+    copies are leaves at distance 0 of it. mode is the planner mode of the clique tables, planned per clique if it
+    is None, e.g. the clique_score phase of planner.plan_finder, which holds for every clique of the family
+    """
+    instrument.count("cliques_scored")
+    weight = k - (l - 1)
+    if weights is not None:
+        if l != 2:
+            raise ValueError(f"weights, collapsed duplicates, are only exact for l = 2, not l={l}")
+        weight = (sum(weights) - 1) * weights[clique[1]]
     if l == 2:
-        return dynamic_table_2D(seqs[clique[0]], seqs[clique[1]], k - (l - 1))[-1, -1]
+        return table_score(_dynamic_table_2D, [seqs[clique[0]], seqs[clique[1]]], weight, scheme, mode=mode)
     if l == 3:
-        return dynamic_table_3D(seqs[clique[0]], seqs[clique[1]], seqs[clique[2]], k - (l - 1))[-1, -1, -1]
+        return table_score(_dynamic_table_3D, [seqs[c] for c in clique], weight, scheme, mode=mode)
     if l == 4:
-        return dynamic_table_4D(*[seqs[c] for c in clique], k - (l - 1))[-1, -1, -1, -1]
+        return table_score(_dynamic_table_4D, [seqs[c] for c in clique], weight, scheme, mode=mode)
 
 
-def sp_score_clique_2l_star(seqs, clique, k, l):
+def sp_score_clique_2l_star(seqs, clique, k, l, scheme=None):
     """return the sp scpre of a clique based on (2l-1)-star configuration"""
+    instrument.count("cliques_scored")
     if l == 2:
-        return dynamic_table_3D(seqs[clique[0]], seqs[clique[1]], seqs[clique[2]], k - (l - 1) - 0.5)[-1, -1, -1]
+        return table_score(_dynamic_table_3D, [seqs[c] for c in clique], k - (l - 1) - 0.5, scheme)
     if l == 3:
-        return dynamic_table_5D_2l_star(*[seqs[c] for c in clique], k - (l - 1) - 0.5)[-1, -1, -1, -1, -1]
+        from kernels_5d import _dynamic_table_5D_2l_star
+        # the (2l-1)-star configuration has no rolling score
+        return table_score(_dynamic_table_5D_2l_star, [seqs[c] for c in clique], k - (l - 1) - 0.5, scheme, False)
 
 
-def alignment_clique(seqs, clique, k, l):
+def alignment_clique(seqs, clique, k, l, scheme=None):
     """return the optimal alignment of a clique"""
     if l == 2:
-        return pairwise_alignment(seqs[clique[0]], seqs[clique[1]], k - (l - 1))
+        return pairwise_alignment(seqs[clique[0]], seqs[clique[1]], k - (l - 1), scheme=scheme)
     if l == 3:
-        return three_exact_alignment(seqs[clique[0]], seqs[clique[1]], seqs[clique[2]], k - (l - 1))
+        return three_exact_alignment(seqs[clique[0]], seqs[clique[1]], seqs[clique[2]], k - (l - 1), scheme=scheme)
     if l == 4:
-        return four_exact_alignment(*[seqs[c] for c in clique], k - (l - 1))
+        return four_exact_alignment(*[seqs[c] for c in clique], k - (l - 1), scheme=scheme)
+
+
+def alignment_clique_2l(seqs, clique, k, l, t=None, scheme=None):
+    """return the optimal alignment of a 2l-1 clique, backtracking through its dynamic table t if given"""
+    if l == 2:
+        return three_exact_alignment(seqs[clique[0]], seqs[clique[1]], seqs[clique[2]], k - (l - 1) - 0.5, t, scheme)
+    if l == 3:
+        from kernels_5d import five_exact_alignment_2l_star
+        return five_exact_alignment_2l_star(*[seqs[c] for c in clique], k - (l - 1) - 0.5, t, scheme)
 
 
-def alignment_clique_2l(seqs, clique, k, l):
-    """return the optimal alignment of a 2l-1 clique"""
+def sp_score_and_alignment_clique_2l_star(seqs, clique, k, l, scheme=None):
+    """
+    return the sp score of a 2l-1 clique together with its optimal alignment as a tuple of strings,
+    both from a single dynamic table
+    """
+    instrument.count("cliques_scored")
     if l == 2:
-        return three_exact_alignment(seqs[clique[0]], seqs[clique[1]], seqs[clique[2]], k - (l - 1) - 0.5)
+        t = dynamic_table_3D(seqs[clique[0]], seqs[clique[1]], seqs[clique[2]], k - (l - 1) - 0.5, scheme)
     if l == 3:
-        return five_exact_alignment_2l_star(*[seqs[c] for c in clique], k - (l - 1) - 0.5)
+        from kernels_5d import dynamic_table_5D_2l_star
+        t = dynamic_table_5D_2l_star(*[seqs[c] for c in clique], k - (l - 1) - 0.5, scheme)
+    alignment = tuple("".join(a) for a in alignment_clique_2l(seqs, clique, k, l, t, scheme))
+    return t[(-1,) * len(clique)], alignment
 
 
-def align_l_star(seqs, l_star, k, l):
+@instrument.spanned("align_l_star")
+def align_l_star(seqs, l_star, k, l, scheme=None):
     """given an l_star, return the optimal alignment of those sequences"""
 
     # a class that store a column of alignment
@@ -2529,7 +1044,7 @@ def align_l_star(seqs, l_star, k, l):
         current.val[center] = seqs[center][i]
     # merge cliques alignments
     for clique in l_star:
-        a = alignment_clique(seqs, clique, k, l)
+        a = alignment_clique(seqs, clique, k, l, scheme)
         current = alignment
         i = 0
         while i < len(a[0]):
@@ -2568,8 +1083,12 @@ def align_l_star(seqs, l_star, k, l):
     return strings
 
 
-def align_2l_star(seqs, star, k, l):
-    """given (2l-1)_star, return the optimal alignment of those sequences"""
+@instrument.spanned("align_2l_star")
+def align_2l_star(seqs, star, k, l, alignments=None, scheme=None):
+    """
+    given (2l-1)_star, return the optimal alignment of those sequences.
+    alignments optionally maps cliques to alignments already computed, e.g. while building the paired-star graph
+    """
 
     # a class that store a column of alignment
     class Column:
@@ -2586,7 +1105,11 @@ def align_2l_star(seqs, star, k, l):
         current.val[center] = seqs[center][i]
     # merge cliques alignments
     for clique in star:
-        a = alignment_clique_2l(seqs, clique, k, l)
+        a = alignments.get(clique) if alignments is not None else None
+        if a is not None:
+            instrument.count("alignment_cache_hits")
+        else:
+            a = alignment_clique_2l(seqs, clique, k, l, scheme=scheme)
         current = alignment
         i = 0
         while i < len(a[0]):
@@ -2625,8 +1148,14 @@ def align_2l_star(seqs, star, k, l):
     return strings
 
 
-def sp_score(alignment):
-    """given an alignment (a list of strings), return its sp score"""
+@instrument.spanned("sp_score")
+def sp_score(alignment, scheme=None, weights=None):
+    """
+    given an alignment (a list of strings), return its sp score. given weights, the number of copies every row
+    stands for, that of the alignment with the copies, whose pairs score nothing
+    """
+    scheme = scheme or default_scheme
+    gap, score, mapping = scheme.gap, scheme.score, scheme.mapping
 
     def _pairwise(seq1, seq2):
         ans = 0
@@ -2643,5 +1172,5 @@ def sp_score(alignment):
     k = len(alignment)
     for i in range(k):
         for j in range(i+1, k):
-            s += _pairwise(alignment[i], alignment[j])
+            s += _pairwise(alignment[i], alignment[j]) * (weights[i] * weights[j] if weights is not None else 1)
     return s
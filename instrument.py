@@ -0,0 +1,152 @@
+"""
+low-overhead instrumentation of the pipeline: timed spans and counters, off by default.
+enable it with enable() or by setting the MSA_INSTRUMENT environment variable. only the calling process is
+recorded, work done in pool workers shows up as the span of the call that waits for them
+"""
+
+import os
+import csv
+import json
+import time
+import threading
+import functools
+from contextlib import nullcontext
+from collections import defaultdict
+
+# spans are (name, start, duration, pid, thread id) tuples, starts in seconds since origin
+_state = {"enabled": bool(os.environ.get("MSA_INSTRUMENT")), "spans": [], "counters": defaultdict(int),
+          "runs": [], "origin": time.perf_counter()}
+
+_disabled_span = nullcontext()
+
+
+def enabled():
+    return _state["enabled"]
+
+
+def enable(clear=True):
+    """start recording, dropping what was recorded before unless clear is False"""
+    if clear:
+        reset()
+    _state["enabled"] = True
+
+
+def disable():
+    _state["enabled"] = False
+
+
+def reset():
+    _state.update(spans=[], counters=defaultdict(int), runs=[], origin=time.perf_counter())
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        _state["spans"].append((self.name, self.start - _state["origin"], end - self.start, os.getpid(),
+                                threading.get_ident()))
+
+
+def span(name):
+    """context manager timing the enclosed block as a span called name"""
+    return _Span(name) if _state["enabled"] else _disabled_span
+
+
+def spanned(name=None):
+    """decorator timing every call of a function as a span, called name or the function's name"""
+
+    def decorator(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _state["enabled"]:
+                return func(*args, **kwargs)
+            with _Span(label):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def count(name, n=1):
+    """add n to the counter called name"""
+    if _state["enabled"]:
+        _state["counters"][name] += n
+
+
+def mark():
+    """return a marker of what has been recorded so far, to summarize only what follows it"""
+    return len(_state["spans"]), dict(_state["counters"])
+
+
+def summary(since=(0, {})):
+    """
+    return the spans and counters recorded after the marker since as rows of dicts.
+    span rows hold the number of calls and their total and mean time, nested spans are included in their parents
+    """
+    first, counters = since
+    totals = {}
+    for name, _, duration, _, _ in _state["spans"][first:]:
+        calls, total = totals.get(name, (0, 0.0))
+        totals[name] = (calls + 1, total + duration)
+    rows = [{"kind": "span", "name": name, "calls": calls, "total": total, "mean": total / calls}
+            for name, (calls, total) in totals.items()]
+    for name, value in _state["counters"].items():
+        if value != counters.get(name, 0):
+            rows.append({"kind": "counter", "name": name, "calls": None, "total": value - counters.get(name, 0),
+                         "mean": None})
+    return rows
+
+
+def record_run(label, since=(0, {})):
+    """store the summary of a run, labelled by the dict label, for write_csv and write_json"""
+    for row in summary(since):
+        _state["runs"].append(dict(label, **row))
+
+
+def runs():
+    return list(_state["runs"])
+
+
+def add_runs(rows):
+    """add runs recorded elsewhere, e.g. returned by a worker process"""
+    _state["runs"].extend(rows)
+
+
+def write_csv(filename, rows=None):
+    """write rows, the recorded runs by default, as csv with a header"""
+    rows = runs() if rows is None else rows
+    fields = []
+    for row in rows:
+        fields.extend(field for field in row if field not in fields)
+    with open(filename, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_json(filename):
+    """write the recorded runs, together with the summary of everything recorded, as json"""
+    with open(filename, "w") as f:
+        json.dump({"runs": runs(), "summary": summary()}, f, indent=1)
+
+
+def write_trace(filename):
+    """write the spans and the final counter values as a trace-event file, viewable in chrome://tracing or perfetto"""
+    events = [{"name": name, "ph": "X", "ts": start * 1e6, "dur": duration * 1e6, "pid": pid, "tid": tid}
+              for name, start, duration, pid, tid in _state["spans"]]
+    end = max((start + duration for _, start, duration, _, _ in _state["spans"]), default=0.0)
+    events.extend({"name": name, "ph": "C", "ts": end * 1e6, "pid": os.getpid(), "args": {name: value}}
+                  for name, value in _state["counters"].items())
+    with open(filename, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
@@ -0,0 +1,1920 @@
+"""
+dynamic table kernels and exact alignments of 5 sequences, used by the (2l-1)-stars with l = 3 and exact alignments
+of 5 sequences. they are most of the code of the helpers and are imported on first use, see helpers.__getattr__
+"""
+
+from collections import deque
+from helpers import default_scheme, run_kernel
+
+
+def dynamic_table_5D(seq0, seq1, seq2, seq3, seq4, weight=1, scheme=None, mode=None):
+    """
+    return the dynamic table for 5 sequences, based on the graph configuration of l-star, where seq0 is the center string
+    """
+    return run_kernel(_dynamic_table_5D, (seq0, seq1, seq2, seq3, seq4), weight, scheme, mode)
+
+
+def _dynamic_table_5D(t, n0, n1, n2, n3, n4, c01, c02, c03, c04, c12, c13, c14, c23, c24, c34, weight, gap):
+    wg = weight * gap
+    wg2, wg3, wg4 = wg * 2, wg * 3, wg * 4
+    g2, g3, g4 = gap * 2, gap * 3, gap * 4
+    for i in range(1, n0):
+        t[i, 0, 0, 0, 0] = t[i - 1, 0, 0, 0, 0] + wg4
+    for j in range(1, n1):
+        t[0, j, 0, 0, 0] = t[0, j - 1, 0, 0, 0] + g3 + wg
+    for k in range(1, n2):
+        t[0, 0, k, 0, 0] = t[0, 0, k - 1, 0, 0] + g3 + wg
+    for l in range(1, n3):
+        t[0, 0, 0, l, 0] = t[0, 0, 0, l - 1, 0] + g3 + wg
+    for m in range(1, n4):
+        t[0, 0, 0, 0, m] = t[0, 0, 0, 0, m - 1] + g3 + wg
+    for i in range(1, n0):
+        for j in range(1, n1):
+            v1 = t[i - 1, j, 0, 0, 0] + wg4
+            v2 = t[i, j - 1, 0, 0, 0] + wg + g3
+            v3 = t[i - 1, j - 1, 0, 0, 0] + c01[i - 1][j - 1] * weight + wg3 + g3
+            t[i, j, 0, 0, 0] = min(v1, v2, v3)
+    for i in range(1, n0):
+        for k in range(1, n2):
+            v1 = t[i - 1, 0, k, 0, 0] + wg4
+            v2 = t[i, 0, k - 1, 0, 0] + wg + g3
+            v3 = t[i - 1, 0, k - 1, 0, 0] + c02[i - 1][k - 1] * weight + wg3 + g3
+            t[i, 0, k, 0, 0] = min(v1, v2, v3)
+    for i in range(1, n0):
+        for l in range(1, n3):
+            v1 = t[i - 1, 0, 0, l, 0] + wg4
+            v2 = t[i, 0, 0, l - 1, 0] + wg + g3
+            v3 = t[i - 1, 0, 0, l - 1, 0] + c03[i - 1][l - 1] * weight + wg3 + g3
+            t[i, 0, 0, l, 0] = min(v1, v2, v3)
+    for i in range(1, n0):
+        for m in range(1, n4):
+            v1 = t[i - 1, 0, 0, 0, m] + wg4
+            v2 = t[i, 0, 0, 0, m - 1] + wg + g3
+            v3 = t[i - 1, 0, 0, 0, m - 1] + c04[i - 1][m - 1] * weight + wg3 + g3
+            t[i, 0, 0, 0, m] = min(v1, v2, v3)
+    for j in range(1, n1):
+        for k in range(1, n2):
+            v1 = t[0, j - 1, k, 0, 0] + wg + g3
+            v2 = t[0, j, k - 1, 0, 0] + wg + g3
+            v3 = t[0, j - 1, k - 1, 0, 0] + wg2 + g4 + c12[j-1][k-1]
+            t[0, j, k, 0, 0] = min(v1, v2, v3)
+    for j in range(1, n1):
+        for l in range(1, n3):
+            v1 = t[0, j - 1, 0, l, 0] + wg + g3
+            v2 = t[0, j, 0, l - 1, 0] + wg + g3
+            v3 = t[0, j - 1, 0, l - 1, 0] + c13[j - 1][l - 1] + wg2 + g4
+            t[0, j, 0, l, 0] = min(v1, v2, v3)
+    for j in range(1, n1):
+        for m in range(1, n4):
+            v1 = t[0, j - 1, 0, 0, m] + wg + g3
+            v2 = t[0, j, 0, 0, m - 1] + wg + g3
+            v3 = t[0, j - 1, 0, 0, m - 1] + c14[j - 1][m - 1] + wg2 + g4
+            t[0, j, 0, 0, m] = min(v1, v2, v3)
+    for k in range(1, n2):
+        for l in range(1, n3):
+            v1 = t[0, 0, k - 1, l, 0] + wg + g3
+            v2 = t[0, 0, k, l - 1, 0] + wg + g3
+            v3 = t[0, 0, k - 1, l - 1, 0] + c23[k - 1][l - 1] + wg2 + g4
+            t[0, 0, k, l, 0] = min(v1, v2, v3)
+    for k in range(1, n2):
+        for m in range(1, n4):
+            v1 = t[0, 0, k - 1, 0, m] + wg + g3
+            v2 = t[0, 0, k, 0, m - 1] + wg + g3
+            v3 = t[0, 0, k - 1, 0, m - 1] + c24[k - 1][m - 1] + wg2 + g4
+            t[0, 0, k, 0, m] = min(v1, v2, v3)
+    for l in range(1, n3):
+        for m in range(1, n4):
+            v1 = t[0, 0, 0, l - 1, m] + wg + g3
+            v2 = t[0, 0, 0, l, m - 1] + wg + g3
+            v3 = t[0, 0, 0, l - 1, m - 1] + wg2 + g4 + c34[l-1][m-1]
+            t[0, 0, 0, l, m] = min(v1, v2, v3)
+    for i in range(1, n0):
+        for j in range(1, n1):
+            for k in range(1, n2):
+                sij = c01[i - 1][j - 1]
+                sik = c02[i - 1][k - 1]
+                sjk = c12[j - 1][k - 1]
+                v1 = t[i - 1, j - 1, k - 1, 0, 0] + (sij + sik) * weight + sjk + wg2 + g4
+                v2 = t[i, j - 1, k - 1, 0, 0] + wg2 + sjk + g4
+                v3 = t[i - 1, j, k - 1, 0, 0] + wg3 + g3 + sik * weight
+                v4 = t[i - 1, j - 1, k, 0, 0] + sij * weight + wg3 + g3
+                v5 = t[i, j, k - 1, 0, 0] + wg + g3
+                v6 = t[i, j - 1, k, 0, 0] + wg + g3
+                v7 = t[i - 1, j, k, 0, 0] + wg4
+                t[i, j, k, 0, 0] = min(v1, v2, v3, v4, v5, v6, v7)
+    for i in range(1, n0):
+        for j in range(1, n1):
+            for l in range(1, n3):
+                sij = c01[i - 1][j-1]
+                sil = c03[i - 1][l - 1]
+                sjl = c13[j - 1][l - 1]
+                v1 = t[i - 1, j - 1, 0, l - 1, 0] + (sij + sil) * weight + sjl + wg2 + g4
+                v2 = t[i, j - 1, 0, l - 1, 0] + wg2 + sjl + g4
+                v3 = t[i - 1, j, 0, l - 1, 0] + wg3 + g3 + sil * weight
+                v4 = t[i - 1, j - 1, 0, l, 0] + sij * weight + wg3 + g3
+                v5 = t[i, j, 0, l - 1, 0] + wg + g3
+                v6 = t[i, j - 1, 0, l, 0] + wg + g3
+                v7 = t[i - 1, j, 0, l, 0] + wg4
+                t[i, j, 0, l, 0] = min(v1, v2, v3, v4, v5, v6, v7)
+    for i in range(1, n0):
+        for j in range(1, n1):
+            for m in range(1, n4):
+                sij = c01[i - 1][j-1]
+                sim = c04[i - 1][m-1]
+                sjm = c14[j - 1][m-1]
+                v1 = t[i - 1, j - 1, 0, 0, m - 1] + (sij + sim) * weight + sjm + wg2 + g4
+                v2 = t[i, j - 1, 0, 0, m - 1] + wg2 + sjm + g4
+                v3 = t[i - 1, j, 0, 0, m - 1] + wg3 + g3 + sim * weight
+                v4 = t[i - 1, j - 1, 0, 0, m] + sij * weight + wg3 + g3
+                v5 = t[i, j, 0, 0, m - 1] + wg + g3
+                v6 = t[i, j - 1, 0, 0, m] + wg + g3
+                v7 = t[i - 1, j, 0, 0, m] + wg4
+                t[i, j, 0, 0, m] = min(v1, v2, v3, v4, v5, v6, v7)
+    for i in range(1, n0):
+        for k in range(1, n2):
+            for l in range(1, n3):
+                sik = c02[i - 1][k-1]
+                sil = c03[i - 1][l - 1]
+                skl = c23[k - 1][l - 1]
+                v1 = t[i - 1, 0, k - 1, l - 1, 0] + (sik + sil) * weight + skl + wg2 + g4
+                v2 = t[i, 0, k - 1, l - 1, 0] + wg2 + skl + g4
+                v3 = t[i - 1, 0, k, l - 1, 0] + wg3 + g3 + sil * weight
+                v4 = t[i - 1, 0, k - 1, l, 0] + sik * weight + wg3 + g3
+                v5 = t[i, 0, k, l - 1, 0] + wg + g3
+                v6 = t[i, 0, k - 1, l, 0] + wg + g3
+                v7 = t[i - 1, 0, k, l, 0] + wg4
+                t[i, 0, k, l, 0] = min(v1, v2, v3, v4, v5, v6, v7)
+    for i in range(1, n0):
+        for k in range(1, n2):
+            for m in range(1, n4):
+                sik = c02[i - 1][k-1]
+                sim = c04[i - 1][m-1]
+                skm = c24[k - 1][m-1]
+                v1 = t[i - 1, 0, k - 1, 0, m - 1] + (sik + sim) * weight + skm + wg2 + g4
+                v2 = t[i, 0, k - 1, 0, m - 1] + wg2 + skm + g4
+                v3 = t[i - 1, 0, k, 0, m - 1] + wg3 + g3 + sim * weight
+                v4 = t[i - 1, 0, k - 1, 0, m] + sik * weight + wg3 + g3
+                v5 = t[i, 0, k, 0, m - 1] + wg + g3
+                v6 = t[i, 0, k - 1, 0, m] + wg + g3
+                v7 = t[i - 1, 0, k, 0, m] + wg4
+                t[i, 0, k, 0, m] = min(v1, v2, v3, v4, v5, v6, v7)
+    for i in range(1, n0):
+        for l in range(1, n3):
+            for m in range(1, n4):
+                sil = c03[i - 1][l - 1]
+                sim = c04[i - 1][m-1]
+                slm = c34[l - 1][m-1]
+                v1 = t[i - 1, 0, 0, l - 1, m - 1] + (sil + sim) * weight + slm + wg2 + g4
+                v2 = t[i, 0, 0, l - 1, m - 1] + wg2 + slm + g4
+                v3 = t[i - 1, 0, 0, l, m - 1] + wg3 + g3 + sim * weight
+                v4 = t[i - 1, 0, 0, l - 1, m] + sil * weight + wg3 + g3
+                v5 = t[i, 0, 0, l, m - 1] + wg + g3
+                v6 = t[i, 0, 0, l - 1, m] + wg + g3
+                v7 = t[i - 1, 0, 0, l, m] + wg4
+                t[i, 0, 0, l, m] = min(v1, v2, v3, v4, v5, v6, v7)
+    for j in range(1, n1):
+        for k in range(1, n2):
+            for l in range(1, n3):
+                sjl = c13[j - 1][l-1]
+                sjk = c12[j - 1][k-1]
+                skl = c23[k - 1][l-1]
+                v1 = t[0, j - 1, k - 1, l - 1, 0] + sjk + sjl + skl + wg3 + g3
+                v2 = t[0, j, k - 1, l - 1, 0] + wg2 + skl + g4
+                v3 = t[0, j - 1, k, l - 1, 0] + wg2 + g4 + sjl
+                v4 = t[0, j - 1, k - 1, l, 0] + wg2 + sjk + g4
+                v5 = t[0, j, k, l - 1, 0] + wg + g3
+                v6 = t[0, j, k - 1, l, 0] + wg + g3
+                v7 = t[0, j - 1, k, l, 0] + wg + g3
+                t[0, j, k, l, 0] = min(v1, v2, v3, v4, v5, v6, v7)
+    for j in range(1, n1):
+        for k in range(1, n2):
+            for m in range(1, n4):
+                sjk = c12[j - 1][k-1]
+                sjm = c14[j - 1][m-1]
+                skm = c24[k - 1][m-1]
+                v1 = t[0, j - 1, k - 1, 0, m - 1] + sjk + sjm + skm + wg3 + g3
+                v2 = t[0, j, k - 1, 0, m - 1] + wg2 + skm + g4
+                v3 = t[0, j - 1, k, 0, m - 1] + wg2 + g4 + sjm
+                v4 = t[0, j - 1, k - 1, 0, m] + wg2 + sjk + g4
+                v5 = t[0, j, k, 0, m - 1] + wg + g3
+                v6 = t[0, j, k - 1, 0, m] + wg + g3
+                v7 = t[0, j - 1, k, 0, m] + wg + g3
+                t[0, j, k, 0, m] = min(v1, v2, v3, v4, v5, v6, v7)
+    for j in range(1, n1):
+        for l in range(1, n3):
+            for m in range(1, n4):
+                sjl = c13[j - 1][l - 1]
+                sjm = c14[j - 1][m - 1]
+                slm = c34[l - 1][m - 1]
+                v1 = t[0, j - 1, 0, l - 1, m - 1] + sjl + sjm + slm + wg3 + g3
+                v2 = t[0, j, 0, l - 1, m - 1] + wg2 + g4
+                v3 = t[0, j - 1, 0, l, m - 1] + wg2 + g4 + sjm
+                v4 = t[0, j - 1, 0, l - 1, m] + wg2 + sjl + g4
+                v5 = t[0, j, 0, l, m - 1] + wg + g3
+                v6 = t[0, j, 0, l - 1, m] + wg + g3
+                v7 = t[0, j - 1, 0, l, m] + wg + g3
+                t[0, j, 0, l, m] = min(v1, v2, v3, v4, v5, v6, v7)
+    for k in range(1, n2):
+        for l in range(1, n3):
+            for m in range(1, n4):
+                skl = c23[k - 1][l - 1]
+                skm = c24[k - 1][m - 1]
+                slm = c34[l - 1][m - 1]
+                v1 = t[0, 0, k - 1, l - 1, m - 1] + skl + skm + slm + wg3 + g3
+                v2 = t[0, 0, k, l - 1, m - 1] + wg2 + g4 + slm
+                v3 = t[0, 0, k - 1, l, m - 1] + wg2 + g4 + skm
+                v4 = t[0, 0, k - 1, l - 1, m] + wg2 + skl + g4
+                v5 = t[0, 0, k, l, m - 1] + wg + g3
+                v6 = t[0, 0, k, l - 1, m] + wg + g3
+                v7 = t[0, 0, k - 1, l, m] + wg + g3
+                t[0, 0, k, l, m] = min(v1, v2, v3, v4, v5, v6, v7)
+    for i in range(1, n0):
+        for j in range(1, n1):
+            for k in range(1, n2):
+                for l in range(1, n3):
+                    sij = c01[i - 1][j-1]
+                    sik = c02[i - 1][k-1]
+                    sil = c03[i - 1][l-1]
+                    sjk = c12[j - 1][k - 1]
+                    sjl = c13[j - 1][l-1]
+                    skl = c23[k - 1][l-1]
+                    v1 = t[i, j, k, l - 1, 0] + wg + g3
+                    v2 = t[i, j, k - 1, l, 0] + wg + g3
+                    v3 = t[i, j, k - 1, l - 1, 0] + wg2 + g4 + skl
+                    v4 = t[i, j - 1, k, l, 0] + wg + g3
+                    v5 = t[i, j - 1, k, l - 1, 0] + wg2 + sjl + g4
+                    v6 = t[i, j - 1, k - 1, l, 0] + wg2 + g4 + sjk
+                    v7 = t[i, j - 1, k - 1, l - 1, 0] + wg3 + sjk + sjl + g3 + skl
+                    v8 = t[i - 1, j, k, l, 0] + wg4
+                    v9 = t[i - 1, j, k, l - 1, 0] + wg3 + weight * sil + g3
+                    v10 = t[i - 1, j, k - 1, l, 0] + wg3 + weight * sik + g3
+                    v11 = t[i - 1, j, k - 1, l - 1, 0] + wg2 + weight * (sik + sil) + g4 + skl
+                    v12 = t[i - 1, j - 1, k, l, 0] + weight * sij + wg3 + g3
+                    v13 = t[i - 1, j - 1, k, l - 1, 0] + weight * (sij + sil) + wg2 + g4 + sjl
+                    v14 = t[i - 1, j - 1, k - 1, l, 0] + weight * (sij + sik) + wg2 + g4 + sjk
+                    v15 = t[i - 1, j - 1, k - 1, l - 1, 0] + weight * (sij + sik + sil) + wg + sjk +  sjl + skl + g3
+                    t[i, j, k, l, 0] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15)
+    for i in range(1, n0):
+        for j in range(1, n1):
+            for k in range(1, n2):
+                for m in range(1, n4):
+                    sij = c01[i - 1][j-1]
+                    sik = c02[i - 1][k-1]
+                    sim = c04[i - 1][m-1]
+                    sjk = c12[j - 1][k - 1]
+                    sjm = c14[j - 1][m-1]
+                    skm = c24[k - 1][m-1]
+                    v1 = t[i, j, k, 0, m - 1] + wg + g3
+                    v2 = t[i, j, k - 1, 0, m] + wg + g3
+                    v3 = t[i, j, k - 1, 0, m - 1] + wg2 + g4 + skm
+                    v4 = t[i, j - 1, k, 0, m] + wg + g3
+                    v5 = t[i, j - 1, k, 0, m - 1] + wg2 + sjm + g4
+                    v6 = t[i, j - 1, k - 1, 0, m] + wg2 + g4 + sjk
+                    v7 = t[i, j - 1, k - 1, 0, m - 1] + wg3 + sjk + sjm + g3 + skm
+                    v8 = t[i - 1, j, k, 0, m] + wg4
+                    v9 = t[i - 1, j, k, 0, m - 1] + wg3 + weight * sim + g3
+                    v10 = t[i - 1, j, k - 1, 0, m] + wg3 + weight * sik + g3
+                    v11 = t[i - 1, j, k - 1, 0, m - 1] + wg2 + weight * (sik + sim) + g4 + skm
+                    v12 = t[i - 1, j - 1, k, 0, m] + weight * sij + wg3 + g3
+                    v13 = t[i - 1, j - 1, k, 0, m - 1] + weight * (sij + sim) + wg2 + sjm + g4
+                    v14 = t[i - 1, j - 1, k - 1, 0, m] + weight * (sij + sik) + wg2 + g4 + sjk
+                    v15 = t[i - 1, j - 1, k - 1, 0, m - 1] + weight * (sij + sik + sim) + wg + sjk + sjm + skm + g3
+                    t[i, j, k, 0, m] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15)
+    for i in range(1, n0):
+        for j in range(1, n1):
+            for l in range(1, n3):
+                for m in range(1, n4):
+                    sij = c01[i - 1][j-1]
+                    sil = c03[i - 1][l-1]
+                    sim = c04[i - 1][m-1]
+                    sjl = c13[j - 1][l-1]
+                    sjm = c14[j - 1][m-1]
+                    slm = c34[l - 1][m - 1]
+                    v1 = t[i, j, 0, l, m - 1] + wg + g3
+                    v2 = t[i, j, 0, l - 1, m] + wg + g3
+                    v3 = t[i, j, 0, l - 1, m - 1] + wg2 + g4 + slm
+                    v4 = t[i, j - 1, 0, l, m] + wg + g3
+                    v5 = t[i, j - 1, 0, l, m - 1] + wg2 + sjm + g4
+                    v6 = t[i, j - 1, 0, l - 1, m] + wg2 + g4 + sjl
+                    v7 = t[i, j - 1, 0, l - 1, m - 1] + wg3 + sjl + g3 + sjm + slm
+                    v8 = t[i - 1, j, 0, l, m] + wg4
+                    v9 = t[i - 1, j, 0, l, m - 1] + wg3 + weight * sim + g3
+                    v10 = t[i - 1, j, 0, l - 1, m] + wg3 + weight * sil + g3
+                    v11 = t[i - 1, j, 0, l - 1, m - 1] + wg2 + weight * (sil + sim) + g4 + slm
+                    v12 = t[i - 1, j - 1, 0, l, m] + weight * sij + wg3 + g3
+                    v13 = t[i - 1, j - 1, 0, l, m - 1] + weight * (sij + sim) + wg2 + sjm + g4
+                    v14 = t[i - 1, j - 1, 0, l - 1, m] + weight * (sij + sil) + wg2 + g4 + sjl
+                    v15 = t[i - 1, j - 1, 0, l - 1, m - 1] + weight * (sij + sil + sim) + wg + sjl + sjm + slm + g3
+                    t[i, j, 0, l, m] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15)
+    for i in range(1, n0):
+        for k in range(1, n2):
+            for l in range(1, n3):
+                for m in range(1, n4):
+                    sik = c02[i - 1][k-1]
+                    sil = c03[i - 1][l-1]
+                    sim = c04[i - 1][m-1]
+                    skl = c23[k - 1][l-1]
+                    skm = c24[k - 1][m-1]
+                    slm = c34[l - 1][m - 1]
+                    v1 = t[i, 0, k, l, m - 1] + wg + g3
+                    v2 = t[i, 0, k, l - 1, m] + wg + g3
+                    v3 = t[i, 0, k, l - 1, m - 1] + wg2 + g4 + slm
+                    v4 = t[i, 0, k - 1, l, m] + wg + g3
+                    v5 = t[i, 0, k - 1, l, m - 1] + wg2 + skm + g4
+                    v6 = t[i, 0, k - 1, l - 1, m] + wg2 + g4 + skl
+                    v7 = t[i, 0, k - 1, l - 1, m - 1] + wg3 + skl + g3 + skm + slm
+                    v8 = t[i - 1, 0, k, l, m] + wg4
+                    v9 = t[i - 1, 0, k, l, m - 1] + wg3 + weight * sim + g3
+                    v10 = t[i - 1, 0, k, l - 1, m] + wg3 + weight * sil + g3
+                    v11 = t[i - 1, 0, k, l - 1, m - 1] + wg2 + weight * (sil + sim) + g4 + slm
+                    v12 = t[i - 1, 0, k - 1, l, m] + weight * sik + wg3 + g3
+                    v13 = t[i - 1, 0, k - 1, l, m - 1] + weight * (sik + sim) + wg2 + skm + g4
+                    v14 = t[i - 1, 0, k - 1, l - 1, m] + weight * (sik + sil) + wg2 + g4 + skl
+                    v15 = t[i - 1, 0, k - 1, l - 1, m - 1] + weight * (sik + sil + sim) + wg + skl + skm + slm + g3
+                    t[i, 0, k, l, m] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15)
+    for j in range(1, n1):
+        for k in range(1, n2):
+            for l in range(1, n3):
+                for m in range(1, n4):
+                    sjk = c12[j - 1][k - 1]
+                    sjl = c13[j - 1][l-1]
+                    sjm = c14[j - 1][m-1]
+                    skl = c23[k - 1][l-1]
+                    skm = c24[k - 1][m-1]
+                    slm = c34[l - 1][m - 1]
+                    v1 = t[0, j, k, l, m - 1] + wg + g3
+                    v2 = t[0, j, k, l - 1, m] + wg + g3
+                    v3 = t[0, j, k, l - 1, m - 1] + wg2 + g4 + slm
+                    v4 = t[0, j, k - 1, l, m] + wg + g3
+                    v5 = t[0, j, k - 1, l, m - 1] + wg2 + skm + g4
+                    v6 = t[0, j, k - 1, l - 1, m] + wg2 + g4 + skl
+                    v7 = t[0, j, k - 1, l - 1, m - 1] + wg3 + skl + slm + g3 + skm
+                    v8 = t[0, j - 1, k, l, m] + wg + g3
+                    v9 = t[0, j - 1, k, l, m - 1] + wg2 + sjm + g4
+                    v10 = t[0, j - 1, k, l - 1, m] + wg2 + sjl + g4
+                    v11 = t[0, j - 1, k, l - 1, m - 1] + wg3 + sjl + sjm + slm + g3
+                    v12 = t[0, j - 1, k - 1, l, m] + wg2 + g4 + sjk
+                    v13 = t[0, j - 1, k - 1, l, m - 1] + wg3 + sjk + sjm + skm + g3
+                    v14 = t[0, j - 1, k - 1, l - 1, m] + sjk + sjl + wg3 + g3 + skl
+                    v15 = t[0, j - 1, k - 1, l - 1, m - 1] + wg4 + sjk + sjl + sjm + skl + skm + slm
+                    t[0, j, k, l, m] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15)
+    for i in range(1, n0):
+        for j in range(1, n1):
+            for k in range(1, n2):
+                for l in range(1, n3):
+                    for m in range(1, n4):
+                        sij = c01[i-1][j-1]
+                        sik = c02[i-1][k-1]
+                        sil = c03[i-1][l-1]
+                        sim = c04[i-1][m-1]
+                        sjk = c12[j-1][k-1]
+                        sjl = c13[j-1][l-1]
+                        sjm = c14[j-1][m-1]
+                        skl = c23[k-1][l-1]
+                        skm = c24[k-1][m-1]
+                        slm = c34[l-1][m-1]
+                        v1 = t[i, j, k, l, m - 1] + wg + g3
+                        v2 = t[i, j, k, l - 1, m] + wg + g3
+                        v3 = t[i, j, k, l - 1, m - 1] + wg2 + g4 + slm
+                        v4 = t[i, j, k - 1, l, m] + wg + g3
+                        v5 = t[i, j, k - 1, l, m - 1] + wg2 + g4 + skm
+                        v6 = t[i, j, k - 1, l - 1, m] + wg2 + g4 + skl
+                        v7 = t[i, j, k - 1, l - 1, m - 1] + wg3 + g3 + skl + skm + slm
+                        v8 = t[i, j - 1, k, l, m] + wg + g3
+                        v9 = t[i, j - 1, k, l, m - 1] + wg2 + g4 + sjm
+                        v10 = t[i, j - 1, k, l - 1, m] + wg2 + sjl + g4
+                        v11 = t[i, j - 1, k, l - 1, m - 1] + wg3 + sjl + sjm + slm + g3
+                        v12 = t[i, j - 1, k - 1, l, m] + wg2 + sjk + g4
+                        v13 = t[i, j - 1, k - 1, l, m - 1] + wg3 + g3 + sjk + sjm + skm
+                        v14 = t[i, j - 1, k - 1, l - 1, m] + wg3 + sjk + sjl + g3 + skl
+                        v15 = t[i, j - 1, k - 1, l - 1, m - 1] + wg4 + sjk + sjl + sjm + skl + skm + slm
+                        v16 = t[i - 1, j, k, l, m] + wg4
+                        v17 = t[i - 1, j, k, l, m - 1] + wg3 + sim * weight + g3
+                        v18 = t[i - 1, j, k, l - 1, m] + wg3 + weight * sil + g3
+                        v19 = t[i - 1, j, k, l - 1, m - 1] + wg2 + weight * (sil + sim) + slm + g4
+                        v20 = t[i - 1, j, k - 1, l, m] + wg3 + weight * sik + g3
+                        v21 = t[i - 1, j, k - 1, l, m - 1] + wg2 + weight * (sik + sim) + g4 + skm
+                        v22 = t[i - 1, j, k - 1, l - 1, m] + wg2 + weight * (sik + sil) + g4 + skl
+                        v23 = t[i - 1, j, k - 1, l - 1, m - 1] + wg + weight * (sik + sil + sim) + g3 + skl + skm + slm
+                        v24 = t[i - 1, j - 1, k, l, m] + weight * sij + wg3 + g3
+                        v25 = t[i - 1, j - 1, k, l, m - 1] + weight * (sij + sim) + wg2 + g4 + sjm
+                        v26 = t[i - 1, j - 1, k, l - 1, m] + weight * (sij + sil) + wg2 + sjl + g4
+                        v27 = t[i - 1, j - 1, k, l - 1, m - 1] + weight * (sij + sil + sim) + wg + sjl + sjm + slm + g3
+                        v28 = t[i - 1, j - 1, k - 1, l, m] + weight * (sij + sik) + wg2 + g4 + sjk
+                        v29 = t[i - 1, j - 1, k - 1, l, m - 1] + weight * (sij + sik + sim) + wg + g3 + sjk + sjm + skm
+                        v30 = t[i - 1, j - 1, k - 1, l - 1, m] + weight * (sij + sik + sil) + wg + sjk + sjl + g3 + skl
+                        v31 = t[i - 1, j - 1, k - 1, l - 1, m - 1] + weight * (sij + sik + sil + sim) + sjk + sjl + sjm + skl + skm + slm
+                        t[i, j, k, l, m] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15, v16, v17, v18, v19, v20, v21, v22, v23, v24, v25, v26, v27, v28, v29, v30, v31)
+    return t
+
+
+def dynamic_table_5D_2l_star(seq0, seq1, seq2, seq3, seq4, weight=1, scheme=None, mode=None):
+    """
+    return the dynamic table for 5 sequences, based on the graph configuration of (2l-1)-star.
+    seq0 is the center string, (seq1, seq2) and (seq3, seq4) were in the same l-clique.
+    """
+    return run_kernel(_dynamic_table_5D_2l_star, (seq0, seq1, seq2, seq3, seq4), weight, scheme, mode)
+
+
+def _dynamic_table_5D_2l_star(t, n0, n1, n2, n3, n4, c01, c02, c03, c04, c12, c13, c14, c23, c24, c34, weight, gap):
+    wg = weight * gap
+    wg2, wg3, wg4 = wg * 2, wg * 3, wg * 4
+    g2, g4 = gap * 2, gap * 4
+    for i in range(1, n0):
+        t[i, 0, 0, 0, 0] = t[i - 1, 0, 0, 0, 0] + wg4
+    for j in range(1, n1):
+        t[0, j, 0, 0, 0] = t[0, j - 1, 0, 0, 0] + g2 + wg
+    for k in range(1, n2):
+        t[0, 0, k, 0, 0] = t[0, 0, k - 1, 0, 0] + g2 + wg
+    for l in range(1, n3):
+        t[0, 0, 0, l, 0] = t[0, 0, 0, l - 1, 0] + g2 + wg
+    for m in range(1, n4):
+        t[0, 0, 0, 0, m] = t[0, 0, 0, 0, m - 1] + g2 + wg
+    for i in range(1, n0):
+        for j in range(1, n1):
+            v1 = t[i - 1, j, 0, 0, 0] + wg4
+            v2 = t[i, j - 1, 0, 0, 0] + wg + g2
+            v3 = t[i - 1, j - 1, 0, 0, 0] + c01[i - 1][j - 1] * weight + wg2 + g2
+            t[i, j, 0, 0, 0] = min(v1, v2, v3)
+    for i in range(1, n0):
+        for k in range(1, n2):
+            v1 = t[i - 1, 0, k, 0, 0] + wg4
+            v2 = t[i, 0, k - 1, 0, 0] + wg + g2
+            v3 = t[i - 1, 0, k - 1, 0, 0] + c02[i - 1][k - 1] * weight + wg3 + g2
+            t[i, 0, k, 0, 0] = min(v1, v2, v3)
+    for i in range(1, n0):
+        for l in range(1, n3):
+            v1 = t[i - 1, 0, 0, l, 0] + wg4
+            v2 = t[i, 0, 0, l - 1, 0] + wg + g2
+            v3 = t[i - 1, 0, 0, l - 1, 0] + c03[i - 1][l - 1] * weight + wg3 + g2
+            t[i, 0, 0, l, 0] = min(v1, v2, v3)
+    for i in range(1, n0):
+        for m in range(1, n4):
+            v1 = t[i - 1, 0, 0, 0, m] + wg4
+            v2 = t[i, 0, 0, 0, m - 1] + wg + g2
+            v3 = t[i - 1, 0, 0, 0, m - 1] + c04[i - 1][m - 1] * weight + wg3 + g2
+            t[i, 0, 0, 0, m] = min(v1, v2, v3)
+    for j in range(1, n1):
+        for k in range(1, n2):
+            v1 = t[0, j - 1, k, 0, 0] + wg + g2
+            v2 = t[0, j, k - 1, 0, 0] + wg + g2
+            v3 = t[0, j - 1, k - 1, 0, 0] + wg2 + g4
+            t[0, j, k, 0, 0] = min(v1, v2, v3)
+    for j in range(1, n1):
+        for l in range(1, n3):
+            v1 = t[0, j - 1, 0, l, 0] + wg + g2
+            v2 = t[0, j, 0, l - 1, 0] + wg + g2
+            v3 = t[0, j - 1, 0, l - 1, 0] + c13[j - 1][l - 1] + wg2 + g2
+            t[0, j, 0, l, 0] = min(v1, v2, v3)
+    for j in range(1, n1):
+        for m in range(1, n4):
+            v1 = t[0, j - 1, 0, 0, m] + wg + g2
+            v2 = t[0, j, 0, 0, m - 1] + wg + g2
+            v3 = t[0, j - 1, 0, 0, m - 1] + c14[j - 1][m - 1] + wg2 + g2
+            t[0, j, 0, 0, m] = min(v1, v2, v3)
+    for k in range(1, n2):
+        for l in range(1, n3):
+            v1 = t[0, 0, k - 1, l, 0] + wg + g2
+            v2 = t[0, 0, k, l - 1, 0] + wg + g2
+            v3 = t[0, 0, k - 1, l - 1, 0] + c23[k - 1][l - 1] + wg2 + g2
+            t[0, 0, k, l, 0] = min(v1, v2, v3)
+    for k in range(1, n2):
+        for m in range(1, n4):
+            v1 = t[0, 0, k - 1, 0, m] + wg + g2
+            v2 = t[0, 0, k, 0, m - 1] + wg + g2
+            v3 = t[0, 0, k - 1, 0, m - 1] + c24[k - 1][m - 1] + wg2 + g2
+            t[0, 0, k, 0, m] = min(v1, v2, v3)
+    for l in range(1, n3):
+        for m in range(1, n4):
+            v1 = t[0, 0, 0, l - 1, m] + wg + g2
+            v2 = t[0, 0, 0, l, m - 1] + wg + g2
+            v3 = t[0, 0, 0, l - 1, m - 1] + wg2 + g4
+            t[0, 0, 0, l, m] = min(v1, v2, v3)
+    for i in range(1, n0):
+        for j in range(1, n1):
+            for k in range(1, n2):
+                sij = c01[i - 1][j - 1]
+                sik = c02[i - 1][k - 1]
+                sjk = c12[j - 1][k - 1]
+                v1 = t[i - 1, j - 1, k - 1, 0, 0] + (sij + sik) * weight + sjk + wg2 + g4
+                v2 = t[i, j - 1, k - 1, 0, 0] + wg2 + sjk + g4
+                v3 = t[i - 1, j, k - 1, 0, 0] + wg3 + g2 + sik * weight
+                v4 = t[i - 1, j - 1, k, 0, 0] + sij * weight + wg3 + g2
+                v5 = t[i, j, k - 1, 0, 0] + wg + g2
+                v6 = t[i, j - 1, k, 0, 0] + wg + g2
+                v7 = t[i - 1, j, k, 0, 0] + wg4
+                t[i, j, k, 0, 0] = min(v1, v2, v3, v4, v5, v6, v7)
+    for i in range(1, n0):
+        for j in range(1, n1):
+            for l in range(1, n3):
+                sij = c01[i - 1][j-1]
+                sil = c03[i - 1][l - 1]
+                sjl = c13[j - 1][l - 1]
+                v1 = t[i - 1, j - 1, 0, l - 1, 0] + (sij + sil) * weight + sjl + wg2 + g2
+                v2 = t[i, j - 1, 0, l - 1, 0] + wg2 + sjl + g2
+                v3 = t[i - 1, j, 0, l - 1, 0] + wg3 + g2 + sil * weight
+                v4 = t[i - 1, j - 1, 0, l, 0] + sij * weight + wg3 + g2
+                v5 = t[i, j, 0, l - 1, 0] + wg + g2
+                v6 = t[i, j - 1, 0, l, 0] + wg + g2
+                v7 = t[i - 1, j, 0, l, 0] + wg4
+                t[i, j, 0, l, 0] = min(v1, v2, v3, v4, v5, v6, v7)
+    for i in range(1, n0):
+        for j in range(1, n1):
+            for m in range(1, n4):
+                sij = c01[i - 1][j-1]
+                sim = c04[i - 1][m-1]
+                sjm = c14[j - 1][m-1]
+                v1 = t[i - 1, j - 1, 0, 0, m - 1] + (sij + sim) * weight + sjm + wg2 + g2
+                v2 = t[i, j - 1, 0, 0, m - 1] + wg2 + sjm + g2
+                v3 = t[i - 1, j, 0, 0, m - 1] + wg3 + g2 + sim * weight
+                v4 = t[i - 1, j - 1, 0, 0, m] + sij * weight + wg3 + g2
+                v5 = t[i, j, 0, 0, m - 1] + wg + g2
+                v6 = t[i, j - 1, 0, 0, m] + wg + g2
+                v7 = t[i - 1, j, 0, 0, m] + wg4
+                t[i, j, 0, 0, m] = min(v1, v2, v3, v4, v5, v6, v7)
+    for i in range(1, n0):
+        for k in range(1, n2):
+            for l in range(1, n3):
+                sik = c02[i - 1][k-1]
+                sil = c03[i - 1][l - 1]
+                skl = c23[k - 1][l - 1]
+                v1 = t[i - 1, 0, k - 1, l - 1, 0] + (sik + sil) * weight + skl + wg2 + g2
+                v2 = t[i, 0, k - 1, l - 1, 0] + wg2 + skl + g2
+                v3 = t[i - 1, 0, k, l - 1, 0] + wg3 + g2 + sil * weight
+                v4 = t[i - 1, 0, k - 1, l, 0] + sik * weight + wg3 + g2
+                v5 = t[i, 0, k, l - 1, 0] + wg + g2
+                v6 = t[i, 0, k - 1, l, 0] + wg + g2
+                v7 = t[i - 1, 0, k, l, 0] + wg4
+                t[i, 0, k, l, 0] = min(v1, v2, v3, v4, v5, v6, v7)
+    for i in range(1, n0):
+        for k in range(1, n2):
+            for m in range(1, n4):
+                sik = c02[i - 1][k-1]
+                sim = c04[i - 1][m-1]
+                skm = c24[k - 1][m-1]
+                v1 = t[i - 1, 0, k - 1, 0, m - 1] + (sik + sim) * weight + skm + wg2 + g2
+                v2 = t[i, 0, k - 1, 0, m - 1] + wg2 + skm + g2
+                v3 = t[i - 1, 0, k, 0, m - 1] + wg3 + g2 + sim * weight
+                v4 = t[i - 1, 0, k - 1, 0, m] + sik * weight + wg3 + g2
+                v5 = t[i, 0, k, 0, m - 1] + wg + g2
+                v6 = t[i, 0, k - 1, 0, m] + wg + g2
+                v7 = t[i - 1, 0, k, 0, m] + wg4
+                t[i, 0, k, 0, m] = min(v1, v2, v3, v4, v5, v6, v7)
+    for i in range(1, n0):
+        for l in range(1, n3):
+            for m in range(1, n4):
+                sil = c03[i - 1][l - 1]
+                sim = c04[i - 1][m-1]
+                slm = c34[l - 1][m-1]
+                v1 = t[i - 1, 0, 0, l - 1, m - 1] + (sil + sim) * weight + slm + wg2 + g4
+                v2 = t[i, 0, 0, l - 1, m - 1] + wg2 + slm + g4
+                v3 = t[i - 1, 0, 0, l, m - 1] + wg3 + g2 + sim * weight
+                v4 = t[i - 1, 0, 0, l - 1, m] + sil * weight + wg3 + g2
+                v5 = t[i, 0, 0, l, m - 1] + wg + g2
+                v6 = t[i, 0, 0, l - 1, m] + wg + g2
+                v7 = t[i - 1, 0, 0, l, m] + wg4
+                t[i, 0, 0, l, m] = min(v1, v2, v3, v4, v5, v6, v7)
+    for j in range(1, n1):
+        for k in range(1, n2):
+            for l in range(1, n3):
+                sjl = c13[j - 1][l-1]
+                skl = c23[k - 1][l-1]
+                v1 = t[0, j - 1, k - 1, l - 1, 0] + sjl + skl + wg3 + g2
+                v2 = t[0, j, k - 1, l - 1, 0] + wg2 + skl + g2
+                v3 = t[0, j - 1, k, l - 1, 0] + wg2 + g2 + sjl
+                v4 = t[0, j - 1, k - 1, l, 0] + wg2 + g4
+                v5 = t[0, j, k, l - 1, 0] + wg + g2
+                v6 = t[0, j, k - 1, l, 0] + wg + g2
+                v7 = t[0, j - 1, k, l, 0] + wg + g2
+                t[0, j, k, l, 0] = min(v1, v2, v3, v4, v5, v6, v7)
+    for j in range(1, n1):
+        for k in range(1, n2):
+            for m in range(1, n4):
+                sjm = c14[j - 1][m-1]
+                skm = c24[k - 1][m-1]
+                v1 = t[0, j - 1, k - 1, 0, m - 1] + sjm + skm + wg3 + g2
+                v2 = t[0, j, k - 1, 0, m - 1] + wg2 + skm + g2
+                v3 = t[0, j - 1, k, 0, m - 1] + wg2 + g2 + sjm
+                v4 = t[0, j - 1, k - 1, 0, m] + wg2 + g4
+                v5 = t[0, j, k, 0, m - 1] + wg + g2
+                v6 = t[0, j, k - 1, 0, m] + wg + g2
+                v7 = t[0, j - 1, k, 0, m] + wg + g2
+                t[0, j, k, 0, m] = min(v1, v2, v3, v4, v5, v6, v7)
+    for j in range(1, n1):
+        for l in range(1, n3):
+            for m in range(1, n4):
+                sjl = c13[j - 1][l - 1]
+                sjm = c14[j - 1][m-1]
+                v1 = t[0, j - 1, 0, l - 1, m - 1] + sjl + sjm + wg3 + g2
+                v2 = t[0, j, 0, l - 1, m - 1] + wg2 + g4
+                v3 = t[0, j - 1, 0, l, m - 1] + wg2 + g2 + sjm
+                v4 = t[0, j - 1, 0, l - 1, m] + wg2 + sjl + g2
+                v5 = t[0, j, 0, l, m - 1] + wg + g2
+                v6 = t[0, j, 0, l - 1, m] + wg + g2
+                v7 = t[0, j - 1, 0, l, m] + wg + g2
+                t[0, j, 0, l, m] = min(v1, v2, v3, v4, v5, v6, v7)
+    for k in range(1, n2):
+        for l in range(1, n3):
+            for m in range(1, n4):
+                skl = c23[k - 1][l - 1]
+                skm = c24[k - 1][m-1]
+                v1 = t[0, 0, k - 1, l - 1, m - 1] + skl + skm + wg3 + g2
+                v2 = t[0, 0, k, l - 1, m - 1] + wg2 + g4
+                v3 = t[0, 0, k - 1, l, m - 1] + wg2 + g2 + skm
+                v4 = t[0, 0, k - 1, l - 1, m] + wg2 + skl + g2
+                v5 = t[0, 0, k, l, m - 1] + wg + g2
+                v6 = t[0, 0, k, l - 1, m] + wg + g2
+                v7 = t[0, 0, k - 1, l, m] + wg + g2
+                t[0, 0, k, l, m] = min(v1, v2, v3, v4, v5, v6, v7)
+    for i in range(1, n0):
+        for j in range(1, n1):
+            for k in range(1, n2):
+                for l in range(1, n3):
+                    sij = c01[i - 1][j-1]
+                    sik = c02[i - 1][k-1]
+                    sil = c03[i - 1][l-1]
+                    sjl = c13[j - 1][l-1]
+                    skl = c23[k - 1][l-1]
+                    v1 = t[i, j, k, l - 1, 0] + wg + g2
+                    v2 = t[i, j, k - 1, l, 0] + wg + g2
+                    v3 = t[i, j, k - 1, l - 1, 0] + wg2 + g2 + skl
+                    v4 = t[i, j - 1, k, l, 0] + wg + g2
+                    v5 = t[i, j - 1, k, l - 1, 0] + wg2 + sjl + g2
+                    v6 = t[i, j - 1, k - 1, l, 0] + wg2 + g4
+                    v7 = t[i, j - 1, k - 1, l - 1, 0] + wg3 + sjl + g2 + skl
+                    v8 = t[i - 1, j, k, l, 0] + wg4
+                    v9 = t[i - 1, j, k, l - 1, 0] + wg3 + weight * sil + g2
+                    v10 = t[i - 1, j, k - 1, l, 0] + wg3 + weight * sik + g2
+                    v11 = t[i - 1, j, k - 1, l - 1, 0] + wg2 + weight * (sik + sil) + g2 + skl
+                    v12 = t[i - 1, j - 1, k, l, 0] + weight * sij + wg3 + g2
+                    v13 = t[i - 1, j - 1, k, l - 1, 0] + weight * (sij + sil) + wg2 + g2 + sjl
+                    v14 = t[i - 1, j - 1, k - 1, l, 0] + weight * (sij + sik) + wg2 + g4
+                    v15 = t[i - 1, j - 1, k - 1, l - 1, 0] + weight * (sij + sik + sil) + wg + sjl + skl + g2
+                    t[i, j, k, l, 0] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15)
+    for i in range(1, n0):
+        for j in range(1, n1):
+            for k in range(1, n2):
+                for m in range(1, n4):
+                    sij = c01[i - 1][j-1]
+                    sik = c02[i - 1][k-1]
+                    sim = c04[i - 1][m-1]
+                    sjm = c14[j - 1][m-1]
+                    skm = c24[k - 1][m-1]
+                    v1 = t[i, j, k, 0, m - 1] + wg + g2
+                    v2 = t[i, j, k - 1, 0, m] + wg + g2
+                    v3 = t[i, j, k - 1, 0, m - 1] + wg2 + g2 + skm
+                    v4 = t[i, j - 1, k, 0, m] + wg + g2
+                    v5 = t[i, j - 1, k, 0, m - 1] + wg2 + sjm + g2
+                    v6 = t[i, j - 1, k - 1, 0, m] + wg2 + g4
+                    v7 = t[i, j - 1, k - 1, 0, m - 1] + wg3 + sjm + g2 + skm
+                    v8 = t[i - 1, j, k, 0, m] + wg4
+                    v9 = t[i - 1, j, k, 0, m - 1] + wg3 + weight * sim + g2
+                    v10 = t[i - 1, j, k - 1, 0, m] + wg3 + weight * sik + g2
+                    v11 = t[i - 1, j, k - 1, 0, m - 1] + wg2 + weight * (sik + sim) + g2 + skm
+                    v12 = t[i - 1, j - 1, k, 0, m] + weight * sij + wg3 + g2
+                    v13 = t[i - 1, j - 1, k, 0, m - 1] + weight * (sij + sim) + wg2 + sjm + g2
+                    v14 = t[i - 1, j - 1, k - 1, 0, m] + weight * (sij + sik) + wg2 + g4
+                    v15 = t[i - 1, j - 1, k - 1, 0, m - 1] + weight * (sij + sik + sim) + wg + sjm + skm + g2
+                    t[i, j, k, 0, m] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15)
+    for i in range(1, n0):
+        for j in range(1, n1):
+            for l in range(1, n3):
+                for m in range(1, n4):
+                    sij = c01[i - 1][j-1]
+                    sil = c03[i - 1][l-1]
+                    sim = c04[i - 1][m-1]
+                    sjl = c13[j - 1][l-1]
+                    sjm = c14[j - 1][m-1]
+                    v1 = t[i, j, 0, l, m - 1] + wg + g2
+                    v2 = t[i, j, 0, l - 1, m] + wg + g2
+                    v3 = t[i, j, 0, l - 1, m - 1] + wg2 + g4
+                    v4 = t[i, j - 1, 0, l, m] + wg + g2
+                    v5 = t[i, j - 1, 0, l, m - 1] + wg2 + sjm + g2
+                    v6 = t[i, j - 1, 0, l - 1, m] + wg2 + g2 + sjl
+                    v7 = t[i, j - 1, 0, l - 1, m - 1] + wg3 + sjl + g2 + sjm
+                    v8 = t[i - 1, j, 0, l, m] + wg4
+                    v9 = t[i - 1, j, 0, l, m - 1] + wg3 + weight * sim + g2
+                    v10 = t[i - 1, j, 0, l - 1, m] + wg3 + weight * sil + g2
+                    v11 = t[i - 1, j, 0, l - 1, m - 1] + wg2 + weight * (sil + sim) + g4
+                    v12 = t[i - 1, j - 1, 0, l, m] + weight * sij + wg3 + g2
+                    v13 = t[i - 1, j - 1, 0, l, m - 1] + weight * (sij + sim) + wg2 + sjm + g2
+                    v14 = t[i - 1, j - 1, 0, l - 1, m] + weight * (sij + sil) + wg2 + g2 + sjl
+                    v15 = t[i - 1, j - 1, 0, l - 1, m - 1] + weight * (sij + sil + sim) + wg + sjl + sjm + g2
+                    t[i, j, 0, l, m] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15)
+    for i in range(1, n0):
+        for k in range(1, n2):
+            for l in range(1, n3):
+                for m in range(1, n4):
+                    sik = c02[i - 1][k-1]
+                    sil = c03[i - 1][l-1]
+                    sim = c04[i - 1][m-1]
+                    skl = c23[k - 1][l-1]
+                    skm = c24[k - 1][m-1]
+                    v1 = t[i, 0, k, l, m - 1] + wg + g2
+                    v2 = t[i, 0, k, l - 1, m] + wg + g2
+                    v3 = t[i, 0, k, l - 1, m - 1] + wg2 + g4
+                    v4 = t[i, 0, k - 1, l, m] + wg + g2
+                    v5 = t[i, 0, k - 1, l, m - 1] + wg2 + skm + g2
+                    v6 = t[i, 0, k - 1, l - 1, m] + wg2 + g2 + skl
+                    v7 = t[i, 0, k - 1, l - 1, m - 1] + wg3 + skl + g2 + skm
+                    v8 = t[i - 1, 0, k, l, m] + wg4
+                    v9 = t[i - 1, 0, k, l, m - 1] + wg3 + weight * sim + g2
+                    v10 = t[i - 1, 0, k, l - 1, m] + wg3 + weight * sil + g2
+                    v11 = t[i - 1, 0, k, l - 1, m - 1] + wg2 + weight * (sil + sim) + g4
+                    v12 = t[i - 1, 0, k - 1, l, m] + weight * sik + wg3 + g2
+                    v13 = t[i - 1, 0, k - 1, l, m - 1] + weight * (sik + sim) + wg2 + skm + g2
+                    v14 = t[i - 1, 0, k - 1, l - 1, m] + weight * (sik + sil) + wg2 + g2 + skl
+                    v15 = t[i - 1, 0, k - 1, l - 1, m - 1] + weight * (sik + sil + sim) + wg + skl + skm + g2
+                    t[i, 0, k, l, m] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15)
+    for j in range(1, n1):
+        for k in range(1, n2):
+            for l in range(1, n3):
+                for m in range(1, n4):
+                    sjl = c13[j - 1][l-1]
+                    sjm = c14[j - 1][m-1]
+                    skl = c23[k - 1][l-1]
+                    skm = c24[k - 1][m-1]
+                    v1 = t[0, j, k, l, m - 1] + wg + g2
+                    v2 = t[0, j, k, l - 1, m] + wg + g2
+                    v3 = t[0, j, k, l - 1, m - 1] + wg2 + g4
+                    v4 = t[0, j, k - 1, l, m] + wg + g2
+                    v5 = t[0, j, k - 1, l, m - 1] + wg2 + skm + g2
+                    v6 = t[0, j, k - 1, l - 1, m] + wg2 + g2 + skl
+                    v7 = t[0, j, k - 1, l - 1, m - 1] + wg3 + skl + g2 + skm
+                    v8 = t[0, j - 1, k, l, m] + wg + g2
+                    v9 = t[0, j - 1, k, l, m - 1] + wg2 + sjm + g2
+                    v10 = t[0, j - 1, k, l - 1, m] + wg2 + sjl + g2
+                    v11 = t[0, j - 1, k, l - 1, m - 1] + wg3 + sjl + sjm + g2
+                    v12 = t[0, j - 1, k - 1, l, m] + wg2 + g4
+                    v13 = t[0, j - 1, k - 1, l, m - 1] + wg3 + sjm + skm + g2
+                    v14 = t[0, j - 1, k - 1, l - 1, m] + sjl + wg3 + g2 + skl
+                    v15 = t[0, j - 1, k - 1, l - 1, m - 1] + wg4 + sjl + sjm + skl + skm
+                    t[0, j, k, l, m] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15)
+    for i in range(1, n0):
+        for j in range(1, n1):
+            for k in range(1, n2):
+                for l in range(1, n3):
+                    for m in range(1, n4):
+                        sij = c01[i-1][j-1]
+                        sik = c02[i-1][k-1]
+                        sil = c03[i-1][l-1]
+                        sim = c04[i-1][m-1]
+                        sjl = c13[j-1][l-1]
+                        sjm = c14[j-1][m-1]
+                        skl = c23[k-1][l-1]
+                        skm = c24[k-1][m-1]
+                        v1 = t[i, j, k, l, m - 1] + wg + g2
+                        v2 = t[i, j, k, l - 1, m] + wg + g2
+                        v3 = t[i, j, k, l - 1, m - 1] + wg2 + g4
+                        v4 = t[i, j, k - 1, l, m] + wg + g2
+                        v5 = t[i, j, k - 1, l, m - 1] + wg2 + g2 + skm
+                        v6 = t[i, j, k - 1, l - 1, m] + wg2 + g2 + skl
+                        v7 = t[i, j, k - 1, l - 1, m - 1] + wg3 + g2 + skl + skm
+                        v8 = t[i, j - 1, k, l, m] + wg + g2
+                        v9 = t[i, j - 1, k, l, m - 1] + wg2 + g2 + sjm
+                        v10 = t[i, j - 1, k, l - 1, m] + wg2 + sjl + g2
+                        v11 = t[i, j - 1, k, l - 1, m - 1] + wg3 + sjl + sjm + g2
+                        v12 = t[i, j - 1, k - 1, l, m] + wg2 + g4
+                        v13 = t[i, j - 1, k - 1, l, m - 1] + wg3 + g2 + sjm + skm
+                        v14 = t[i, j - 1, k - 1, l - 1, m] + wg3 + sjl + g2 + skl
+                        v15 = t[i, j - 1, k - 1, l - 1, m - 1] + wg4 + sjl + sjm + skl + skm
+                        v16 = t[i - 1, j, k, l, m] + wg4
+                        v17 = t[i - 1, j, k, l, m - 1] + wg3 + sim * weight + g2
+                        v18 = t[i - 1, j, k, l - 1, m] + wg3 + weight * sil + g2
+                        v19 = t[i - 1, j, k, l - 1, m - 1] + wg2 + weight * (sil + sim) + g4
+                        v20 = t[i - 1, j, k - 1, l, m] + wg3 + weight * sik + g2
+                        v21 = t[i - 1, j, k - 1, l, m - 1] + wg2 + weight * (sik + sim) + g2 + skm
+                        v22 = t[i - 1, j, k - 1, l - 1, m] + wg2 + weight * (sik + sil) + g2 + skl
+                        v23 = t[i - 1, j, k - 1, l - 1, m - 1] + wg + weight * (sik + sil + sim) + g2 + skl + skm
+                        v24 = t[i - 1, j - 1, k, l, m] + weight * sij + wg3 + g2
+                        v25 = t[i - 1, j - 1, k, l, m - 1] + weight * (sij + sim) + wg2 + g2 + sjm
+                        v26 = t[i - 1, j - 1, k, l - 1, m] + weight * (sij + sil) + wg2 + sjl + g2
+                        v27 = t[i - 1, j - 1, k, l - 1, m - 1] + weight * (sij + sil + sim) + wg + sjl + sjm + g2
+                        v28 = t[i - 1, j - 1, k - 1, l, m] + weight * (sij + sik) + wg2 + g4
+                        v29 = t[i - 1, j - 1, k - 1, l, m - 1] + weight * (sij + sik + sim) + wg + g2 + sjm + skm
+                        v30 = t[i - 1, j - 1, k - 1, l - 1, m] + weight * (sij + sik + sil) + wg + sjl + g2 + skl
+                        v31 = t[i - 1, j - 1, k - 1, l - 1, m - 1] + weight * (sij + sik + sil + sim) + sjl + sjm + skl + skm
+                        t[i, j, k, l, m] = min(v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, v13, v14, v15, v16, v17, v18, v19, v20, v21, v22, v23, v24, v25, v26, v27, v28, v29, v30, v31)
+    return t
+
+
+def five_exact_alignment(seq0, seq1, seq2, seq3, seq4, weight=1, t=None, scheme=None):
+    """return the optimal alignment for 5 sequences, based on the graph configuration of l-star"""
+    scheme = scheme or default_scheme
+    gap = scheme.gap
+    # substitution costs between the pairs of sequences
+    c01, c02 = scheme.costs(seq0, seq1), scheme.costs(seq0, seq2)
+    c03, c04 = scheme.costs(seq0, seq3), scheme.costs(seq0, seq4)
+    c12, c13, c14 = scheme.costs(seq1, seq2), scheme.costs(seq1, seq3), scheme.costs(seq1, seq4)
+    c23, c24, c34 = scheme.costs(seq2, seq3), scheme.costs(seq2, seq4), scheme.costs(seq3, seq4)
+    # fill out the dynamic table t, unless it is given
+    if t is None:
+        t = dynamic_table_5D(seq0, seq1, seq2, seq3, seq4, weight, scheme)
+    wg = weight * gap
+    wg2, wg3, wg4 = wg * 2, wg * 3, wg * 4
+    g2, g3, g4 = gap * 2, gap * 3, gap * 4
+    # compute an alignment
+    a0, a1, a2, a3, a4 = deque(), deque(), deque(), deque(), deque()
+    i, j, k, l, m = len(seq0), len(seq1), len(seq2), len(seq3), len(seq4)
+    while i > 0 and j > 0 and k > 0 and l > 0 and m > 0:
+        v = t[i, j, k, l, m]
+        if v == t[i, j, k, l, m - 1] + wg + g3:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft(seq4[m-1])
+            m -= 1
+        elif v == t[i, j, k, l - 1, m] + wg + g3:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft(seq3[l-1])
+            a4.appendleft('-')
+            l -= 1
+        elif v == t[i, j, k, l - 1, m - 1] + wg2 + g4 + c34[l-1][m-1]:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            l -= 1
+            m -= 1
+        elif v == t[i, j, k - 1, l, m] + wg + g3:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft(seq2[k-1])
+            a3.appendleft('-')
+            a4.appendleft('-')
+            k -= 1
+        elif v == t[i, j, k - 1, l, m - 1] + wg2 + g4 + c24[k-1][m-1]:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft(seq2[k-1])
+            a3.appendleft('-')
+            a4.appendleft(seq4[m-1])
+            k -= 1
+            m -= 1
+        elif v == t[i, j, k - 1, l - 1, m] + wg2 + g4 + c23[k-1][l-1]:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            k -= 1
+            l -= 1
+        elif v == t[i, j, k - 1, l - 1, m - 1] + wg3 + g3 + c23[k-1][l-1] + c24[k-1][m-1] + c34[l-1][m-1]:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            k -= 1
+            l -= 1
+            m -= 1
+        elif v == t[i, j - 1, k, l, m] + wg + g3:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft('-')
+            j -= 1
+        elif v == t[i, j - 1, k, l, m - 1] + wg2 + g4 + c14[j-1][m-1]:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            j -= 1
+            m -= 1
+        elif v == t[i, j - 1, k, l - 1, m] + wg2 + c13[j-1][l-1] + g4:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            j -= 1
+            l -= 1
+        elif v == t[i, j - 1, k, l - 1, m - 1] + wg3 + c13[j-1][l-1] + c14[j-1][m-1] + c34[l-1][m-1] + g3:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            j -= 1
+            l -= 1
+            m -= 1
+        elif v == t[i, j - 1, k - 1, l, m] + wg2 + c12[j-1][k-1] + g4:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft('-')
+            j -= 1
+            k -= 1
+        elif v == t[i, j - 1, k - 1, l, m - 1] + wg3 + g3 + c12[j-1][k-1] + c14[j-1][m-1] + c24[k-1][m-1]:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            j -= 1
+            k -= 1
+            m -= 1
+        elif v == t[i, j - 1, k - 1, l - 1, m] + wg3 + c12[j-1][k-1] + c13[j-1][l-1] + g3 + c23[k-1][l-1]:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            j -= 1
+            k -= 1
+            l -= 1
+        elif v == t[i, j - 1, k - 1, l - 1, m - 1] + wg4 + c12[j-1][k-1] + c13[j-1][l-1] + c14[j-1][m-1] + c23[k-1][l-1] + c24[k-1][m-1] + c34[l-1][m-1]:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            j -= 1
+            k -= 1
+            l -= 1
+            m -= 1
+        elif v == t[i - 1, j, k, l, m] + wg4:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft('-')
+            i -= 1
+        elif v == t[i - 1, j, k, l, m - 1] + wg3 + c04[i-1][m-1] * weight + g3:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            m -= 1
+        elif v == t[i - 1, j, k, l - 1, m] + wg3 + weight * c03[i-1][l-1] + g3:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            i -= 1
+            l -= 1
+        elif v == t[i - 1, j, k, l - 1, m - 1] + wg2 + weight * (c03[i-1][l-1] + c04[i-1][m-1]) + c34[l-1][m-1] + g4:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            l -= 1
+            m -= 1
+        elif v == t[i - 1, j, k - 1, l, m] + wg3 + weight * c02[i-1][k-1] + g3:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft('-')
+            i -= 1
+            k -= 1
+        elif v == t[i - 1, j, k - 1, l, m - 1] + wg2 + weight * (c02[i-1][k-1] + c04[i-1][m-1]) + g4 + c24[k-1][m-1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            k -= 1
+            m -= 1
+        elif v == t[i - 1, j, k - 1, l - 1, m] + wg2 + weight * (c02[i-1][k-1] + c03[i-1][l-1]) + g4 + c23[k-1][l-1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            i -= 1
+            k -= 1
+            l -= 1
+        elif v == t[i - 1, j, k - 1, l - 1, m - 1] + wg + weight * (c02[i-1][k-1] + c03[i-1][l-1] + c04[i-1][m-1]) + g3 + c23[k-1][l-1] + c24[k-1][m-1] + c34[l-1][m-1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            k -= 1
+            l -= 1
+            m -= 1
+        elif v == t[i - 1, j - 1, k, l, m] + weight * c01[i-1][j-1] + wg3 + g3:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft('-')
+            i -= 1
+            j -= 1
+        elif v == t[i - 1, j - 1, k, l, m - 1] + weight * (c01[i-1][j-1] + c04[i-1][m-1]) + wg2 + g4 + c14[j-1][m-1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            j -= 1
+            m -= 1
+        elif v == t[i - 1, j - 1, k, l - 1, m] + weight * (c01[i-1][j-1] + c03[i-1][l-1]) + wg2 + c13[j-1][l-1] + g4:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            i -= 1
+            j -= 1
+            l -= 1
+        elif v == t[i - 1, j - 1, k, l - 1, m - 1] + weight * (c01[i-1][j-1] + c03[i-1][l-1] + c04[i-1][m-1]) + wg + c13[j-1][l-1] + c14[j-1][m-1] + c34[l-1][m-1] + g3:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            j -= 1
+            l -= 1
+            m -= 1
+        elif v == t[i - 1, j - 1, k - 1, l, m] + weight * (c01[i-1][j-1] + c02[i-1][k-1]) + wg2 + g4 + c12[j-1][k-1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft('-')
+            i -= 1
+            j -= 1
+            k -= 1
+        elif v == t[i - 1, j - 1, k - 1, l, m - 1] + weight * (c01[i-1][j-1] + c02[i-1][k-1] + c04[i-1][m-1]) + wg + g3 + c12[j-1][k-1] + c14[j-1][m-1] + c24[k-1][m-1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            j -= 1
+            k -= 1
+            m -= 1
+        elif v == t[i - 1, j - 1, k - 1, l - 1, m] + weight * (c01[i-1][j-1] + c02[i-1][k-1] + c03[i-1][l-1]) + wg + c12[j-1][k-1] + c13[j-1][l-1] + g3 + c23[k-1][l-1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            i -= 1
+            j -= 1
+            k -= 1
+            l -= 1
+        elif v == t[i - 1, j - 1, k - 1, l - 1, m - 1] + weight * (c01[i-1][j-1] + c02[i-1][k-1] + c03[i-1][l-1] + c04[i-1][m-1]) + c12[j-1][k-1] + c13[j-1][l-1] + c14[j-1][m-1] + c23[k-1][l-1] + c24[k-1][m-1] + c34[l-1][m-1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            j -= 1
+            k -= 1
+            l -= 1
+            m -= 1
+        else:
+            raise Exception("Backtracking Failed")
+    while i > 0 or j > 0 or k > 0 or l > 0 or m > 0:
+        v = t[i, j, k, l, m]
+        if m > 0 and v == t[i, j, k, l, m - 1] + wg + g3:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft(seq4[m-1])
+            m -= 1
+        elif l > 0 and v == t[i, j, k, l - 1, m] + wg + g3:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft(seq3[l-1])
+            a4.appendleft('-')
+            l -= 1
+        elif l > 0 and m > 0 and v == t[i, j, k, l - 1, m - 1] + wg2 + g4 + c34[l-m][m-1]:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            l -= 1
+            m -= 1
+        elif k > 0 and v == t[i, j, k - 1, l, m] + wg + g3:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft(seq2[k-1])
+            a3.appendleft('-')
+            a4.appendleft('-')
+            k -= 1
+        elif k > 0 and m > 0 and v == t[i, j, k - 1, l, m - 1] + wg2 + g4 + c24[k-1][m-1]:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft(seq2[k-1])
+            a3.appendleft('-')
+            a4.appendleft(seq4[m-1])
+            k -= 1
+            m -= 1
+        elif k > 0 and l > 0 and v == t[i, j, k - 1, l - 1, m] + wg2 + g4 + c23[k-1][l-1]:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            k -= 1
+            l -= 1
+        elif k > 0 and l > 0 and m > 0 and v == t[i, j, k - 1, l - 1, m - 1] + wg3 + g3 + c23[k-1][l-1] + c24[k-1][m-1] + c34[l-m][m-1]:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            k -= 1
+            l -= 1
+            m -= 1
+        elif j > 0 and v == t[i, j - 1, k, l, m] + wg + g3:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft('-')
+            j -= 1
+        elif j > 0 and m > 0 and v == t[i, j - 1, k, l, m - 1] + wg2 + g4 + c14[j-1][m-1]:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            j -= 1
+            m -= 1
+        elif j > 0 and l > 0 and v == t[i, j - 1, k, l - 1, m] + wg2 + c13[j-1][l-1] + g4:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            j -= 1
+            l -= 1
+        elif j > 0 and l > 0 and m > 0 and v == t[i, j - 1, k, l - 1, m - 1] + wg3 + c13[j-1][l-1] + c14[j-1][m-1] + c34[l-m][m-1] + g3:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            j -= 1
+            l -= 1
+            m -= 1
+        elif j > 0 and k > 0 and v == t[i, j - 1, k - 1, l, m] + wg2 + c12[j-1][k-1] + g4:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft('-')
+            j -= 1
+            k -= 1
+        elif j > 0 and k > 0 and m > 0 and v == t[i, j - 1, k - 1, l, m - 1] + wg3 + g3 + c12[j-1][k-1] + c14[j-1][m-1] + c24[k-1][m-1]:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            j -= 1
+            k -= 1
+            m -= 1
+        elif j > 0 and k > 0 and l > 0 and v == t[i, j - 1, k - 1, l - 1, m] + wg3 + c12[j-1][k-1] + c13[j-1][l-1] + g3 + c23[k-1][l-1]:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            j -= 1
+            k -= 1
+            l -= 1
+        elif j > 0 and k > 0 and l > 0 and m > 0 and v == t[i, j - 1, k - 1, l - 1, m - 1] + wg4 + c12[j-1][k-1] + c13[j-1][l-1] + c14[j-1][m-1] + c23[k-1][l-1] + c24[k-1][m-1] + c34[l-m][m-1]:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            j -= 1
+            k -= 1
+            l -= 1
+            m -= 1
+        elif i > 0 and v == t[i - 1, j, k, l, m] + wg4:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft('-')
+            i -= 1
+        elif i > 0 and m > 0 and v == t[i - 1, j, k, l, m - 1] + wg3 + c04[i-1][m-1] * weight + g3:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            m -= 1
+        elif i > 0 and l > 0 and v == t[i - 1, j, k, l - 1, m] + wg3 + weight * c03[i-1][l-1] + g3:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            i -= 1
+            l -= 1
+        elif i > 0 and l > 0 and m > 0 and v == t[i - 1, j, k, l - 1, m - 1] + wg2 + weight * (c03[i-1][l-1] + c04[i-1][m-1]) + c34[l-m][m-1] + g4:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            l -= 1
+            m -= 1
+        elif i > 0 and k > 0 and v == t[i - 1, j, k - 1, l, m] + wg3 + weight * c02[i-1][k-1] + g3:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft('-')
+            i -= 1
+            k -= 1
+        elif i > 0 and k > 0 and m > 0 and v == t[i - 1, j, k - 1, l, m - 1] + wg2 + weight * (c02[i-1][k-1] + c04[i-1][m-1]) + g4 + c24[k-1][m-1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            k -= 1
+            m -= 1
+        elif i > 0 and k > 0 and l > 0 and v == t[i - 1, j, k - 1, l - 1, m] + wg2 + weight * (c02[i-1][k-1] + c03[i-1][l-1]) + g4 + c23[k-1][l-1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            i -= 1
+            k -= 1
+            l -= 1
+        elif i > 0 and k > 0 and l > 0 and m > 0 and v == t[i - 1, j, k - 1, l - 1, m - 1] + wg + weight * (c02[i-1][k-1] + c03[i-1][l-1] + c04[i-1][m-1]) + g3 + c23[k-1][l-1] + c24[k-1][m-1] + c34[l-m][m-1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            k -= 1
+            l -= 1
+            m -= 1
+        elif i > 0 and j > 0 and v == t[i - 1, j - 1, k, l, m] + weight * c01[i-1][j-1] + wg3 + g3:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft('-')
+            i -= 1
+            j -= 1
+        elif i > 0 and j > 0 and m > 0 and v == t[i - 1, j - 1, k, l, m - 1] + weight * (c01[i-1][j-1] + c04[i-1][m-1]) + wg2 + g4 + c14[j-1][m-1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            j -= 1
+            m -= 1
+        elif i > 0 and j > 0 and l > 0 and v == t[i - 1, j - 1, k, l - 1, m] + weight * (c01[i-1][j-1] + c03[i-1][l-1]) + wg2 + c13[j-1][l-1] + g4:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            i -= 1
+            j -= 1
+            l -= 1
+        elif i > 0 and j > 0 and l > 0 and m > 0 and v == t[i - 1, j - 1, k, l - 1, m - 1] + weight * (c01[i-1][j-1] + c03[i-1][l-1] + c04[i-1][m-1]) + wg + c13[j-1][l-1] + c14[j-1][m-1] + c34[l-m][m-1] + g3:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            j -= 1
+            l -= 1
+            m -= 1
+        elif i > 0 and j > 0 and k > 0 and v == t[i - 1, j - 1, k - 1, l, m] + weight * (c01[i-1][j-1] + c02[i-1][k-1]) + wg2 + g4 + c12[j-1][k-1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft('-')
+            i -= 1
+            j -= 1
+            k -= 1
+        elif i > 0 and j > 0 and k > 0 and m > 0 and v == t[i - 1, j - 1, k - 1, l, m - 1] + weight * (c01[i-1][j-1] + c02[i-1][k-1] + c04[i-1][m-1]) + wg + g3 + c12[j-1][k-1] + c14[j-1][m-1] + c24[k-1][m-1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            j -= 1
+            k -= 1
+            m -= 1
+        elif i > 0 and j > 0 and k > 0 and l > 0 and v == t[i - 1, j - 1, k - 1, l - 1, m] + weight * (c01[i-1][j-1] + c02[i-1][k-1] + c03[i-1][l-1]) + wg + c12[j-1][k-1] + c13[j-1][l-1] + g3 + c23[k-1][l-1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            i -= 1
+            j -= 1
+            k -= 1
+            l -= 1
+        elif v == t[i - 1, j - 1, k - 1, l - 1, m - 1] + weight * (c01[i-1][j-1] + c02[i-1][k-1] + c03[i-1][l-1] + c04[i-1][m-1]) + c12[j-1][k-1] + c13[j-1][l-1] + c14[j-1][m-1] + c23[k-1][l-1] + c24[k-1][m-1] + c34[l-m][m-1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            j -= 1
+            k -= 1
+            l -= 1
+            m -= 1
+        else:
+            raise Exception("Backtracking Failed")
+    return a0, a1, a2, a3, a4
+
+
+def five_exact_alignment_2l_star(seq0, seq1, seq2, seq3, seq4, weight, t=None, scheme=None):
+    """return the optimal alignment for 5 sequences, based on the graph configuration of (2l-1)-star"""
+    scheme = scheme or default_scheme
+    gap = scheme.gap
+    # substitution costs between the pairs of sequences
+    c01, c02 = scheme.costs(seq0, seq1), scheme.costs(seq0, seq2)
+    c03, c04 = scheme.costs(seq0, seq3), scheme.costs(seq0, seq4)
+    c13, c14 = scheme.costs(seq1, seq3), scheme.costs(seq1, seq4)
+    c23, c24 = scheme.costs(seq2, seq3), scheme.costs(seq2, seq4)
+    # fill out the dynamic table t, unless it is given
+    if t is None:
+        t = dynamic_table_5D_2l_star(seq0, seq1, seq2, seq3, seq4, weight, scheme)
+    wg = weight * gap
+    wg2, wg3, wg4 = wg * 2, wg * 3, wg * 4
+    g2, g4 = gap * 2, gap * 4
+    # compute an alignment
+    a0, a1, a2, a3, a4 = deque(), deque(), deque(), deque(), deque()
+    i, j, k, l, m = len(seq0), len(seq1), len(seq2), len(seq3), len(seq4)
+    while i > 0 and j > 0 and k > 0 and l > 0 and m > 0:
+        v = t[i, j, k, l, m]
+        if v == t[i, j, k, l, m - 1] + wg + g2:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft(seq4[m-1])
+            m -= 1
+        elif v == t[i, j, k, l - 1, m] + wg + g2:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft(seq3[l-1])
+            a4.appendleft('-')
+            l -= 1
+        elif v == t[i, j, k, l - 1, m - 1] + wg2 + g4:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            l -= 1
+            m -= 1
+        elif v == t[i, j, k - 1, l, m] + wg + g2:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft(seq2[k-1])
+            a3.appendleft('-')
+            a4.appendleft('-')
+            k -= 1
+        elif v == t[i, j, k - 1, l, m - 1] + wg2 + g2 + c24[k - 1][m - 1]:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft(seq2[k-1])
+            a3.appendleft('-')
+            a4.appendleft(seq4[m-1])
+            k -= 1
+            m -= 1
+        elif v == t[i, j, k - 1, l - 1, m] + wg2 + g2 + c23[k - 1][l - 1]:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            k -= 1
+            l -= 1
+        elif v == t[i, j, k - 1, l - 1, m - 1] + wg3 + g2 + c23[k - 1][l - 1] + c24[k - 1][m - 1]:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            k -= 1
+            l -= 1
+            m -= 1
+        elif v == t[i, j - 1, k, l, m] + wg + g2:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft('-')
+            j -= 1
+        elif v == t[i, j - 1, k, l, m - 1] + wg2 + g2 + c14[j - 1][m - 1]:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            j -= 1
+            m -= 1
+        elif v == t[i, j - 1, k, l - 1, m] + wg2 + g2 + c13[j - 1][l - 1]:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            j -= 1
+            l -= 1
+        elif v == t[i, j - 1, k, l - 1, m - 1] + wg3 + g2 + c13[j - 1][l - 1] + c14[j - 1][m - 1]:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            j -= 1
+            l -= 1
+            m -= 1
+        elif v == t[i, j - 1, k - 1, l, m] + wg2 + g4:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft('-')
+            j -= 1
+            k -= 1
+        elif v == t[i, j - 1, k - 1, l, m - 1] + wg3 + g2 + c14[j - 1][m - 1] + c24[k - 1][m - 1]:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            j -= 1
+            k -= 1
+            m -= 1
+        elif v == t[i, j - 1, k - 1, l - 1, m] + wg3 + g2 + c13[j - 1][l - 1] + c23[k - 1][l - 1]:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            j -= 1
+            k -= 1
+            l -= 1
+        elif v == t[i, j - 1, k - 1, l - 1, m - 1] + wg4 + c13[j - 1][l - 1] + c14[j - 1][m - 1] + c23[k - 1][l - 1] + c24[k - 1][m - 1]:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            j -= 1
+            k -= 1
+            l -= 1
+            m -= 1
+        elif v == t[i - 1, j, k, l, m] + wg4:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft('-')
+            i -= 1
+        elif v == t[i - 1, j, k, l, m - 1] + wg3 + c04[i - 1][m - 1] * weight + g2:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            m -= 1
+        elif v == t[i - 1, j, k, l - 1, m] + wg3 + weight * c03[i - 1][l - 1] + g2:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            i -= 1
+            l -= 1
+        elif v == t[i - 1, j, k, l - 1, m - 1] + wg2 + weight * (c03[i - 1][l - 1] + c04[i - 1][m - 1]) + g4:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            l -= 1
+            m -= 1
+        elif v == t[i - 1, j, k - 1, l, m] + wg3 + weight * c02[i - 1][k - 1] + g2:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft('-')
+            i -= 1
+            k -= 1
+        elif v == t[i - 1, j, k - 1, l, m - 1] + wg2 + weight * (c02[i - 1][k - 1] + c04[i - 1][m - 1]) + g2 + c24[k - 1][m - 1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            k -= 1
+            m -= 1
+        elif v == t[i - 1, j, k - 1, l - 1, m] + wg2 + weight * (c02[i - 1][k - 1] + c03[i - 1][l - 1]) + g2 + c23[k - 1][l - 1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            i -= 1
+            k -= 1
+            l -= 1
+        elif v == t[i - 1, j, k - 1, l - 1, m - 1] + wg + weight * (c02[i - 1][k - 1] + c03[i - 1][l - 1] + c04[i - 1][m - 1]) + g2 + c23[k - 1][l - 1] + c24[k - 1][m - 1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            k -= 1
+            l -= 1
+            m -= 1
+        elif v == t[i - 1, j - 1, k, l, m] + weight * c01[i - 1][j - 1] + wg3 + g2:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft('-')
+            i -= 1
+            j -= 1
+        elif v == t[i - 1, j - 1, k, l, m - 1] + weight * (c01[i - 1][j - 1] + c04[i - 1][m - 1]) + wg2 + g2 + c14[j - 1][m - 1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            j -= 1
+            m -= 1
+        elif v == t[i - 1, j - 1, k, l - 1, m] + weight * (c01[i - 1][j - 1] + c03[i - 1][l - 1]) + wg2 + c13[j - 1][l - 1] + g2:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            i -= 1
+            j -= 1
+            l -= 1
+        elif v == t[i - 1, j - 1, k, l - 1, m - 1] + weight * (c01[i - 1][j - 1] + c03[i - 1][l - 1] + c04[i - 1][m - 1]) + wg + c13[j - 1][l - 1] + c14[j - 1][m - 1] + g2:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            j -= 1
+            l -= 1
+            m -= 1
+        elif v == t[i - 1, j - 1, k - 1, l, m] + weight * (c01[i - 1][j - 1] + c02[i - 1][k - 1]) + wg2 + g4:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft('-')
+            i -= 1
+            j -= 1
+            k -= 1
+        elif v == t[i - 1, j - 1, k - 1, l, m - 1] + weight * (c01[i - 1][j - 1] + c02[i - 1][k - 1] + c04[i - 1][m - 1]) + wg + g2 + c14[j - 1][m - 1] + c24[k - 1][m - 1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            j -= 1
+            k -= 1
+            m -= 1
+        elif v == t[i - 1, j - 1, k - 1, l - 1, m] + weight * (c01[i - 1][j - 1] + c02[i - 1][k - 1] + c03[i - 1][l - 1]) + wg + c13[j - 1][l - 1] + g2 + c23[k - 1][l - 1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            i -= 1
+            j -= 1
+            k -= 1
+            l -= 1
+        elif v == t[i - 1, j - 1, k - 1, l - 1, m - 1] + weight * (c01[i - 1][j - 1] + c02[i - 1][k - 1] + c03[i - 1][l - 1] + c04[i - 1][m - 1]) + c13[j - 1][l - 1] + c14[j - 1][m - 1] + c23[k - 1][l - 1] + c24[k - 1][m - 1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            j -= 1
+            k -= 1
+            l -= 1
+            m -= 1
+        else:
+            raise Exception("Backtracking Fail")
+    while i > 0 or j > 0 or k > 0 or l > 0 or m > 0:
+        v = t[i, j, k, l, m]
+        if m > 0 and v == t[i, j, k, l, m - 1] + wg + g2:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft(seq4[m-1])
+            m -= 1
+        elif l > 0 and v == t[i, j, k, l - 1, m] + wg + g2:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft(seq3[l-1])
+            a4.appendleft('-')
+            l -= 1
+        elif l > 0 and m > 0 and v == t[i, j, k, l - 1, m - 1] + wg2 + g4:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            l -= 1
+            m -= 1
+        elif k > 0 and v == t[i, j, k - 1, l, m] + wg + g2:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft(seq2[k-1])
+            a3.appendleft('-')
+            a4.appendleft('-')
+            k -= 1
+        elif k > 0 and m > 0 and v == t[i, j, k - 1, l, m - 1] + wg2 + g2 + c24[k - 1][m - 1]:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft(seq2[k-1])
+            a3.appendleft('-')
+            a4.appendleft(seq4[m-1])
+            k -= 1
+            m -= 1
+        elif k > 0 and l > 0 and v == t[i, j, k - 1, l - 1, m] + wg2 + g2 + c23[k - 1][l - 1]:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            k -= 1
+            l -= 1
+        elif k > 0 and l > 0 and m > 0 and v == t[i, j, k - 1, l - 1, m - 1] + wg3 + g2 + c23[k - 1][l - 1] + c24[k - 1][m - 1]:
+            a0.appendleft('-')
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            k -= 1
+            l -= 1
+            m -= 1
+        elif j > 0 and v == t[i, j - 1, k, l, m] + wg + g2:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft('-')
+            j -= 1
+        elif j > 0 and m > 0 and v == t[i, j - 1, k, l, m - 1] + wg2 + g2 + c14[j - 1][m - 1]:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            j -= 1
+            m -= 1
+        elif j > 0 and l > 0 and v == t[i, j - 1, k, l - 1, m] + wg2 + g2 + c13[j - 1][l - 1]:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            j -= 1
+            l -= 1
+        elif j > 0 and l > 0 and m > 0 and v == t[i, j - 1, k, l - 1, m - 1] + wg3 + g2 + c13[j - 1][l - 1] + c14[j - 1][m - 1]:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            j -= 1
+            l -= 1
+            m -= 1
+        elif j > 0 and k > 0 and v == t[i, j - 1, k - 1, l, m] + wg2 + g4:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft('-')
+            j -= 1
+            k -= 1
+        elif j > 0 and k > 0 and m > 0 and v == t[i, j - 1, k - 1, l, m - 1] + wg3 + g2 + c14[j - 1][m - 1] + c24[k - 1][m - 1]:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            j -= 1
+            k -= 1
+            m -= 1
+        elif j > 0 and k > 0 and l > 0 and v == t[i, j - 1, k - 1, l - 1, m] + wg3 + g2 + c13[j - 1][l - 1] + c23[k - 1][l - 1]:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            j -= 1
+            k -= 1
+            l -= 1
+        elif j > 0 and k > 0 and l > 0 and m > 0 and v == t[i, j - 1, k - 1, l - 1, m - 1] + wg4 + c13[j - 1][l - 1] + c14[j - 1][m - 1] + c23[k - 1][l - 1] + c24[k - 1][m - 1]:
+            a0.appendleft('-')
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            j -= 1
+            k -= 1
+            l -= 1
+            m -= 1
+        elif i > 0 and v == t[i - 1, j, k, l, m] + wg4:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft('-')
+            i -= 1
+        elif i > 0 and m > 0 and v == t[i - 1, j, k, l, m - 1] + wg3 + c04[i - 1][m - 1] * weight + g2:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            m -= 1
+        elif i > 0 and l > 0 and v == t[i - 1, j, k, l - 1, m] + wg3 + weight * c03[i - 1][l - 1] + g2:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            i -= 1
+            l -= 1
+        elif i > 0 and l > 0 and m > 0 and v == t[i - 1, j, k, l - 1, m - 1] + wg2 + weight * (c03[i - 1][l - 1] + c04[i - 1][m - 1]) + g4:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            l -= 1
+            m -= 1
+        elif i > 0 and k > 0 and v == t[i - 1, j, k - 1, l, m] + wg3 + weight * c02[i - 1][k - 1] + g2:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft('-')
+            i -= 1
+            k -= 1
+        elif i > 0 and k > 0 and m > 0 and v == t[i - 1, j, k - 1, l, m - 1] + wg2 + weight * (c02[i - 1][k - 1] + c04[i - 1][m - 1]) + g2 + c24[k - 1][m - 1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            k -= 1
+            m -= 1
+        elif i > 0 and k > 0 and l > 0 and v == t[i - 1, j, k - 1, l - 1, m] + wg2 + weight * (c02[i - 1][k - 1] + c03[i - 1][l - 1]) + g2 + c23[k - 1][l - 1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            i -= 1
+            k -= 1
+            l -= 1
+        elif i > 0 and k > 0 and l > 0 and m > 0 and v == t[i - 1, j, k - 1, l - 1, m - 1] + wg + weight * (c02[i - 1][k - 1] + c03[i - 1][l - 1] + c04[i - 1][m - 1]) + g2 + c23[k - 1][l - 1] + c24[k - 1][m - 1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft('-')
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            k -= 1
+            l -= 1
+            m -= 1
+        elif i > 0 and j > 0 and v == t[i - 1, j - 1, k, l, m] + weight * c01[i - 1][j - 1] + wg3 + g2:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft('-')
+            i -= 1
+            j -= 1
+        elif i > 0 and j > 0 and m > 0 and v == t[i - 1, j - 1, k, l, m - 1] + weight * (c01[i - 1][j - 1] + c04[i - 1][m - 1]) + wg2 + g2 + c14[j - 1][m - 1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            j -= 1
+            m -= 1
+        elif i > 0 and j > 0 and l > 0 and v == t[i - 1, j - 1, k, l - 1, m] + weight * (c01[i - 1][j - 1] + c03[i - 1][l - 1]) + wg2 + c13[j - 1][l - 1] + g2:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            i -= 1
+            j -= 1
+            l -= 1
+        elif i > 0 and j > 0 and l > 0 and m > 0 and v == t[i - 1, j - 1, k, l - 1, m - 1] + weight * (c01[i - 1][j - 1] + c03[i - 1][l - 1] + c04[i - 1][m - 1]) + wg + c13[j - 1][l - 1] + c14[j - 1][m - 1] + g2:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft('-')
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            j -= 1
+            l -= 1
+            m -= 1
+        elif i > 0 and j > 0 and k > 0 and v == t[i - 1, j - 1, k - 1, l, m] + weight * (c01[i - 1][j - 1] + c02[i - 1][k - 1]) + wg2 + g4:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft('-')
+            i -= 1
+            j -= 1
+            k -= 1
+        elif i > 0 and j > 0 and k > 0 and m > 0 and v == t[i - 1, j - 1, k - 1, l, m - 1] + weight * (c01[i - 1][j - 1] + c02[i - 1][k - 1] + c04[i - 1][m - 1]) + wg + g2 + c14[j - 1][m - 1] + c24[k - 1][m - 1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft('-')
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            j -= 1
+            k -= 1
+            m -= 1
+        elif i > 0 and j > 0 and k > 0 and l > 0 and v == t[i - 1, j - 1, k - 1, l - 1, m] + weight * (c01[i - 1][j - 1] + c02[i - 1][k - 1] + c03[i - 1][l - 1]) + wg + c13[j - 1][l - 1] + g2 + c23[k - 1][l - 1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft('-')
+            i -= 1
+            j -= 1
+            k -= 1
+            l -= 1
+        elif v == t[i - 1, j - 1, k - 1, l - 1, m - 1] + weight * (c01[i - 1][j - 1] + c02[i - 1][k - 1] + c03[i - 1][l - 1] + c04[i - 1][m - 1]) + c13[j - 1][l - 1] + c14[j - 1][m - 1] + c23[k - 1][l - 1] + c24[k - 1][m - 1]:
+            a0.appendleft(seq0[i - 1])
+            a1.appendleft(seq1[j - 1])
+            a2.appendleft(seq2[k - 1])
+            a3.appendleft(seq3[l - 1])
+            a4.appendleft(seq4[m - 1])
+            i -= 1
+            j -= 1
+            k -= 1
+            l -= 1
+            m -= 1
+        else:
+            raise Exception("Backtracking Fail")
+    return a0, a1, a2, a3, a4
@@ -0,0 +1,85 @@
+"""
+local search refinement of l-stars: starting from any l-star, e.g. of the randomized or paired algorithms, vertices
+are swapped between cliques and the center is relocated as long as the sp score improves
+"""
+import time
+import instrument
+from itertools import combinations
+from helpers import sp_score_clique
+
+
+def clique_key(clique):
+    """the key of a clique in a clique score cache, its score does not depend on the order of the non-center vertices"""
+    return (clique[0],) + tuple(sorted(clique[1:]))
+
+
+def cached_score(seqs, clique, k, l, cache, scheme=None, weights=None):
+    """return the sp score of a clique from cache, scoring and adding it if it is not there yet"""
+    key = clique_key(clique)
+    if key not in cache:
+        cache[key] = sp_score_clique(seqs, clique, k, l, scheme, weights)
+    else:
+        instrument.count("clique_cache_hits")
+    return cache[key]
+
+
+def split_star(star, l):
+    """return the l-star of a star, splitting the cliques of a (2l-1)-star into their two l-cliques"""
+    if len(star[0]) == l:
+        return [tuple(clique) for clique in star]
+    return [half for clique in star for half in (tuple(clique[:l]), (clique[0],) + tuple(clique[l:]))]
+
+
+def swap_moves(star, l):
+    """yield (a, b, clique a, clique b) for every swap of two non-center vertices of cliques a and b"""
+    for a, b in combinations(range(len(star)), 2):
+        for i in range(1, l):
+            for j in range(1, l):
+                clique_a = star[a][:i] + (star[b][j],) + star[a][i + 1:]
+                clique_b = star[b][:j] + (star[a][i],) + star[b][j + 1:]
+                yield a, b, clique_a, clique_b
+
+
+def relocate_center(star, v):
+    """return the star with vertex v as its center, the old center taking the place of v in its clique"""
+    c = star[0][0]
+    return [(v,) + tuple(c if u == v else u for u in clique[1:]) for clique in star]
+
+
+def refine_l_star(seqs, l_star, k, l, time_budget=None, cache=None, scheme=None, weights=None):
+    """
+    improve an l-star by local search and return it with its sp score. a pass tries all swaps of two vertices of
+    different cliques, then all relocations of the center, and takes every improvement as soon as it is found.
+    passes are repeated until none improves or time_budget seconds have passed. cliques are scored on demand into
+    cache, a dict that can be shared between calls on the same seqs and weights, the copies of the sequences, for
+    l = 2 only. a (2l-1)-star is refined as the l-star of its halves
+    """
+    if weights is not None and l != 2:
+        raise ValueError(f"weights, collapsed duplicates, are only exact for l = 2, not l={l}")
+    cache = {} if cache is None else cache
+    deadline = time.perf_counter() + time_budget if time_budget is not None else float("inf")
+    star = split_star(l_star, l)
+    with instrument.span("local_search"):
+        scores = [cached_score(seqs, clique, k, l, cache, scheme, weights) for clique in star]
+        improved = True
+        while improved:
+            improved = False
+            for a, b, clique_a, clique_b in swap_moves(star, l):
+                if time.perf_counter() > deadline:
+                    return star, sum(scores)
+                score_a = cached_score(seqs, clique_a, k, l, cache, scheme, weights)
+                score_b = cached_score(seqs, clique_b, k, l, cache, scheme, weights)
+                if score_a + score_b < scores[a] + scores[b]:
+                    star[a], star[b], scores[a], scores[b] = clique_a, clique_b, score_a, score_b
+                    instrument.count("local_search_moves")
+                    improved = True
+            for v in sorted(v for clique in star for v in clique[1:]):
+                if time.perf_counter() > deadline:
+                    return star, sum(scores)
+                candidate = relocate_center(star, v)
+                candidate_scores = [cached_score(seqs, clique, k, l, cache, scheme, weights) for clique in candidate]
+                if sum(candidate_scores) < sum(scores):
+                    star, scores = candidate, candidate_scores
+                    instrument.count("local_search_moves")
+                    improved = True
+    return star, sum(scores)
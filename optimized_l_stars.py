@@ -2,64 +2,320 @@
 optimized l-stars algorithm
 """
 import sys
-from helpers import *
+import instrument
+import planner
+import numpy as np
+from math import comb
+from helpers import sp_score_clique, pairwise_distance_matrix, select_centers
 from itertools import combinations
 
+# positions of the (collection, next clique) pairs of a step of the dynamic programming handled at once, this bounds
+# the temporary arrays of a step to a few MiB
+CHUNK_POSITIONS = 2 ** 17
 
-def sp_score_for_all_cliques(seqs, k, l):
-    """return a dictionary containing sp score for all possible cliques"""
+# centers whose dynamic programming has up to this many (collection, next clique) pairs in all, see dp_positions,
+# are solved one pair at a time on tuples by dp_scalar, the array operations of dp_step cost more than they save
+# on the few collections of small families
+SCALAR_POSITIONS = 2 ** 9
+
+
+def sp_score_for_all_cliques(seqs, k, l, scheme=None, centers=None, weights=None, distances=None, mode=None):
+    """
+    return a dictionary containing sp score for all possible cliques, or those of the given centers, weighted by the
+    copies of the sequences if weights is given. for l = 2 the cliques are the pairs of a center, scored from the
+    pairwise distances, those given or of helpers.pairwise_distance_matrix, weighted like in sp_score_clique.
+    mode is the planner mode of the other clique tables, see sp_score_clique
+    """
     scores = {}
-    for c in range(k):
+    if l == 2:
+        distances = pairwise_distance_matrix(seqs, scheme) if distances is None else distances
+        copies = np.ones(k) if weights is None else np.asarray(weights, dtype=np.float64)
+        centers = list(range(k) if centers is None else centers)
+        rows = (distances[centers] * (copies.sum() - 1) * copies).tolist()
+        instrument.count("cliques_scored", len(centers) * (k - 1))
+        for c, row in zip(centers, rows):
+            scores.update(((c, v), row[v]) for v in range(k) if v != c)
+        return scores
+    for c in range(k) if centers is None else centers:
         for comb in combinations([i for i in range(k) if i != c], l - 1):
             clique = (c,) + comb
-            scores[clique] = sp_score_clique(seqs, clique, k, l)
+            scores[clique] = sp_score_clique(seqs, clique, k, l, scheme, weights, mode)
     return scores
 
 
-def find_next_cliques(nodes, l, c):
-    """yield all available next cliques given a list of nodes which are not added to an l-star"""
-    for comb in combinations(nodes[1:], l - 2):
-        clique = (c, nodes[0]) + comb
-        yield clique
+def clique_lower_bounds(distances, c, members, k, l, weights=None):
+    """
+    return lower bounds of the sp scores of the cliques of center c, given as rows of members: the optimal pairwise
+    scores of their pairs, weighted like in sp_score_clique, since every pair of a clique alignment is at least that
+    """
+    if weights is None:
+        weights = np.ones(len(distances))
+    weights = np.asarray(weights)
+    k = weights.sum()
+    bounds = (k - (l - 1)) * (distances[c, members] * weights[members]).sum(axis=1)
+    for a, b in combinations(range(l - 1), 2):
+        bounds += distances[members[:, a], members[:, b]] * weights[members[:, a]] * weights[members[:, b]]
+    # keep the bounds below the scores in spite of rounding
+    return bounds - 1e-9 * np.abs(bounds)
+
+
+def ranking_tables(n):
+    """
+    return the array of the contributions tables[step, i, p] of the vertex at position p, the i-th one after the
+    first step positions, to the rank of a collection of step cliques: the binomial coefficient (p - step, i + 1)
+    """
+    binom = np.zeros((n + 1, n + 2), dtype=np.int64)
+    binom[:, 0] = 1
+    for a in range(1, n + 1):
+        binom[a, 1:] = binom[a - 1, 1:] + binom[a - 1, :-1]
+    tables = np.zeros((n + 1, n, n), dtype=np.int64)
+    for step in range(n + 1):
+        tables[step, :, step:] = binom[:n - step, 1:n + 1].T
+    return tables
+
+
+def rank_collection(free, step, tables):
+    """
+    return the rank of a collection of step cliques among all of them, in the combinatorial number system.
+    free are the sorted positions of its vertices after the first step positions, which are in every collection,
+    or an array of them, one collection per row
+    """
+    free = np.asarray(free, dtype=np.intp)
+    return tables[step, np.arange(free.shape[-1]), free].sum(axis=-1)
+
+
+def unrank_collections(ranks, step, width, tables):
+    """return the sorted positions after the first step of the collections of step cliques of the given ranks"""
+    ranks = np.array(ranks, dtype=np.int64)
+    free = np.empty((len(ranks), width), dtype=np.intp)
+    for i in range(width, 0, -1):
+        # the largest position whose contribution as the i-th vertex fits the rank
+        contributions = tables[step, i - 1, step:]
+        free[:, i - 1] = step + np.searchsorted(contributions, ranks, side="right") - 1
+        ranks -= contributions[free[:, i - 1] - step]
+    return free
+
+
+def remaining_bounds(clique_scores, n, l, tables):
+    """
+    return lower bounds h of the vertices, such that the score of cliques covering a set of vertices is at least the
+    sum of their h: the least score per vertex of the cliques holding the vertex
+    """
+    cliques = unrank_collections(np.arange(len(clique_scores)), 0, l - 1, tables)
+    h = np.full(n, np.inf)
+    for j in range(l - 1):
+        np.minimum.at(h, cliques[:, j], clique_scores / (l - 1))
+    return h
 
 
-def find_current_collection(nodes, step, l):
-    """yield all collections of vertices at the current step"""
-    for comb in combinations(nodes[step:], step * (l - 2)):
-        yield (*nodes[:step],) + comb
+def dp_step(step, dp_scores, clique_scores, n, l, tables, h=None, incumbent=np.inf, exact=None, score_cliques=None):
+    """
+    extend the collections of step cliques by a next clique, which holds the first vertex left and l - 2 others,
+    and return the scores of the collections of step + 1 cliques and the ranks of their best predecessors.
+    ties go to the first predecessor and next clique in lexicographic order.
+    given the vertex bounds h of remaining_bounds, collections whose score plus the bound of the vertices they
+    leave exceeds the incumbent are dropped, they keep an infinite score and are not extended by the next step.
+    if exact is given, clique_scores not marked exact are lower bounds, and score_cliques(ranks) is called to
+    replace them by the scores, and mark them exact, only for the cliques of the best extensions
+    """
+    width, size = step * (l - 2), (step + 1) * (l - 2)
+    left = n - step - width
+    next_scores = np.full(comb(n - step - 1, size), np.inf)
+    predecessors = np.zeros(len(next_scores), dtype=np.int32)
+    # positions of the other vertices of the next cliques among the vertices left
+    others = list(combinations(range(1, left), l - 2))
+    others = np.array(others, dtype=np.intp).reshape(len(others), l - 2)
+    # the collections left, in lexicographic order
+    live = np.flatnonzero(dp_scores < np.inf)
+    live_free = unrank_collections(live, step, width, tables)
+    if width:
+        order = np.lexsort(live_free.T[::-1])
+        live, live_free = live[order], live_free[order]
+    instrument.count("dp_collections", len(live))
+    if h is not None:
+        # bound of the vertices left by a collection of step + 1 cliques, without those of its free positions
+        h_left = h.sum() - h[:step + 1].sum()
+        tolerance = 1e-9 * max(1.0, abs(incumbent))
+    chunk = max(1, CHUNK_POSITIONS // (len(others) * (size + 2)))
+    for start in range(0, len(live), chunk):
+        ranks, free = live[start:start + chunk], live_free[start:start + chunk]
+        # the vertices left by every collection, in order
+        is_left = np.ones((len(free), n), dtype=bool)
+        is_left[:, :step] = False
+        is_left[np.arange(len(free))[:, None], free] = False
+        left_positions = np.nonzero(is_left)[1].reshape(len(free), left)
+        cliques = np.concatenate([np.broadcast_to(left_positions[:, None, :1], (len(free), len(others), 1)),
+                                  left_positions[:, others]], axis=2)
+        # the new collection holds the first step + 1 positions, its other positions are ranked
+        new = np.sort(np.concatenate([np.broadcast_to(free[:, None, :], (len(free), len(others), width)),
+                                      cliques], axis=2), axis=2)[:, :, 1:]
+        new_ranks = rank_collection(new, step + 1, tables).ravel()
+        clique_ranks = rank_collection(cliques, 0, tables).ravel()
+        partial = np.repeat(dp_scores[ranks], len(others))
+        if h is not None:
+            rest = h_left - h[new].sum(axis=2).ravel()
+        while True:
+            scores = partial + clique_scores[clique_ranks]
+            if h is not None:
+                scores[scores + rest > incumbent + tolerance] = np.inf
+            # the best score of every new collection in the chunk, the first one of equal scores, improving on
+            # earlier chunks
+            order = np.lexsort((scores, new_ranks))
+            first = np.ones(len(order), dtype=bool)
+            first[1:] = new_ranks[order[1:]] != new_ranks[order[:-1]]
+            best = order[first]
+            better = best[scores[best] < next_scores[new_ranks[best]]]
+            if exact is None:
+                break
+            # the best extensions are final once their cliques are scored, others can only get worse by scoring
+            unscored = np.unique(clique_ranks[better][~exact[clique_ranks[better]]])
+            if not len(unscored):
+                break
+            score_cliques(unscored)
+        next_scores[new_ranks[better]] = scores[better]
+        predecessors[new_ranks[better]] = ranks[better // len(others)]
+    return next_scores, predecessors
 
 
-def find_optimal_l_star(seqs, k, l):
-    """given k, l, return the l-star with optimal sp score for seqs using optimized l-stars algorithm"""
-    # precalculate clique scores
-    scores = sp_score_for_all_cliques(seqs, k, l)
+def dp_positions(n, l):
+    """return the number of (collection, next clique) pairs of the dynamic programming of a center"""
+    return sum(comb(n - step, step * (l - 2)) * comb(n - step - step * (l - 2) - 1, l - 2)
+               for step in range(n // (l - 1)))
 
-    # find optimal l-star for each choice of center
-    opt_star, opt_score = None, sys.maxsize
-    for c in range(k):
-        # pre-fill the dynamic table
-        vertices = tuple(v for v in range(k) if v != c)
+
+def dp_scalar(scores, c, vertices, l):
+    """
+    return the optimal score and l-star of center c over the other vertices, in order, given the clique scores of
+    sp_score_for_all_cliques, extending the collections by a next clique one pair at a time in dicts of tuples of
+    their vertices. ties are broken like in dp_step
+    """
+    # the score and predecessor of every collection of every step
+    dp_tables = [{(): (0, None)}]
+    for step in range(len(vertices) // (l - 1)):
         dp_table = {}
-        for collection in find_current_collection(vertices, 1, l):
-            dp_table[collection] = (scores[(c,) + collection], ())
-
-        # fill out the dynamic table step by step
-        for step in range(1, (k - 1) // (l - 1)):
-            for collection in find_current_collection(vertices, step, l):
-                for next_clique in find_next_cliques([v for v in vertices if v not in collection], l, c):
-                    new_collection = tuple(sorted(collection + next_clique[1:]))
-                    new_score = dp_table[collection][0] + scores[next_clique]
-                    if new_collection not in dp_table or dp_table[new_collection][0] > new_score:
-                        dp_table[new_collection] = (new_score, collection)
-
-        # backtracking to find an optimal star for center c
-        final_score = dp_table[vertices][0]
-        if final_score < opt_score:
-            l_star = []
-            while vertices:
-                prev_collection = dp_table[vertices][1]
-                l_star.append((c,) + tuple(v for v in vertices if v not in prev_collection))
-                vertices = prev_collection
-            opt_star, opt_score = l_star, final_score
+        for collection in sorted(dp_tables[-1]):
+            score = dp_tables[-1][collection][0]
+            left = [v for v in vertices if v not in collection]
+            for others in combinations(left[1:], l - 2):
+                clique = (left[0],) + others
+                new_score = score + scores[(c,) + clique]
+                new_collection = tuple(sorted(collection + clique))
+                if new_collection not in dp_table or new_score < dp_table[new_collection][0]:
+                    dp_table[new_collection] = (new_score, collection)
+        dp_tables.append(dp_table)
+    collection = tuple(vertices)
+    final_score, l_star = dp_tables[-1][collection][0], []
+    for dp_table in reversed(dp_tables[1:]):
+        prev_collection = dp_table[collection][1]
+        l_star.append((c,) + tuple(v for v in collection if v not in prev_collection))
+        collection = prev_collection
+    return final_score, l_star
+
+
+def find_optimal_l_star(seqs, k, l, scheme=None, prune=False, lazy=False, centers="all", weights=None):
+    """
+    given k, l, return the l-star with optimal sp score for seqs using optimized l-stars algorithm.
+    with prune, the best arbitrary l-star of any center, and then the best l-star found so far, is an upper bound
+    of the optimal score. the centers are visited from the lowest bound of their score, centers that cannot beat the
+    upper bound are skipped and collections that cannot beat it are not extended, see dp_step.
+    with lazy, cliques start with the lower bounds of clique_lower_bounds and are only scored once they could be
+    the best extension of a collection. the result is the same in all cases. small families, see SCALAR_POSITIONS,
+    are solved by dp_scalar without pruning or lazy scoring, which would cost more than they save.
+    centers selects the centers tried, see helpers.select_centers. weights are the copies every sequence stands for,
+    see duplicates.collapse_duplicates, for l = 2 only
+    """
+    if l < 2 or k < l:
+        raise ValueError(f"l={l} needs 2 <= l <= k, the family has k={k} sequences")
+    if (k - 1) % (l - 1):
+        raise ValueError(f"k-1={k - 1} is not a multiple of l-1={l - 1}")
+    if weights is not None and l != 2:
+        raise ValueError(f"weights, collapsed duplicates, are only exact for l = 2, not l={l}")
+    # fail before any work if the cliques cannot be scored within the memory budget, the plan of the longest
+    # sequences holds for every clique
+    mode, _ = planner.plan_finder([len(s) for s in seqs], k, l, "optimized", align=False)["clique_score"]
+    n = k - 1
+    scalar = dp_positions(n, l) <= SCALAR_POSITIONS
+    prune, lazy = prune and not scalar, lazy and not scalar
+    distances = None
+    if lazy or centers != "all":
+        with instrument.span("pairwise_distances"):
+            distances = pairwise_distance_matrix(seqs, scheme)
+    selected = select_centers(seqs, centers, scheme, distances, weights)
+    # precalculate clique scores of the selected centers, or their lower bounds
+    if not lazy:
+        with instrument.span("clique_scoring"):
+            scores = sp_score_for_all_cliques(seqs, k, l, scheme, selected, weights, distances, mode)
+
+    # of equal scores, the star of the first center is kept
+    opt_star, opt_score, opt_center = None, sys.maxsize, k
+    if scalar:
+        for c in selected:
+            with instrument.span("center_dp"):
+                final_score, l_star = dp_scalar(scores, c, [v for v in range(k) if v != c], l)
+            if final_score < opt_score or (final_score == opt_score and c < opt_center):
+                opt_star, opt_score, opt_center = l_star, final_score, c
+        return opt_star, opt_score
+
+    # the vertices other than a center are referred to by their position, the scores of the cliques of each center
+    # are ranked into an array
+    tables = ranking_tables(n)
+    cliques = unrank_collections(np.arange(comb(n, l - 1)), 0, l - 1, tables)
+    center_vertices = [np.array([v for v in range(k) if v != c]) for c in range(k)]
+    center_scores, exact = [None] * k, [None] * k
+    for c in selected:
+        if lazy:
+            center_scores[c] = clique_lower_bounds(distances, c, center_vertices[c][cliques], k, l, weights)
+            exact[c] = np.zeros(len(cliques), dtype=bool)
+        else:
+            center_scores[c] = np.array([scores[(c,) + tuple(v.tolist())] for v in center_vertices[c][cliques]])
+
+    def score_cliques(c, ranks):
+        with instrument.span("clique_scoring"):
+            for rank in ranks:
+                clique = (c,) + tuple(center_vertices[c][cliques[rank]].tolist())
+                center_scores[c][rank] = sp_score_clique(seqs, clique, k, l, scheme, weights, mode)
+            exact[c][ranks] = True
+
+    incumbent, bounds = np.inf, [None] * k
+    if prune:
+        for c in selected:
+            bounds[c] = remaining_bounds(center_scores[c], n, l, tables)
+        selected = sorted(selected, key=lambda c: bounds[c].sum())
+        arbitrary = rank_collection(np.arange(n).reshape(-1, l - 1), 0, tables)
+        for c in selected:
+            if lazy:
+                score_cliques(c, arbitrary[~exact[c][arbitrary]])
+            incumbent = min(incumbent, center_scores[c][arbitrary].sum())
+
+    # find optimal l-star for each choice of center. the collections of cliques of each step are ranked into dense
+    # arrays of their scores and of the ranks of their predecessors, see dp_step. only the scores of the current
+    # step are kept
+    for c in selected:
+        upper = min(incumbent, opt_score)
+        if prune and bounds[c].sum() > upper + 1e-9 * max(1.0, abs(upper)):
+            instrument.count("centers_pruned")
+            continue
+        with instrument.span("center_dp"):
+            # fill out the dynamic table step by step, from the empty collection
+            dp_scores, predecessors = np.zeros(1), [None]
+            for step in range(n // (l - 1)):
+                dp_scores, step_predecessors = dp_step(step, dp_scores, center_scores[c], n, l, tables, bounds[c],
+                                                       min(incumbent, opt_score), exact[c],
+                                                       lambda ranks: score_cliques(c, ranks))
+                predecessors.append(step_predecessors)
+
+            # backtracking to find an optimal star for center c, from the collection of all vertices
+            final_score = dp_scores[0]
+            if final_score < opt_score or (final_score == opt_score and c < opt_center):
+                vertices = center_vertices[c].tolist()
+                l_star = []
+                collection, rank = range(n), 0
+                for step in range(n // (l - 1), 0, -1):
+                    rank = int(predecessors[step][rank])
+                    prev_collection = list(range(step - 1)) + list(
+                        unrank_collections([rank], step - 1, (step - 1) * (l - 2), tables)[0])
+                    l_star.append((c,) + tuple(vertices[p] for p in collection if p not in prev_collection))
+                    collection = prev_collection
+                opt_star, opt_score, opt_center = l_star, final_score, c
 
     return opt_star, opt_score
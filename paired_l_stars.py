@@ -2,8 +2,15 @@
 (2l-1)-stars algorithms
 """
 import sys
-from helpers import *
-import networkx as nx
+import heapq
+import instrument
+import planner
+import numpy as np
+from contextlib import contextmanager, nullcontext
+from multiprocessing import Pool
+from helpers import sp_score_clique, sp_score_clique_2l_star, sp_score_and_alignment_clique_2l_star, select_centers
+from matching import min_weight_matching
+from shared import DataPlane, attach, sequences
 
 
 def generate_l_star(k, l, center):
@@ -15,30 +22,123 @@ def generate_l_star(k, l, center):
     return l_star
 
 
-def graph(seqs, l_star, k, l):
-    """given sequences and an l-star, return the corresponding graph"""
+def edge_cost(seqs, clique):
+    """estimated cost of scoring a (2l-1)-clique, i.e. the number of cells of its dynamic table"""
+    cost = 1
+    for c in clique:
+        cost *= len(seqs[c]) + 1
+    return cost
+
+
+def balanced_chunks(pairs, costs, n_chunks):
+    """split pairs into n_chunks chunks of similar total cost, assigning the most expensive pairs first"""
+    chunks = [[] for _ in range(n_chunks)]
+    loads = [(0, i) for i in range(n_chunks)]
+    for cost, pair in sorted(zip(costs, pairs), reverse=True):
+        load, i = heapq.heappop(loads)
+        chunks[i].append(pair)
+        heapq.heappush(loads, (load + cost, i))
+    return [chunk for chunk in chunks if chunk]
+
+
+# per-process state of the graph workers, set by _init_graph_worker
+_worker = {}
+
+
+def _init_graph_worker(handle, k, l, scheme, budget):
+    # the workers fill out their tables at the same time, each gets its share of the memory budget
+    planner.set_budget(budget)
+    arrays = attach(handle, writable=True)
+    _worker.update(g=arrays["g"], seqs=sequences(arrays, "seqs"), l_star=arrays["l_star"], k=k, l=l, scheme=scheme)
+
+
+def _fill_edges(pairs):
+    g, seqs, k, l = _worker["g"], _worker["seqs"], _worker["k"], _worker["l"]
+    # the l-star of the current center, see graph
+    l_star = [tuple(clique) for clique in _worker["l_star"].tolist()]
+    for i, j in pairs:
+        g[i, j] = g[j, i] = sp_score_clique_2l_star(seqs, l_star[i]+l_star[j][1:], k, l, _worker["scheme"])
+
+
+@contextmanager
+def graph_workers(seqs, k, l, processes, scheme=None):
+    """
+    yield the workers of graph, a pool of processes and the shared.DataPlane they attach, which holds the sequences,
+    the matrix of the edge weights and the l-star, so that they serve the graphs of all centers
+    """
+    n = (k - 1) // (l - 1)
+    with DataPlane() as plane:
+        plane.zeros("g", (n, n))
+        plane.publish_sequences("seqs", seqs)
+        plane.zeros("l_star", (n, l), dtype=np.intp)
+        initargs = (plane.handle(), k, l, scheme, planner.budget() // processes)
+        with Pool(processes, initializer=_init_graph_worker, initargs=initargs) as pool:
+            yield pool, plane
+
+
+def graph(seqs, l_star, k, l, processes=None, scheme=None, workers=None):
+    """
+    given sequences and an l-star, return the corresponding graph.
+    with processes > 1 the edge weights are computed by the workers of graph_workers, those given or started for
+    this graph, writing into a shared matrix
+    """
     n = len(l_star)
-    g = np.zeros([n, n])
-    for i in range(n):
-        for j in range(i+1, n):
-            g[i, j] = g[j, i] = sp_score_clique_2l_star(seqs, l_star[i]+l_star[j][1:], k, l)
-    return g
+    if not processes or processes < 2 or n < 3:
+        g = np.zeros([n, n])
+        for i in range(n):
+            for j in range(i+1, n):
+                g[i, j] = g[j, i] = sp_score_clique_2l_star(seqs, l_star[i]+l_star[j][1:], k, l, scheme)
+        return g
+    if workers is None:
+        with graph_workers(seqs, k, l, processes, scheme) as workers:
+            return graph(seqs, l_star, k, l, processes, scheme, workers)
+
+    pairs = [(i, j) for i in range(n) for j in range(i+1, n)]
+    costs = [edge_cost(seqs, l_star[i]+l_star[j][1:]) for (i, j) in pairs]
+    chunks = balanced_chunks(pairs, costs, 4 * processes)
+    pool, plane = workers
+    shared_g = plane.arrays["g"]
+    shared_g[...] = 0
+    plane.arrays["l_star"][...] = l_star
+    pool.map(_fill_edges, chunks)
+    return shared_g.copy()
 
 
-def find_optimal_star(seqs, k, l):
-    """find the optimal 2l-1 star by iterating through all center strings"""
+def find_optimal_star(seqs, k, l, processes=None, alignments=None, scheme=None, centers="all"):
+    """
+    find the optimal 2l-1 star by iterating through all center strings, or those selected by helpers.select_centers.
+    if alignments is a dict, it gets the alignments of the (2l-1)-cliques of the star found, for align_2l_star,
+    backtracked once the search is over, so that only the cliques of that star are backtracked.
+    with processes > 1 the graphs of all centers are built by the same graph_workers. identical sequences are not
+    collapsed into weighted vertices (see duplicates.collapse_duplicates): the (2l-1)-clique kernels weigh their
+    pairs by the fixed weights of the configuration
+    """
+    if l < 2 or k < l:
+        raise ValueError(f"l={l} needs 2 <= l <= k, the family has k={k} sequences")
+    if (k - 1) % (l - 1):
+        raise ValueError(f"k-1={k - 1} is not a multiple of l-1={l - 1}")
+    planner.plan_finder([len(s) for s in seqs], k, l, "paired", processes, align=alignments is not None)
     opt_score, opt_star = sys.maxsize, None
-    for c in range(k):
-        # score of the chosen arbitrary l star
-        l_star = generate_l_star(k, l, c)
-        l_star_score = sum(sp_score_clique(seqs, clique, k, l) for clique in l_star)
-        if l_star_score < opt_score:
-            opt_score, opt_star = l_star_score, l_star
-        # find optimal (2l-1)-star
-        g = graph(seqs, l_star, k, l)
-        m = nx.min_weight_matching(nx.Graph(g))
-        temp_score = sum([g[a, b] for (a, b) in m])
-        if temp_score < opt_score:
-            opt_score = temp_score
-            opt_star = [l_star[a] + l_star[b][1:] for (a, b) in m]
+    parallel = processes and processes >= 2 and (k - 1) // (l - 1) >= 3
+    with graph_workers(seqs, k, l, processes, scheme) if parallel else nullcontext() as workers:
+        for c in select_centers(seqs, centers, scheme):
+            # score of the chosen arbitrary l star
+            l_star = generate_l_star(k, l, c)
+            with instrument.span("clique_scoring"):
+                l_star_score = sum(sp_score_clique(seqs, clique, k, l, scheme) for clique in l_star)
+            if l_star_score < opt_score:
+                opt_score, opt_star = l_star_score, l_star
+            # find optimal (2l-1)-star
+            with instrument.span("graph"):
+                g = graph(seqs, l_star, k, l, processes, scheme, workers)
+            with instrument.span("matching"):
+                m = min_weight_matching(g)
+            temp_score = sum([g[a, b] for (a, b) in m])
+            if temp_score < opt_score:
+                opt_score = temp_score
+                opt_star = [l_star[a] + l_star[b][1:] for (a, b) in m]
+    if alignments is not None and len(opt_star[0]) == 2 * l - 1:
+        with instrument.span("clique_alignment"):
+            for clique in opt_star:
+                _, alignments[clique] = sp_score_and_alignment_clique_2l_star(seqs, clique, k, l, scheme)
     return opt_star, opt_score
@@ -0,0 +1,167 @@
+"""
+memory planner: estimates the memory of the dynamic tables from the sequence lengths before anything is allocated,
+and picks a strategy that fits the memory budget, or fails fast
+"""
+
+import os
+import shutil
+import tempfile
+import numpy as np
+from math import prod
+
+ITEMSIZE = 8
+
+# the whole table in memory, only the slabs needed for the score (see helpers.dynamic_score), or the whole table
+# in a memory-mapped scratch file. the kernels sweep an out-of-core table end to end, its pages are kept resident
+# or written back by the operating system, so it is disk-backed with no bound on its resident memory.
+# there is no pruned mode, filling out only the cells within bounds like those of Carrillo and Lipman: how many
+# cells are pruned depends on the sequences, in the worst case none, so its memory cannot be planned from the
+# lengths alone
+FULL, ROLLING, OUT_OF_CORE = "full", "rolling", "out-of-core"
+
+# slabs of the table over all but the first sequence held at once by a rolling score: the previous and current
+# slab, and the candidate values and temporaries of the moves
+ROLLING_SLABS = 4
+
+# memory budget in bytes for the dynamic tables alive at the same time, None for the default, see set_budget,
+# the default budget once it is read, and the directory of the scratch files of out-of-core tables, None for the
+# default, see set_scratch
+_budget = {"bytes": None, "default": None, "scratch": None}
+
+
+# tables up to this fraction of the budget are kept in memory without planning, see small_table
+SMALL_TABLE = 2 ** -8
+
+
+class TableTooLarge(MemoryError):
+    """a dynamic table, or every strategy of computing it, needs more memory than the budget"""
+
+
+def parse_size(size):
+    """return a size given as a number of bytes or a string like "512M" or "8G" in bytes"""
+    if isinstance(size, str):
+        size = size.strip().upper().rstrip("B")
+        units = {"K": 2 ** 10, "M": 2 ** 20, "G": 2 ** 30, "T": 2 ** 40}
+        if size and size[-1] in units:
+            return int(float(size[:-1]) * units[size[-1]])
+    return int(float(size))
+
+
+def format_size(n):
+    for unit in ("B", "KiB", "MiB", "GiB", "TiB"):
+        if n < 1024 or unit == "TiB":
+            return f"{n:.1f}{unit}" if unit != "B" else f"{n}B"
+        n /= 1024
+
+
+def default_budget():
+    """the MSA_MEMORY_BUDGET environment variable if set, otherwise half of the physical memory"""
+    if os.environ.get("MSA_MEMORY_BUDGET"):
+        return parse_size(os.environ["MSA_MEMORY_BUDGET"])
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // 2
+    except (ValueError, OSError, AttributeError):
+        return 4 * 2 ** 30
+
+
+def set_budget(size=None):
+    """set the memory budget, as accepted by parse_size, or reset it to the default with None, read again"""
+    _budget["bytes"] = None if size is None else parse_size(size)
+    _budget["default"] = None
+
+
+def budget():
+    """the memory budget, see set_budget. the default budget is read once, planning happens for every table"""
+    if _budget["bytes"] is not None:
+        return _budget["bytes"]
+    if _budget["default"] is None:
+        _budget["default"] = default_budget()
+    return _budget["default"]
+
+
+def set_scratch(directory=None):
+    """set the directory of the scratch files of out-of-core tables, or reset it to the default with None"""
+    _budget["scratch"] = directory
+
+
+def scratch():
+    """the scratch directory: set by set_scratch, the MSA_SCRATCH environment variable or the temporary directory"""
+    return _budget["scratch"] or os.environ.get("MSA_SCRATCH") or tempfile.gettempdir()
+
+
+def small_table(sizes):
+    """whether a table of the given shape is far below the budget, so that it is kept in memory without planning"""
+    return prod(sizes) * ITEMSIZE <= budget() * SMALL_TABLE
+
+
+def table_bytes(lengths):
+    """bytes of the full dynamic table of sequences of the given lengths"""
+    return prod(n + 1 for n in lengths) * ITEMSIZE
+
+
+def rolling_bytes(lengths):
+    """peak bytes of a rolling score of sequences of the given lengths"""
+    return ROLLING_SLABS * prod(n + 1 for n in lengths[1:]) * ITEMSIZE
+
+
+def plan_table(lengths, rolling=False, out_of_core=False, limit=None):
+    """
+    return (mode, bytes) for the dynamic table of sequences of the given lengths: the full table if it fits the
+    budget, else a rolling score if rolling is possible, i.e. only the score is needed and the configuration is
+    supported by dynamic_score, else an out-of-core table if out_of_core is true and the scratch directory has
+    room for it. bytes is the memory of the table in the budget, None for an out-of-core table, which is on disk and
+    does not count against the budget. raise TableTooLarge if nothing fits
+    """
+    limit = budget() if limit is None else limit
+    full = table_bytes(lengths)
+    if full <= limit:
+        return FULL, full
+    if rolling and rolling_bytes(lengths) <= limit:
+        return ROLLING, rolling_bytes(lengths)
+    if out_of_core and full <= shutil.disk_usage(scratch()).free:
+        return OUT_OF_CORE, None
+    needed = f"{format_size(full)} as a full table"
+    if rolling:
+        needed += f", {format_size(rolling_bytes(lengths))} as a rolling score"
+    if out_of_core:
+        needed += (f", {format_size(full)} of free space in {scratch()} as an out-of-core table, which has "
+                   f"{format_size(shutil.disk_usage(scratch()).free)}")
+    raise TableTooLarge(f"the dynamic table of sequences of lengths {tuple(lengths)} needs {needed}, over the "
+                        f"memory budget of {format_size(limit)} (see planner.set_budget or MSA_MEMORY_BUDGET)")
+
+
+def plan_finder(lengths, k, l, finder, processes=1, align=True, limit=None):
+    """
+    plan the memory of every phase of a finder ("optimized", "paired" or "randomized"), followed by the alignment
+    of its star if align is true, for the worst case cliques of the longest sequences. return {phase: (mode, bytes)},
+    see plan_table, or raise TableTooLarge for the first phase that cannot fit the budget. concurrent workers share the budget
+    """
+    limit = budget() if limit is None else limit
+    longest = sorted(lengths, reverse=True)
+    phases = {"clique_score": (l, True, limit)}
+    if finder == "paired":
+        # the edges of the graph are scored by up to processes workers at once
+        per_worker = limit // max(processes or 1, 1)
+        phases["edge_score"] = (2 * l - 1, 2 * l - 1 <= 3, per_worker)
+    if align:
+        phases["alignment"] = (2 * l - 1 if finder == "paired" else l, False, limit)
+    plan = {}
+    for phase, (d, rolling, phase_limit) in phases.items():
+        try:
+            plan[phase] = plan_table(longest[:d], rolling, True, phase_limit)
+        except TableTooLarge as e:
+            raise TableTooLarge(f"{finder} l-stars with k={k}, l={l}, {phase}: {e}") from None
+    return plan
+
+
+def allocate(sizes, mode=FULL):
+    """
+    return a zeroed table of the given shape, in memory or, out-of-core, backed by an anonymous scratch file that
+    is removed as soon as the table is no longer referenced
+    """
+    if mode != OUT_OF_CORE:
+        return np.zeros(sizes)
+    with tempfile.TemporaryFile(dir=scratch(), prefix="msa-table-") as f:
+        f.truncate(prod(sizes) * ITEMSIZE)
+        # a plain array over the mapping, which the numba kernels accept as well
+        return np.asarray(np.memmap(f, dtype=np.float64, mode="r+", shape=tuple(sizes)))
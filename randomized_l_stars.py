@@ -3,27 +3,77 @@ randomized l-stars algorithm
 """
 import sys
 import math
-from random import sample
-from helpers import *
+import time
+import random
+import instrument
+import planner
+from helpers import sp_score_clique, select_centers
 
 
-def randomized_l_star(k, l, center):
+def randomized_l_star(k, l, center, rng=random):
     """generate a randomized l-star"""
-    random_sample = sample([i for i in range(k) if i != center], k-1)
+    random_sample = rng.sample([i for i in range(k) if i != center], k-1)
     l_star = []
     for i in range(0, k-1, l-1):
         l_star.append((center,) + tuple(random_sample[i:i+l-1]))
     return l_star
 
 
-def find_optimal_randomized_l_star(seqs, k, l, epsilon):
-    """find the optimal l-star returned by the randomized algorithm"""
+def number_of_trials(k, epsilon):
+    """return the number of randomized l-stars tried per center for a given epsilon"""
+    return int(2 * math.log(k / epsilon, 2))
+
+
+def find_optimal_randomized_l_star(seqs, k, l, epsilon, scheme=None, centers="all", weights=None):
+    """
+    find the optimal l-star returned by the randomized algorithm, for the centers selected by
+    helpers.select_centers, the cliques weighted by the copies of the sequences if weights is given, for l = 2 only
+    """
+    if weights is not None and l != 2:
+        raise ValueError(f"weights, collapsed duplicates, are only exact for l = 2, not l={l}")
+    mode, _ = planner.plan_finder([len(s) for s in seqs], k, l, "randomized", align=False)["clique_score"]
     opt_score, opt_star = sys.maxsize, None
-    for c in range(k):
-        for _ in range(int(2 * math.log(k / epsilon, 2))):
-            l_star = randomized_l_star(k, l, c)
-            tmp_score = sum([sp_score_clique(seqs, clique, k, l) for clique in l_star])
-            if tmp_score < opt_score:
-                opt_score = tmp_score
-                opt_star = l_star
+    for c in select_centers(seqs, centers, scheme, weights=weights):
+        with instrument.span("clique_scoring"):
+            for _ in range(number_of_trials(k, epsilon)):
+                l_star = randomized_l_star(k, l, c)
+                tmp_score = sum([sp_score_clique(seqs, clique, k, l, scheme, weights, mode) for clique in l_star])
+                if tmp_score < opt_score:
+                    opt_score = tmp_score
+                    opt_star = l_star
     return opt_star, opt_score
+
+
+def find_optimal_randomized_l_star_sweep(seqs, k, l, epsilons, seed=None, scheme=None, centers="all", weights=None):
+    """
+    run the randomized algorithm once for several epsilons, return {epsilon: (opt_star, opt_score, search_time)}.
+    the trials of a larger epsilon are a prefix of those of a smaller one, so the largest trial count is run once
+    per center and the best-so-far star is recorded at the checkpoint of every epsilon. search_time is the time
+    spent on the trials up to that checkpoint, i.e. the cost of running that epsilon on its own.
+    centers selects the centers tried, see helpers.select_centers, and weights the copies of the sequences, for
+    l = 2 only
+    """
+    if weights is not None and l != 2:
+        raise ValueError(f"weights, collapsed duplicates, are only exact for l = 2, not l={l}")
+    mode, _ = planner.plan_finder([len(s) for s in seqs], k, l, "randomized", align=False)["clique_score"]
+    rng = random.Random(seed)
+    checkpoints = {eps: number_of_trials(k, eps) for eps in epsilons}
+    results = {eps: (None, sys.maxsize, 0.0) for eps in epsilons}
+    for c in select_centers(seqs, centers, scheme, weights=weights):
+        center_star, center_score = None, sys.maxsize
+        start_time = time.perf_counter()
+        for trial in range(1, max(checkpoints.values()) + 1):
+            l_star = randomized_l_star(k, l, c, rng)
+            with instrument.span("clique_scoring"):
+                tmp_score = sum([sp_score_clique(seqs, clique, k, l, scheme, weights, mode) for clique in l_star])
+            if tmp_score < center_score:
+                center_score = tmp_score
+                center_star = l_star
+            for eps, n_trials in checkpoints.items():
+                if n_trials == trial:
+                    opt_star, opt_score, search_time = results[eps]
+                    search_time += time.perf_counter() - start_time
+                    if center_score < opt_score:
+                        opt_star, opt_score = center_star, center_score
+                    results[eps] = (opt_star, opt_score, search_time)
+    return results
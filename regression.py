@@ -0,0 +1,194 @@
+"""
+Performance regression gate: replays a fixed subset of the experiment grid, checks that the sp scores match
+experiment_results and that the runtimes, normalized by a calibration micro-benchmark, are within a tolerance
+of the stored baseline. the dynamic tables of the python and numba backends are checked to be equal first
+"""
+
+import sys
+import json
+import random
+import timeit
+import argparse
+import numpy as np
+from helpers import set_backend, backend, parse_fasta, align_l_star, align_2l_star, sp_score, dynamic_table_2D, \
+    dynamic_table_3D, dynamic_table_4D, dynamic_table_5D, dynamic_table_5D_2l_star
+from optimized_l_stars import find_optimal_l_star
+from paired_l_stars import find_optimal_star
+from randomized_l_stars import find_optimal_randomized_l_star
+from duplicates import collapse_duplicates
+from experiments import RESULTS, read_results, backend_parity
+
+BASELINE = "experiment_results/regression_baseline.json"
+
+# (algorithm, k, l, round) of the replayed experiments, the randomized algorithm runs with eps 0.1 seeded by round
+CASES = [("optimized_l_stars", 7, 3, 1), ("optimized_l_stars", 7, 4, 1), ("paired_l_stars", 9, 2, 1),
+         ("paired_l_stars", 5, 3, 1), ("randomized_l_stars", 9, 3, 1)]
+
+# (k, round, copies) of the families with duplicates: the first sequences of an experiment, copied the given times
+DUPLICATE_CASES = [(5, 1, (5, 2, 2, 1)), (7, 1, (3, 1, 1, 2, 1)), (9, 2, (1, 4, 1, 1, 2, 3))]
+
+KERNELS = {"dynamic_table_2D": (dynamic_table_2D, 2), "dynamic_table_3D": (dynamic_table_3D, 3),
+           "dynamic_table_4D": (dynamic_table_4D, 4), "dynamic_table_5D": (dynamic_table_5D, 5),
+           "dynamic_table_5D_2l_star": (dynamic_table_5D_2l_star, 5)}
+
+
+def calibration_workload():
+    """a fixed mix of python loops and numpy calls, similar to the kernels, independent of the code under test"""
+    rng = np.random.default_rng(0)
+    a, b = rng.integers(0, 4, 300).tolist(), rng.integers(0, 4, 300).tolist()
+    t = np.zeros((301, 301))
+    for i in range(1, 301):
+        for j in range(1, 301):
+            t[i, j] = min(t[i - 1, j - 1] + (a[i - 1] != b[j - 1]) * 5, t[i - 1, j] + 5, t[i, j - 1] + 5)
+    np.sort(rng.random(200000))
+    return t[-1, -1]
+
+
+def normalized_time(func, repeats=5):
+    """
+    return the time per call of func in units of the calibration workload, and the best time of that unit.
+    func and the workload are timed alternately, each enough times to be measurable, so that both see the same
+    state of the machine, and the median of the ratios is taken
+    """
+    timers = [timeit.Timer(func), timeit.Timer(calibration_workload)]
+    numbers = [timer.autorange()[0] for timer in timers]
+    ratios, units = [], []
+    for _ in range(repeats):
+        t, unit = (timer.timeit(number) / number for timer, number in zip(timers, numbers))
+        ratios.append(t / unit)
+        units.append(unit)
+    return float(np.median(ratios)), min(units)
+
+
+def run_case(algorithm, k, l, r):
+    """run an experiment end to end, return its sp score"""
+    _, seqs = parse_fasta(f"experiment_seqs/round_{r}/random_{k}_10.fa")
+    if algorithm == "optimized_l_stars":
+        opt_star, _ = find_optimal_l_star(seqs, k, l)
+        return sp_score(align_l_star(seqs, opt_star, k, l))
+    if algorithm == "paired_l_stars":
+        alignments = {}
+        opt_star, _ = find_optimal_star(seqs, k, l, alignments=alignments)
+        if len(opt_star[0]) == l:
+            return sp_score(align_l_star(seqs, opt_star, k, l))
+        return sp_score(align_2l_star(seqs, opt_star, k, l, alignments))
+    random.seed(r)
+    opt_star, _ = find_optimal_randomized_l_star(seqs, k, l, 0.1)
+    return sp_score(align_l_star(seqs, opt_star, k, l))
+
+
+def duplicate_scores(k, r, copies):
+    """return the optimal scores of a family with duplicates for l = 2, searched uncollapsed and collapsed"""
+    _, seqs = parse_fasta(f"experiment_seqs/round_{r}/random_{k}_10.fa")
+    seqs = [seq for seq, n in zip(seqs, copies) for _ in range(n)]
+    _, score = find_optimal_l_star(seqs, len(seqs), 2)
+    unique, weights, _ = collapse_duplicates(seqs)
+    _, collapsed_score = find_optimal_l_star(unique, len(unique), 2, weights=weights)
+    return float(score), float(collapsed_score)
+
+
+def expected_scores():
+    """return the sp scores of the deterministic algorithms in experiment_results, by (algorithm, k, l, round)"""
+    scores = {}
+    for algorithm in ("optimized_l_stars", "paired_l_stars"):
+        _, rows = read_results(f"experiment_results/{RESULTS[algorithm][0]}")
+        for row in rows:
+            scores[(algorithm, int(row[0]), int(row[1]), int(row[4]))] = float(row[3])
+    return scores
+
+
+def measure(repeats=5):
+    """return the calibration time and, for every case and kernel, its sp score and normalized runtime"""
+    if backend["name"] == "auto":
+        set_backend("auto")
+    # warm up, e.g. to compile the kernels, before anything is timed
+    for case in CASES:
+        run_case(*case)
+    results = {"backend": backend["name"], "cases": {}, "kernels": {}}
+    units = []
+    for case in CASES:
+        t, unit = normalized_time(lambda: run_case(*case), repeats)
+        results["cases"]["/".join(map(str, case))] = {"score": float(run_case(*case)), "time": t}
+        units.append(unit)
+    _, seqs = parse_fasta("experiment_seqs/round_1/random_5_10.fa")
+    for name, (kernel, d) in KERNELS.items():
+        t, unit = normalized_time(lambda: kernel(*seqs[:d], 4), repeats)
+        results["kernels"][name] = {"time": t}
+        units.append(unit)
+    results["calibration"] = min(units)
+    results["duplicates"] = {"/".join(map(str, (k, r) + copies)): duplicate_scores(k, r, copies)
+                             for k, r, copies in DUPLICATE_CASES}
+    return results
+
+
+def compare(results, baseline, tolerance=0.25):
+    """return report lines and whether the results pass against the baseline and experiment_results"""
+    lines, ok = [], True
+    scores = expected_scores()
+    for name, result in results["cases"].items():
+        algorithm, k, l, r = name.split("/")
+        # the randomized scores are not in experiment_results, they were not seeded
+        expected = scores.get((algorithm, int(k), int(l), int(r)), baseline.get("cases", {}).get(name, {}).get("score"))
+        if expected is not None and result["score"] != expected:
+            ok = False
+            lines.append(f"SCORE {name}: {result['score']:g}, expected {expected:g}")
+    for name, (score, collapsed_score) in results["duplicates"].items():
+        if score != collapsed_score:
+            ok = False
+            lines.append(f"SCORE duplicates {name}: {collapsed_score:g} collapsed, {score:g} uncollapsed")
+    # the cases and kernels that got the slowest first
+    for group in ("cases", "kernels"):
+        ratios = {name: result["time"] / baseline[group][name]["time"]
+                  for name, result in results[group].items() if name in baseline.get(group, {})}
+        for name in sorted(ratios, key=ratios.get, reverse=True):
+            status = "SLOW " if ratios[name] > 1 + tolerance else "ok   "
+            ok = ok and ratios[name] <= 1 + tolerance
+            lines.append(f"{status} {name}: {results[group][name]['time']:.4g} units, {ratios[name]:.2f}x baseline")
+        lines.extend(f"NEW   {name}: {results[group][name]['time']:.4g} units, no baseline"
+                     for name in results[group] if name not in ratios)
+    return lines, ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--update", action="store_true", help="store the measured runtimes as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown, default 0.25")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--backend", choices=("auto", "python", "numba"), default=None)
+    parser.add_argument("--baseline", default=BASELINE)
+    args = parser.parse_args(argv)
+    if args.backend:
+        set_backend(args.backend)
+
+    # the backends are compared before anything is measured, the selected backend is kept
+    mismatches = backend_parity()
+    if mismatches is None:
+        print("skip  backend parity: numba is not installed")
+    elif not mismatches:
+        print("ok    backend parity: the python and numba tables are equal")
+    for name, weight in mismatches or ():
+        print(f"PARITY {name} with weight {weight:g}: the python and numba tables differ")
+    if mismatches:
+        print("FAIL")
+        return 1
+    results = measure(args.repeats)
+    try:
+        with open(args.baseline) as f:
+            baselines = json.load(f)
+    except FileNotFoundError:
+        baselines = {}
+    if args.update:
+        baselines[results["backend"]] = results
+        with open(args.baseline, "w") as f:
+            json.dump(baselines, f, indent=1)
+        print(f"baseline of the {results['backend']} backend written to {args.baseline}")
+        return 0
+    lines, ok = compare(results, baselines.get(results["backend"], {}), args.tolerance)
+    print(f"backend {results['backend']}, calibration {results['calibration']:.4f}s per unit")
+    print("\n".join(lines))
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""
+shared-memory data plane: the parent process publishes numpy arrays once into shared memory segments, and worker
+processes attach them without copying, given a small picklable handle. its only user is the paired-star graph, see
+paired_l_stars.graph_workers: the sequences, as their characters, the l-star and the matrix of edge weights. the
+workers derive the cost matrices from the sequences, and the optimized and randomized finders have no workers.
+the segments are removed when the plane is closed or garbage collected, at exit of the process that published them,
+and by the resource tracker of multiprocessing if that process dies. segments left by processes that died without
+their resource tracker are removed by cleanup_stale
+"""
+
+import os
+import secrets
+import weakref
+import numpy as np
+from multiprocessing import shared_memory
+
+# prefix of the segment names, followed by the pid of the publishing process
+PREFIX = "msa-lstars"
+
+# the segments attached by this process by handle name, see attach
+_attached = {}
+
+
+def _unlink(segments, pid):
+    # forked workers inherit the plane, only the publishing process removes its segments
+    if os.getpid() != pid:
+        return
+    for shm in segments:
+        try:
+            shm.close()
+        except BufferError:
+            # arrays over the segment are still alive, its memory is released with them
+            pass
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+    segments.clear()
+
+
+class DataPlane:
+    """
+    arrays published into shared memory, one segment each. handle() describes them for attach in another process.
+    use it as a context manager, or close it, to remove the segments
+    """
+
+    def __init__(self):
+        self.segments = []
+        self.arrays = {}
+        self.descriptions = {}
+        # removes the segments if the plane is dropped or the process exits without closing it
+        self._finalizer = weakref.finalize(self, _unlink, self.segments, os.getpid())
+
+    def empty(self, name, shape, dtype=np.float64):
+        """publish an uninitialized array called name and return it, writable by this and the attached processes"""
+        if name in self.arrays:
+            raise ValueError(f"an array called {name} is already published")
+        dtype = np.dtype(dtype)
+        size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        shm = shared_memory.SharedMemory(name=f"{PREFIX}-{os.getpid()}-{secrets.token_hex(6)}", create=True,
+                                         size=size)
+        self.segments.append(shm)
+        self.arrays[name] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        self.descriptions[name] = (shm.name, tuple(shape), dtype.str)
+        return self.arrays[name]
+
+    def zeros(self, name, shape, dtype=np.float64):
+        """publish an array of zeros called name and return it"""
+        array = self.empty(name, shape, dtype)
+        array[...] = 0
+        return array
+
+    def publish(self, name, array):
+        """publish a copy of array called name and return it"""
+        array = np.asarray(array)
+        shared = self.empty(name, array.shape, array.dtype)
+        shared[...] = array
+        return shared
+
+    def publish_sequences(self, name, seqs):
+        """publish seqs as the arrays name/bytes, their characters, and name/offsets, see sequences"""
+        self.publish(f"{name}/bytes", np.frombuffer("".join(seqs).encode("latin-1"), dtype=np.uint8))
+        self.publish(f"{name}/offsets", np.cumsum([0] + [len(s) for s in seqs]))
+
+    def handle(self):
+        """return the picklable description of the published arrays for attach"""
+        return dict(self.descriptions)
+
+    def close(self):
+        """remove the segments, the arrays of this plane must no longer be used"""
+        self.arrays.clear()
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach(handle, writable=False):
+    """
+    return the arrays of a data plane by name, given its handle, attaching their segments once per process.
+    the arrays are read-only unless writable
+    """
+    arrays = {}
+    for name, (segment, shape, dtype) in handle.items():
+        if segment not in _attached:
+            _attached[segment] = shared_memory.SharedMemory(name=segment)
+        array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=_attached[segment].buf)
+        array.flags.writeable = writable
+        arrays[name] = array
+    return arrays
+
+
+def detach(handle=None):
+    """close the segments attached by this process, those of handle or all of them"""
+    for segment in list(_attached) if handle is None else [segment for segment, _, _ in handle.values()]:
+        shm = _attached.pop(segment, None)
+        if shm is not None:
+            shm.close()
+
+
+def sequences(arrays, name):
+    """return the sequences published by publish_sequences as strings"""
+    data, offsets = arrays[f"{name}/bytes"].tobytes().decode("latin-1"), arrays[f"{name}/offsets"]
+    return [data[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+
+def cleanup_stale(directory="/dev/shm"):
+    """remove the segments of processes that are no longer running, return their names"""
+    removed = []
+    if not os.path.isdir(directory):
+        return removed
+    for segment in os.listdir(directory):
+        if not segment.startswith(PREFIX + "-"):
+            continue
+        pid = segment[len(PREFIX) + 1:].split("-", 1)[0]
+        if not pid.isdigit() or _running(int(pid)):
+            continue
+        try:
+            os.unlink(os.path.join(directory, segment))
+            removed.append(segment)
+        except OSError:
+            pass
+    return removed
+
+
+def _running(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True